@@ -0,0 +1,67 @@
+"""
+In-flight capacity of one worker for /api/fact-check/text
+
+Drives the ASGI app in-process with many concurrent requests while the
+stand-in Gemini server adds a fixed latency to every call. With the async
+client the wall time stays close to a single call's latency.
+
+Usage (from the backend directory):
+    python -m benchmarks.concurrent_fact_checks --concurrency 200 --latency-ms 1000
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+import httpx
+from config.settings import settings
+from benchmarks.stub_gemini import start_stub_server
+
+async def _run(concurrency: int) -> float:
+    from main import app
+    from services.auth_service import AuthService
+
+    token = AuthService.create_access_token(data={"user_id": 2, "email": "user@factchecker.com", "role": "User"})
+    headers = {"Authorization": f"Bearer {token}"}
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        started = time.perf_counter()
+        responses = await asyncio.gather(*[
+            client.post("/api/fact-check/text", json={"text": f"Benchmark claim {i}"}, headers=headers)
+            for i in range(concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+
+    failed = [r for r in responses if r.status_code != 200]
+    if failed:
+        raise SystemExit(f"{len(failed)} requests failed, first: {failed[0].text}")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent fact-check capacity of one worker")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=1000)
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(latency_ms=args.latency_ms)
+    settings.GEMINI_API_KEY = settings.GEMINI_API_KEY or "stub-key"
+    settings.GEMINI_BASE_URL = base_url
+    settings.GEMINI_MAX_CONNECTIONS = max(settings.GEMINI_MAX_CONNECTIONS, args.concurrency)
+
+    # Keep benchmark records out of the real tables
+    scratch = Path(tempfile.mkdtemp(prefix="fact_checker_bench_"))
+    for name in ("USERS_CSV", "FACT_CHECKS_CSV", "ADMIN_COMMENTS_CSV"):
+        source = getattr(settings, name)
+        target = scratch / source.name
+        target.write_bytes(source.read_bytes())
+        setattr(settings, name, target)
+
+    elapsed = asyncio.run(_run(args.concurrency))
+    print(f"{args.concurrency} concurrent fact checks, upstream latency {args.latency_ms:.0f} ms")
+    print(f"  wall time: {elapsed * 1000:.0f} ms ({args.concurrency / elapsed:.1f} fact checks/s)")
+    print(f"  serial equivalent: {args.concurrency * args.latency_ms:.0f} ms")
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Fact-check instructions sent inline versus referenced as cached content
+
+Points the real client at the stand-in server, which charges a processing
+time per prompt token not served from a cached content, and runs the same
+text fact checks three ways: instructions sent inline as the system
+instruction, GEMINI_CONTEXT_CACHE_ENABLED against a server offering
+caching, and GEMINI_CONTEXT_CACHE_ENABLED against one that does not (the
+fallback path). Reports latency and prompt tokens per call and what caching
+saves per call.
+
+Usage (from the backend directory):
+    python -m benchmarks.context_cache --requests 20 --latency-ms 300 --prompt-token-ms 0.1
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict
+from config.settings import settings
+from benchmarks.stub_gemini import start_stub_server
+from services.context_cache import context_cache
+from services.gemini_service import GeminiService, _create_client
+
+MODES = {
+    # mode: (GEMINI_CONTEXT_CACHE_ENABLED, server offers caching)
+    "inline": (False, False),
+    "cached": (True, True),
+    "fallback": (True, False)
+}
+
+async def _run_mode(count: int, caching_enabled: bool, server_caching: bool, latency_ms: float, prompt_token_ms: float) -> Dict:
+    server, base_url = start_stub_server(
+        latency_ms=latency_ms, prompt_token_ms=prompt_token_ms, context_caching=server_caching
+    )
+    settings.GEMINI_BASE_URL = base_url
+    settings.GEMINI_CONTEXT_CACHE_ENABLED = caching_enabled
+    context_cache.clear()
+    service = GeminiService(client=_create_client())
+
+    # The first call pays for connection setup and, when caching, the cache creation
+    await service.fact_check_text_async("warm-up")
+
+    latencies = []
+    prompt_tokens = []
+    cached_tokens = []
+    for i in range(count):
+        started = time.perf_counter()
+        result = await service.fact_check_text_async(f"Context cache benchmark claim {i}")
+        latencies.append(time.perf_counter() - started)
+        prompt_tokens.append(result["usage"]["prompt_tokens"])
+        cached_tokens.append(result["usage"]["cached_tokens"])
+
+    server.shutdown()
+    return {
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "prompt_tokens": statistics.mean(prompt_tokens),
+        "cached_tokens": statistics.mean(cached_tokens),
+        "uncached_tokens": statistics.mean(p - c for p, c in zip(prompt_tokens, cached_tokens)),
+        "cache": context_cache.stats()
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare inline and cached fact-check instructions")
+    parser.add_argument("--requests", type=int, default=20, help="Fact checks per mode")
+    parser.add_argument("--latency-ms", type=float, default=300, help="Fixed latency per request")
+    parser.add_argument("--prompt-token-ms", type=float, default=0.1, help="Processing time per uncached prompt token")
+    args = parser.parse_args()
+
+    settings.GEMINI_API_KEY = settings.GEMINI_API_KEY or "stub-key"
+    results = {
+        mode: asyncio.run(_run_mode(args.requests, enabled, offered, args.latency_ms, args.prompt_token_ms))
+        for mode, (enabled, offered) in MODES.items()
+    }
+
+    print(f"{args.requests} text fact checks per mode, {args.latency_ms:.0f} ms + {args.prompt_token_ms} ms per uncached prompt token\n")
+    print(f"{'mode':<9} {'mean ms':>9} {'p50 ms':>9} {'prompt tok':>11} {'cached tok':>11} {'uncached tok':>13}  cache")
+    for mode, result in results.items():
+        print(
+            f"{mode:<9} {result['mean_ms']:>9.0f} {result['p50_ms']:>9.0f} {result['prompt_tokens']:>11.0f}"
+            f" {result['cached_tokens']:>11.0f} {result['uncached_tokens']:>13.0f}  {result['cache']}"
+        )
+
+    inline, cached = results["inline"], results["cached"]
+    print(
+        f"\nSaved per call by caching: {inline['uncached_tokens'] - cached['uncached_tokens']:.0f} input tokens,"
+        f" {inline['mean_ms'] - cached['mean_ms']:.1f} ms mean latency"
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Per-request latency of a fresh Gemini client versus the shared pooled client
+
+Usage (from the backend directory):
+    python -m benchmarks.gemini_client_pool --requests 200
+"""
+import argparse
+import statistics
+import time
+from config.settings import settings
+from benchmarks.stub_gemini import start_stub_server
+
+def _timed_calls(make_service, count: int) -> list:
+    """Run `count` fact checks and return per-call latencies in ms"""
+    latencies = []
+    for i in range(count):
+        started = time.perf_counter()
+        make_service().fact_check_text(f"Benchmark claim {i}")
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+def _summary(latencies: list) -> str:
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    return f"mean {statistics.mean(latencies):7.2f} ms  p50 {statistics.median(latencies):7.2f} ms  p95 {p95:7.2f} ms"
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark shared vs per-request Gemini clients")
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server()
+    settings.GEMINI_API_KEY = settings.GEMINI_API_KEY or "stub-key"
+    settings.GEMINI_BASE_URL = base_url
+
+    from services import gemini_service
+    from services.gemini_service import GeminiService
+
+    # Old behaviour: a new genai.Client (and connection pool) for every request
+    fresh = _timed_calls(lambda: GeminiService(client=gemini_service._create_client()), args.requests)
+    # New behaviour: every request reuses the process-wide client
+    shared = _timed_calls(GeminiService, args.requests)
+
+    print(f"Stand-in server: {base_url}, {args.requests} requests each")
+    print(f"  fresh client : {_summary(fresh)}")
+    print(f"  shared client: {_summary(shared)}")
+    print(f"  saved per request: {statistics.mean(fresh) - statistics.mean(shared):.2f} ms "
+          f"(plain HTTP; a real TLS handshake adds more)")
+
+    gemini_service.close_shared_client()
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Tail latency of grounded text fact-checks with and without request hedging
+
+Points the real client at the stand-in server, where a fraction of
+responses are stragglers, and runs the same concurrent text fact checks
+with GEMINI_HEDGING_ENABLED off and on. Reports latency percentiles, the
+upstream requests made (hedges are billed calls) and the hedger's counters.
+
+Usage (from the backend directory):
+    python -m benchmarks.hedging --requests 400 --concurrency 8 --latency lognormal:400:120 \\
+        --slow-rate 0.03 --slow-ms 3000 --seed 7
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict
+from config.settings import settings
+from benchmarks.stub_gemini import start_stub_server
+from services.gemini_service import GeminiService, _create_client
+from services.hedging import gemini_hedger
+
+def _percentile(ordered, percentile: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+async def _run(service: GeminiService, count: int, concurrency: int) -> Dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(index: int):
+        async with semaphore:
+            started = time.perf_counter()
+            await service.fact_check_text_async(f"Hedging benchmark claim {index}")
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*[one(index) for index in range(count)])
+    latencies.sort()
+    return {
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p95_ms": _percentile(latencies, 95) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "max_ms": latencies[-1] * 1000
+    }
+
+def _run_mode(args, hedging: bool) -> Dict:
+    server, base_url = start_stub_server(
+        latency=args.latency, slow_rate=args.slow_rate, slow_ms=args.slow_ms, seed=args.seed
+    )
+    settings.GEMINI_BASE_URL = base_url
+    settings.GEMINI_HEDGING_ENABLED = hedging
+    service = GeminiService(client=_create_client())
+
+    result = asyncio.run(_run(service, args.requests, args.concurrency))
+    # Cancelled attempts are still answered (into a closed connection) and counted by the server
+    result["upstream_requests"] = server.RequestHandlerClass.usage["requests"]
+    server.shutdown()
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare tail latency with and without hedged Gemini calls")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", default="lognormal:400:120", help="kind:mean_ms[:spread_ms]")
+    parser.add_argument("--slow-rate", type=float, default=0.03, help="Fraction of straggling responses")
+    parser.add_argument("--slow-ms", type=float, default=3000, help="Extra delay of a straggler")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    settings.GEMINI_API_KEY = settings.GEMINI_API_KEY or "stub-key"
+    results = {"off": _run_mode(args, hedging=False), "on": _run_mode(args, hedging=True)}
+
+    print(f"{args.requests} text fact checks, concurrency {args.concurrency}, latency {args.latency},"
+          f" {args.slow_rate:.0%} stragglers +{args.slow_ms:.0f} ms")
+    print(f"hedging after p{settings.GEMINI_HEDGE_PERCENTILE:g}, at most {settings.GEMINI_HEDGE_MAX_RATIO:.0%} of calls\n")
+    print(f"{'hedging':<8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'upstream':>9}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<8} {result['p50_ms']:>8.0f} {result['p95_ms']:>8.0f} {result['p99_ms']:>8.0f}"
+            f" {result['max_ms']:>8.0f} {result['upstream_requests']:>9}"
+        )
+    print(f"\nhedger: {gemini_hedger.stats()}")
+
+if __name__ == "__main__":
+    main()
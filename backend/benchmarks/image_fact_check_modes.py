@@ -0,0 +1,82 @@
+"""
+Single-call vs two-step image fact-checks
+
+Points the real async client at the stand-in server and fact-checks the
+same image in both modes: one grounded multimodal request, and the
+describe-then-check fallback. Reports latency per fact check and the
+upstream requests and tokens the stand-in server accounted for.
+
+Usage (from the backend directory):
+    python -m benchmarks.image_fact_check_modes --requests 20 --latency-ms 800
+"""
+import argparse
+import asyncio
+import io
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+from PIL import Image
+from config.settings import settings
+from benchmarks.stub_gemini import start_stub_server
+from services.gemini_service import GeminiService, _create_client
+
+def _write_test_image(directory: Path) -> Path:
+    """Write a small JPEG to fact-check"""
+    buffer = io.BytesIO()
+    Image.new("RGB", (640, 480), (180, 90, 40)).save(buffer, format="JPEG")
+    path = directory / "bench.jpg"
+    path.write_bytes(buffer.getvalue())
+    return path
+
+async def _run_mode(service: GeminiService, server, image_path: Path, count: int, single_call: bool) -> Dict:
+    settings.GEMINI_IMAGE_SINGLE_CALL = single_call
+    usage = server.RequestHandlerClass.usage
+    before = dict(usage)
+
+    latencies = []
+    for _ in range(count):
+        started = time.perf_counter()
+        await service.fact_check_image_async(str(image_path))
+        latencies.append(time.perf_counter() - started)
+
+    return {
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "p50_ms": statistics.median(latencies) * 1000,
+        **{key: (usage[key] - before[key]) / count for key in usage}
+    }
+
+async def _compare(service: GeminiService, server, image_path: Path, count: int) -> Dict[str, Dict]:
+    # Warm the connection pool so neither mode pays for connection setup
+    await service.fact_check_image_async(str(image_path))
+    return {
+        "two-step": await _run_mode(service, server, image_path, count, single_call=False),
+        "single-call": await _run_mode(service, server, image_path, count, single_call=True)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare single-call and two-step image fact-checks")
+    parser.add_argument("--requests", type=int, default=20, help="Fact checks per mode")
+    parser.add_argument("--latency-ms", type=float, default=800, help="Upstream latency per request")
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(latency_ms=args.latency_ms)
+    settings.GEMINI_API_KEY = settings.GEMINI_API_KEY or "stub-key"
+    settings.GEMINI_BASE_URL = base_url
+    service = GeminiService(client=_create_client())
+    image_path = _write_test_image(Path(tempfile.mkdtemp(prefix="fact_checker_bench_")))
+
+    results = asyncio.run(_compare(service, server, image_path, args.requests))
+
+    print(f"{args.requests} image fact checks per mode, upstream latency {args.latency_ms:.0f} ms\n")
+    print(f"{'mode':<12} {'mean ms':>9} {'p50 ms':>9} {'requests':>9} {'prompt tok':>11} {'output tok':>11}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<12} {result['mean_ms']:>9.0f} {result['p50_ms']:>9.0f} {result['requests']:>9.1f}"
+            f" {result['prompt_tokens']:>11.0f} {result['candidates_tokens']:>11.0f}"
+        )
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Wall time of long-audio transcription: serial chunks, parallel chunks, streaming
+
+Points the real Speech-to-Text client at the stand-in server and
+transcribes the same generated WAV in sub-minute chunks, with
+SPEECH_CHUNK_CONCURRENCY 1 and then the configured value, and finally
+over streaming recognition (SPEECH_STREAMING_ENABLED, reconnecting every
+SPEECH_STREAM_MAX_SECONDS of audio). Reports the wall time, the peak
+Python memory traced while transcribing (audio is read from the file as
+it is sent, so it should not grow with the audio length), the upstream
+requests and the retries made by the resilience layer. Checks that both
+chunked transcripts match and counts the partial transcripts delivered
+while streaming.
+
+Usage (from the backend directory):
+    python -m benchmarks.long_audio --audio-minutes 20 --latency normal:300:80 \\
+        --realtime-factor 0.1 --concurrency 8 --error-rate 0.05 --seed 7
+"""
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+import wave
+from pathlib import Path
+from typing import Dict
+from config.settings import settings
+from benchmarks.stub_speech import start_stub_speech_server
+from services.resilience import speech_resilience
+from services.speech_to_text import SpeechToTextService
+
+def _write_wav(path: Path, seconds: float, seed: int):
+    """16 kHz mono noise"""
+    frames = random.Random(seed).randbytes(int(seconds * 16000) * 2)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(frames)
+
+def _run_mode(args, path: Path, concurrency: int, streaming: bool = False) -> Dict:
+    speech, endpoint = start_stub_speech_server(
+        latency=args.latency,
+        realtime_factor=args.realtime_factor,
+        server_error_rate=args.error_rate,
+        seed=args.seed
+    )
+    settings.SPEECH_API_ENDPOINT = endpoint
+    settings.SPEECH_CHUNK_CONCURRENCY = concurrency
+    settings.SPEECH_STREAMING_ENABLED = streaming
+    partials = []
+    service = SpeechToTextService()
+    retries_before = speech_resilience.stats()["retries"]
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    transcript = service.transcribe_audio(str(path), on_partial=partials.append if streaming else None)
+    wall = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    speech.stop(0)
+    return {
+        "wall": wall,
+        "peak_mb": peak / 2 ** 20,
+        "transcript": transcript,
+        "partials": len(partials),
+        "requests": (
+            speech.servicer.usage["requests"] + speech.servicer.usage["streams"] + speech.servicer.usage["unavailable"]
+        ),
+        "retries": speech_resilience.stats()["retries"] - retries_before
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare serial and parallel chunk transcription of long audio")
+    parser.add_argument("--audio-minutes", type=float, default=20)
+    parser.add_argument("--latency", default="normal:300:80", help="kind:mean_ms[:spread_ms]")
+    parser.add_argument("--realtime-factor", type=float, default=0.1, help="Processing seconds per audio second")
+    parser.add_argument("--concurrency", type=int, default=settings.SPEECH_CHUNK_CONCURRENCY)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of UNAVAILABLE responses")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = Path(workdir) / "long.wav"
+        _write_wav(path, args.audio_minutes * 60, args.seed)
+        path_mb = path.stat().st_size / 2 ** 20
+        results = {
+            "serial": _run_mode(args, path, 1),
+            f"parallel x{args.concurrency}": _run_mode(args, path, args.concurrency),
+            "streaming": _run_mode(args, path, 1, streaming=True)
+        }
+
+    chunks = -(-int(args.audio_minutes * 60 * 1000) // 50000)
+    single_chunk = args.realtime_factor * 50 + float(args.latency.split(":")[1]) / 1000
+    print(f"{args.audio_minutes:g} min of audio in {chunks} chunks, latency {args.latency}"
+          f" + {args.realtime_factor:.2f} s per audio second (~{single_chunk:.1f} s per chunk),"
+          f" {args.error_rate:.0%} UNAVAILABLE")
+    print(f"audio file {path_mb:.1f} MB\n")
+    print(f"{'mode':<14} {'wall s':>8} {'peak MB':>8} {'requests':>9} {'retries':>8}")
+    for mode, result in results.items():
+        print(f"{mode:<14} {result['wall']:>8.2f} {result['peak_mb']:>8.1f} {result['requests']:>9} {result['retries']:>8}")
+
+    serial, parallel, streaming = results.values()
+    print(f"\nparallel speed-up x{serial['wall'] / parallel['wall']:.1f}, transcripts identical: {serial['transcript'] == parallel['transcript']}")
+    print(f"streaming: {streaming['partials']} partial transcripts, {len(streaming['transcript'].split())} words"
+          f" (chunked: {len(serial['transcript'].split())})")
+
+if __name__ == "__main__":
+    main()
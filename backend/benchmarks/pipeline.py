@@ -0,0 +1,139 @@
+"""
+End-to-end audio fact-check pipeline against the stand-in servers, offline
+
+Uploads generated WAV files through /api/fact-check/process (conversion,
+Speech-to-Text, transcript condensation, Gemini) with both upstreams
+replaced by the local stand-ins, and reports latency percentiles, failures
+and the upstream traffic. With --seed the injected latencies and failures
+repeat between runs. ffmpeg must be on PATH for the conversion step.
+
+Usage (from the backend directory):
+    python -m benchmarks.pipeline --requests 50 --audio-seconds 45 \\
+        --gemini-latency lognormal:900:400 --speech-latency normal:300:80 --seed 7
+"""
+import argparse
+import asyncio
+import random
+import shutil
+import tempfile
+import time
+import wave
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List
+import httpx
+from config.settings import settings
+from benchmarks.stub_gemini import start_stub_server
+from benchmarks.stub_speech import start_stub_speech_server
+
+def _write_wav(path: Path, seconds: float, seed: int):
+    """16 kHz mono noise; a different seed gives different audio, so nothing is served from cache"""
+    frames = random.Random(seed).randbytes(int(seconds * 16000) * 2)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(frames)
+
+async def _run(files: List[Path], concurrency: int) -> Dict:
+    from main import app
+    from services.auth_service import AuthService
+
+    token = AuthService.create_access_token(data={"user_id": 2, "email": "user@factchecker.com", "role": "User"})
+    headers = {"Authorization": f"Bearer {token}"}
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    statuses = Counter()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=None) as client:
+        async def one(path: Path):
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post(
+                    "/api/fact-check/process",
+                    json={"file_path": str(path), "upload_type": "audio"},
+                    headers=headers
+                )
+                statuses[response.status_code] += 1
+                if response.status_code == 200:
+                    latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*[one(path) for path in files])
+        wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "wall": wall,
+        "statuses": dict(statuses),
+        "p50": latencies[len(latencies) // 2] if latencies else 0.0,
+        "p95": latencies[max(0, int(len(latencies) * 0.95) - 1)] if latencies else 0.0,
+        "max": latencies[-1] if latencies else 0.0
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline end-to-end audio fact-check benchmark")
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--audio-seconds", type=float, default=45)
+    parser.add_argument("--gemini-latency", default="lognormal:900:400")
+    parser.add_argument("--gemini-error-rate", type=float, default=0.0, help="Fraction of 503 responses")
+    parser.add_argument("--gemini-throttle-rate", type=float, default=0.0, help="Fraction of 429 responses")
+    parser.add_argument("--speech-latency", default="normal:300:80")
+    parser.add_argument("--speech-realtime-factor", type=float, default=0.1)
+    parser.add_argument("--speech-error-rate", type=float, default=0.0, help="Fraction of UNAVAILABLE responses")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if not shutil.which("ffmpeg"):
+        raise SystemExit("ffmpeg is required on PATH for the audio conversion step")
+
+    gemini, base_url = start_stub_server(
+        latency=args.gemini_latency,
+        error_rate=args.gemini_throttle_rate,
+        server_error_rate=args.gemini_error_rate,
+        seed=args.seed
+    )
+    speech, endpoint = start_stub_speech_server(
+        latency=args.speech_latency,
+        realtime_factor=args.speech_realtime_factor,
+        server_error_rate=args.speech_error_rate,
+        seed=args.seed
+    )
+    settings.GEMINI_API_KEY = settings.GEMINI_API_KEY or "stub-key"
+    settings.GEMINI_BASE_URL = base_url
+    settings.SPEECH_API_ENDPOINT = endpoint
+
+    # Keep benchmark records out of the real tables
+    scratch = Path(tempfile.mkdtemp(prefix="fact_checker_bench_"))
+    for name in ("USERS_CSV", "FACT_CHECKS_CSV", "ADMIN_COMMENTS_CSV", "USAGE_CSV"):
+        source = getattr(settings, name)
+        target = scratch / source.name
+        if source.exists():
+            target.write_bytes(source.read_bytes())
+        setattr(settings, name, target)
+    settings.CACHE_FOLDER = scratch / "cache"
+
+    files = []
+    for index in range(args.requests):
+        path = scratch / f"bench_{index}.wav"
+        _write_wav(path, args.audio_seconds, args.seed * 100003 + index)
+        files.append(path)
+
+    result = asyncio.run(_run(files, args.concurrency))
+
+    print(f"{args.requests} audio fact checks of {args.audio_seconds:.0f} s, concurrency {args.concurrency}")
+    print(f"  gemini latency {gemini.RequestHandlerClass.latency.describe()}, speech latency {speech.servicer.latency.describe()}"
+          f" + {args.speech_realtime_factor:.2f} s per audio second\n")
+    print(f"  wall: {result['wall']:.2f} s  ({args.requests / result['wall']:.2f} fact checks/s)")
+    print(f"  latency p50: {result['p50'] * 1000:.0f} ms  p95: {result['p95'] * 1000:.0f} ms  max: {result['max'] * 1000:.0f} ms")
+    print(f"  responses: {result['statuses']}")
+    print(f"  gemini upstream: {gemini.RequestHandlerClass.usage}")
+    print(f"  speech upstream: {speech.servicer.usage}")
+
+    gemini.shutdown()
+    speech.stop(0)
+    shutil.rmtree(scratch, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
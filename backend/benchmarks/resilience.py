@@ -0,0 +1,102 @@
+"""
+Gemini calls under throttling, with and without the resilience layer
+
+Points the real async client at the stand-in server, which answers a
+fraction of requests with 429 RESOURCE_EXHAUSTED after a fixed latency.
+Runs a burst of concurrent fact checks with a single attempt per call and
+again through the shared limiter/retry/breaker, then simulates an outage
+to show the circuit opening and failing fast.
+
+Usage (from the backend directory):
+    python -m benchmarks.resilience --requests 200 --error-rate 0.3 --latency-ms 100
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+from config.settings import settings
+from benchmarks.stub_gemini import start_stub_server
+import services.gemini_service as gemini_module
+from services.gemini_service import GeminiService, _create_client
+from services.resilience import ResilientCaller, UpstreamUnavailableError
+
+def _make_caller(max_attempts: int, requests_per_minute: float, burst: int) -> ResilientCaller:
+    return ResilientCaller(
+        name="Gemini",
+        requests_per_minute=requests_per_minute,
+        burst=burst,
+        max_attempts=max_attempts,
+        base_delay=0.05,
+        max_delay=1.0,
+        failure_threshold=10,
+        reset_timeout=5.0,
+        max_rate_limit_wait=30.0
+    )
+
+async def _burst(service: GeminiService, count: int) -> Dict:
+    latencies: List[float] = []
+    errors = {"throttled": 0, "unavailable": 0}
+
+    async def one(i: int):
+        started = time.perf_counter()
+        try:
+            await service.fact_check_text_async(f"Resilience claim {i}")
+            latencies.append(time.perf_counter() - started)
+        except UpstreamUnavailableError:
+            errors["unavailable"] += 1
+        except Exception:
+            errors["throttled"] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[one(i) for i in range(count)])
+    latencies.sort()
+
+    return {
+        "ok": len(latencies),
+        "errors": errors,
+        "wall": time.perf_counter() - started,
+        "p50": latencies[len(latencies) // 2] if latencies else 0.0,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] if latencies else 0.0
+    }
+
+def _print(label: str, result: Dict, caller: ResilientCaller):
+    failed = result["errors"]["throttled"] + result["errors"]["unavailable"]
+    print(f"{label}")
+    print(f"  ok: {result['ok']}  failed: {failed}  wall: {result['wall'] * 1000:.0f} ms")
+    print(f"  latency p50: {result['p50'] * 1000:.0f} ms  p95: {result['p95'] * 1000:.0f} ms")
+    print(f"  metrics: {caller.stats()}")
+
+async def _scenarios(service: GeminiService, server, args):
+    # One event loop for every scenario: the async client's pool is bound to it
+    gemini_module.gemini_resilience = _make_caller(1, args.rpm, args.burst)
+    _print("single attempt", await _burst(service, args.requests), gemini_module.gemini_resilience)
+
+    gemini_module.gemini_resilience = _make_caller(settings.UPSTREAM_MAX_ATTEMPTS, args.rpm, args.burst)
+    _print("resilience layer", await _burst(service, args.requests), gemini_module.gemini_resilience)
+
+    # Full outage: the breaker opens and the rest of the burst fails fast
+    server.RequestHandlerClass.faults.throttle_rate = 1.0
+    gemini_module.gemini_resilience = _make_caller(settings.UPSTREAM_MAX_ATTEMPTS, args.rpm, args.burst)
+    _print("outage (100% 429s)", await _burst(service, args.requests), gemini_module.gemini_resilience)
+
+def main():
+    parser = argparse.ArgumentParser(description="Gemini calls under injected 429s and latency")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--error-rate", type=float, default=0.3)
+    parser.add_argument("--latency-ms", type=float, default=100)
+    parser.add_argument("--rpm", type=float, default=6000, help="Limiter quota in requests per minute")
+    parser.add_argument("--burst", type=int, default=50)
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(latency_ms=args.latency_ms, error_rate=args.error_rate)
+    settings.GEMINI_API_KEY = settings.GEMINI_API_KEY or "stub-key"
+    settings.GEMINI_BASE_URL = base_url
+    settings.GEMINI_MAX_CONNECTIONS = max(settings.GEMINI_MAX_CONNECTIONS, args.requests)
+    service = GeminiService(client=_create_client())
+
+    print(f"{args.requests} concurrent fact checks, {args.error_rate:.0%} 429s, upstream latency {args.latency_ms:.0f} ms\n")
+    asyncio.run(_scenarios(service, server, args))
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
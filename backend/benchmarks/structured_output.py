@@ -0,0 +1,89 @@
+"""
+Prose versus schema-constrained JSON fact-check responses
+
+Points the real client at the stand-in server, which adds a per-output-token
+generation time, and compares latency, output tokens and local parsing time
+of the prose format (regex formatting and verdict extraction) with
+GEMINI_STRUCTURED_OUTPUT (one json.loads plus the derived text view).
+
+Usage (from the backend directory):
+    python -m benchmarks.structured_output --requests 20 --latency-ms 300 --output-token-ms 6
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict
+from config.settings import settings
+from benchmarks.stub_gemini import STUB_VERDICTS, format_prose, start_stub_server
+from services.gemini_service import GeminiService, _create_client
+
+def _parse_cost_us(service: GeminiService, structured: bool, rounds: int = 2000) -> float:
+    """Mean local post-processing time of one response, in microseconds"""
+    verdict = STUB_VERDICTS[1]
+    if structured:
+        raw = json.dumps({key: verdict[key] for key in ("verdict", "conclusion", "confidence")} | {"points": verdict["brief_points"]})
+    else:
+        raw = format_prose(verdict)
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        if structured:
+            text = service.format_structured_response(json.loads(raw))
+        else:
+            text = service._format_response(raw)
+        service.extract_verdict(text)
+    return (time.perf_counter() - started) / rounds * 1e6
+
+async def _run_mode(service: GeminiService, count: int, structured: bool) -> Dict:
+    settings.GEMINI_STRUCTURED_OUTPUT = structured
+    latencies = []
+    output_tokens = []
+
+    for i in range(count):
+        started = time.perf_counter()
+        result = await service.fact_check_text_async(f"Structured output benchmark claim {i}")
+        latencies.append(time.perf_counter() - started)
+        output_tokens.append(result["usage"]["response_tokens"])
+
+    return {
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "output_tokens": statistics.mean(output_tokens),
+        "parse_us": _parse_cost_us(service, structured)
+    }
+
+async def _compare(service: GeminiService, count: int) -> Dict[str, Dict]:
+    # Warm the connection pool so neither mode pays for connection setup
+    await service.fact_check_text_async("warm-up")
+    return {
+        "prose": await _run_mode(service, count, structured=False),
+        "json": await _run_mode(service, count, structured=True)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare prose and structured JSON fact-check responses")
+    parser.add_argument("--requests", type=int, default=20, help="Fact checks per mode")
+    parser.add_argument("--latency-ms", type=float, default=300, help="Time to first token")
+    parser.add_argument("--output-token-ms", type=float, default=6, help="Generation time per output token")
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(latency_ms=args.latency_ms, output_token_ms=args.output_token_ms)
+    settings.GEMINI_API_KEY = settings.GEMINI_API_KEY or "stub-key"
+    settings.GEMINI_BASE_URL = base_url
+    service = GeminiService(client=_create_client())
+
+    results = asyncio.run(_compare(service, args.requests))
+
+    print(f"{args.requests} text fact checks per mode, {args.latency_ms:.0f} ms to first token + {args.output_token_ms:.0f} ms per output token\n")
+    print(f"{'mode':<7} {'mean ms':>9} {'p50 ms':>9} {'output tok':>11} {'parse us':>9}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<7} {result['mean_ms']:>9.0f} {result['p50_ms']:>9.0f}"
+            f" {result['output_tokens']:>11.0f} {result['parse_us']:>9.1f}"
+        )
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Latency and failure models shared by the stand-in Gemini and Speech servers
+
+Latency specs are `kind:mean_ms[:spread_ms]`:
+    fixed:200              every response after 200 ms
+    uniform:200:50         200 +/- 50 ms
+    normal:200:50          mean 200 ms, standard deviation 50 ms (never negative)
+    lognormal:200:100      median 200 ms with a long tail (sigma = spread / median)
+
+Any of them can add stragglers: a fraction of responses delayed by a fixed
+extra time, like requests landing on an overloaded replica.
+
+Passing a seed makes the sampled latencies and injected failures repeatable.
+"""
+import math
+import random
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+
+class LatencyModel:
+    """Samples a response delay from a configured distribution"""
+
+    def __init__(
+        self,
+        distribution: str = "fixed",
+        mean_ms: float = 0.0,
+        spread_ms: float = 0.0,
+        seed: Optional[int] = None,
+        slow_rate: float = 0.0,
+        slow_ms: float = 0.0
+    ):
+        """
+        Initialize the model
+
+        Args:
+            distribution: fixed, uniform, normal or lognormal
+            mean_ms: Mean delay (median for lognormal)
+            spread_ms: Half-width (uniform), standard deviation (normal) or tail width (lognormal)
+            seed: Random seed for repeatable runs
+            slow_rate: Fraction of responses delayed by slow_ms on top
+            slow_ms: Extra delay of a straggler
+        """
+        if distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{distribution}', expected one of {', '.join(LATENCY_DISTRIBUTIONS)}")
+        self.distribution = distribution
+        self.mean_ms = mean_ms
+        self.spread_ms = spread_ms
+        self.slow_rate = slow_rate
+        self.slow_ms = slow_ms
+        self._random = random.Random(seed)
+
+    @classmethod
+    def from_spec(cls, spec: str, seed: Optional[int] = None, slow_rate: float = 0.0, slow_ms: float = 0.0) -> "LatencyModel":
+        """Build a model from a `kind:mean_ms[:spread_ms]` string"""
+        kind, _, rest = spec.partition(":")
+        mean_ms, _, spread_ms = rest.partition(":")
+        return cls(kind, float(mean_ms or 0), float(spread_ms or 0), seed, slow_rate, slow_ms)
+
+    def sample(self) -> float:
+        """Delay in seconds"""
+        if self.distribution == "uniform":
+            delay_ms = self._random.uniform(self.mean_ms - self.spread_ms, self.mean_ms + self.spread_ms)
+        elif self.distribution == "normal":
+            delay_ms = self._random.gauss(self.mean_ms, self.spread_ms)
+        elif self.distribution == "lognormal" and self.mean_ms > 0:
+            delay_ms = self._random.lognormvariate(math.log(self.mean_ms), self.spread_ms / self.mean_ms)
+        else:
+            delay_ms = self.mean_ms
+        if self.slow_rate and self._random.random() < self.slow_rate:
+            delay_ms += self.slow_ms
+        return max(0.0, delay_ms) / 1000
+
+    def describe(self) -> str:
+        """Human-readable spec"""
+        if self.distribution == "fixed":
+            text = f"fixed {self.mean_ms:.0f} ms"
+        else:
+            text = f"{self.distribution} {self.mean_ms:.0f} ms (spread {self.spread_ms:.0f} ms)"
+        if self.slow_rate:
+            text += f", {self.slow_rate:.0%} +{self.slow_ms:.0f} ms"
+        return text
+
+class FaultInjector:
+    """
+    Decides whether a request fails, the way an overloaded upstream would:
+    a per-minute quota, random throttling and random server errors.
+    """
+
+    THROTTLED = "throttled"
+    UNAVAILABLE = "unavailable"
+
+    def __init__(
+        self,
+        throttle_rate: float = 0.0,
+        server_error_rate: float = 0.0,
+        requests_per_minute: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize the injector
+
+        Args:
+            throttle_rate: Fraction of requests rejected as throttled
+            server_error_rate: Fraction of requests failed as unavailable
+            requests_per_minute: Quota over a sliding minute (0 = unlimited); excess requests are throttled
+            seed: Random seed for repeatable runs
+        """
+        self.throttle_rate = throttle_rate
+        self.server_error_rate = server_error_rate
+        self.requests_per_minute = requests_per_minute
+        self._random = random.Random(seed)
+        self._accepted = deque()
+        self._lock = threading.Lock()
+
+    def sample(self) -> Optional[str]:
+        """
+        Decide the fate of one request
+
+        Returns:
+            THROTTLED, UNAVAILABLE, or None to serve it
+        """
+        with self._lock:
+            if self.requests_per_minute:
+                now = time.monotonic()
+                while self._accepted and now - self._accepted[0] >= 60:
+                    self._accepted.popleft()
+                if len(self._accepted) >= self.requests_per_minute:
+                    return self.THROTTLED
+                self._accepted.append(now)
+
+            roll = self._random.random()
+            if roll < self.throttle_rate:
+                return self.THROTTLED
+            if roll < self.throttle_rate + self.server_error_rate:
+                return self.UNAVAILABLE
+            return None
@@ -0,0 +1,606 @@
+"""
+Local stand-in for the Gemini REST API
+
+Serves `models/{model}:generateContent` and `:streamGenerateContent` so the
+real `genai.Client` can be pointed at it through `GEMINI_BASE_URL`.
+Grounded requests get one of a few canned fact-check answers (chosen
+deterministically from the prompt), as prose or, when the request asks for
+`application/json`, as JSON; both honour maxOutputTokens. They carry
+grounding metadata shaped like
+Google Search grounding: web search queries, redirect-style source chunks,
+per-sentence supports with confidence scores, a search entry point and
+tool-use prompt tokens. Ungrounded requests are answered as image
+descriptions or summaries.
+
+With context caching enabled it also serves `cachedContents` (create,
+TTL update, delete): requests naming a cached content get its system
+instruction and tools, and report the cached tokens in
+`cachedContentTokenCount`. Without it, the endpoint answers 404 like a
+deployment that does not offer caching.
+
+Latency follows a configurable distribution, optionally with stragglers
+(see benchmarks.stub_faults), plus optional per-uncached-prompt-token and
+per-output-token times, and requests can be throttled (429
+RESOURCE_EXHAUSTED, randomly or over a per-minute quota) or failed (503
+UNAVAILABLE). Token usage is estimated
+from each request and totalled per server, so call shapes can be compared.
+"""
+import hashlib
+import json
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Tuple
+from benchmarks.stub_faults import FaultInjector, LatencyModel
+
+# Canned verdicts; prose answers use the detailed points, JSON answers the brief ones
+STUB_VERDICTS = [
+    {
+        "verdict": "Scientific and Factual",
+        "summary": "The statement is consistent with well-established scientific sources.",
+        "points": [
+            "The claim matches published measurements from multiple independent institutions, which report closely agreeing figures for the period in question.",
+            "National statistical agencies publish the underlying data openly, and their latest releases confirm the figure cited in the statement within the stated margin of error.",
+            "Peer-reviewed studies in leading journals have replicated the result using different methods and datasets, which makes a measurement artefact unlikely.",
+            "International organisations that track the same indicator report consistent values and describe the trend in the same terms as the statement.",
+            "Independent fact-checking outlets that reviewed similar claims reached the same conclusion after consulting the primary sources."
+        ],
+        "brief_points": [
+            "Matches published measurements from several independent institutions.",
+            "Confirmed by the latest national statistics release.",
+            "Replicated in peer-reviewed studies with different methods."
+        ],
+        "conclusion": "The statement is accurate.",
+        "confidence": 0.92
+    },
+    {
+        "verdict": "Misleading",
+        "summary": "The figure cited is real, but it refers to a different year and population than the statement implies.",
+        "points": [
+            "The number quoted appears in an official report, but that report covers an earlier year than the one the statement refers to.",
+            "The report measures a narrower population than the statement suggests, so the figure cannot be generalised in the way it is presented.",
+            "Official statistics for the period in question show a noticeably lower value, and the agency's own summary describes the trend differently.",
+            "Several news outlets initially repeated the figure without context and later issued corrections clarifying its scope.",
+            "Experts quoted in coverage of the report caution against comparing the figure with the broader population."
+        ],
+        "brief_points": [
+            "The figure comes from an earlier year's official report.",
+            "It covers a narrower population than implied.",
+            "Current official statistics show a lower value."
+        ],
+        "conclusion": "The statement takes an accurate number out of context.",
+        "confidence": 0.81
+    },
+    {
+        "verdict": "Unscientific and Unfactual",
+        "summary": "No peer-reviewed research supports this claim.",
+        "points": [
+            "Searches of medical and scientific literature databases return no peer-reviewed study supporting the claim.",
+            "The only study cited for it was retracted by the journal that published it after an investigation found serious errors.",
+            "Health agencies have repeatedly reviewed the evidence and state that there is no causal link of the kind claimed.",
+            "Large cohort studies involving millions of participants found no association at all.",
+            "Independent fact-checkers have addressed the claim many times and consistently rated it false."
+        ],
+        "brief_points": [
+            "No peer-reviewed study supports the claim.",
+            "The study usually cited was retracted.",
+            "Large cohort studies found no association."
+        ],
+        "conclusion": "The statement is false.",
+        "confidence": 0.95
+    },
+    {
+        "verdict": "Unverified",
+        "summary": "Available sources neither confirm nor refute the specific claim.",
+        "points": [
+            "The claim first appeared in a single online article that does not name its sources.",
+            "No official body or primary dataset could be found that reports the figure or event described.",
+            "Reporting on the topic is limited to outlets repeating the original article without independent verification.",
+            "Related official statistics exist, but they do not measure the quantity the statement refers to.",
+            "Subject-matter experts contacted by journalists said they could not assess the claim without the underlying data."
+        ],
+        "brief_points": [
+            "Traced to a single article without named sources.",
+            "No primary data or official report found.",
+            "Other coverage only repeats the original article."
+        ],
+        "conclusion": "There is not enough evidence to rate the statement.",
+        "confidence": 0.55
+    }
+]
+
+def format_prose(verdict: dict) -> str:
+    """Prose answer in the VERDICT/ANALYSIS/CONCLUSION format the fact-check prompt asks for"""
+    return "\n\n".join(
+        [f"**VERDICT:** {verdict['verdict']}\n{verdict['summary']}"]
+        + verdict["points"]
+        + [f"**CONCLUSION:** {verdict['conclusion']}"]
+    )
+
+STUB_RESPONSE_TEXT = format_prose(STUB_VERDICTS[0])
+
+STUB_DESCRIPTION_TEXT = """The image shows a printed poster on a brick wall. Large headline text at the top reads "Drinking eight glasses of water a day is required by law". Below it is a photograph of a glass of water on a wooden table next to a stethoscope. Small print at the bottom attributes the claim to a national health agency and lists a website address. The poster is slightly weathered, with a torn lower-left corner, and the lighting suggests it was photographed outdoors in daylight. No people are visible."""
+
+# Domains grounding chunks are drawn from (Gemini reports the domain as the title)
+STUB_SOURCE_DOMAINS = [
+    "who.int", "cdc.gov", "reuters.com", "apnews.com", "nature.com",
+    "bbc.com", "factcheck.org", "nih.gov", "worldbank.org", "snopes.com"
+]
+
+# Gemini bills every image as a fixed number of tokens
+IMAGE_TOKENS = 258
+# Search results injected into the prompt per web search query
+TOOL_USE_TOKENS_PER_QUERY = 96
+
+# Roughly how many characters make one output token
+CHARS_PER_TOKEN = 4
+
+_SUMMARY_PROMPT_PATTERN = re.compile(r"^Summarize the following text in (\d+) words or less:\s*", re.IGNORECASE)
+_CONTENT_LABEL_PATTERN = re.compile(r"^(Statement|Image Description):\s*", re.IGNORECASE)
+_SENTENCE_PATTERN = re.compile(r"[^.\n]+[.]")
+
+def _request_text(request: dict) -> str:
+    """All text parts of a request, in order"""
+    return "\n".join(
+        part["text"]
+        for content in request.get("contents", [])
+        for part in content.get("parts", [])
+        if "text" in part
+    )
+
+def estimate_prompt_tokens(request: dict) -> int:
+    """Approximate prompt tokens of a generateContent or cachedContents request (about 4 characters per token)"""
+    tokens = 0
+    instruction = request.get("systemInstruction") or {}
+    for part in instruction.get("parts", []):
+        tokens += max(1, len(part.get("text", "")) // 4)
+    for content in request.get("contents", None) or []:
+        for part in content.get("parts", []):
+            if "text" in part:
+                tokens += max(1, len(part["text"]) // 4)
+            elif "inlineData" in part:
+                tokens += IMAGE_TOKENS
+    return tokens
+
+def _search_queries(prompt: str) -> List[str]:
+    """Queries a grounded model would issue for the claim at the end of a prompt"""
+    lines = [line.strip(" \"'") for line in prompt.splitlines() if line.strip(" \"'")]
+    claim = _CONTENT_LABEL_PATTERN.sub("", lines[-1] if lines else "").strip(" \"'") or "claim"
+    claim = " ".join(claim.split()[:12])
+    return [claim, f"{claim} fact check"]
+
+def build_grounding_metadata(text: str, queries: List[str], seed: int) -> dict:
+    """
+    Grounding metadata in the shape Google Search grounding returns
+
+    Args:
+        text: Response text the supports point into
+        queries: Web search queries issued
+        seed: Chooses the source domains, so a prompt always cites the same sources
+
+    Returns:
+        groundingMetadata dictionary
+    """
+    domains = [STUB_SOURCE_DOMAINS[(seed + step * 3) % len(STUB_SOURCE_DOMAINS)] for step in range(3)]
+    chunks = [
+        {
+            "web": {
+                "uri": f"https://vertexaisearch.cloud.google.com/grounding-api-redirect/{hashlib.sha256(f'{seed}-{domain}'.encode()).hexdigest()[:48]}",
+                "title": domain
+            }
+        }
+        for domain in domains
+    ]
+
+    # Segment offsets are UTF-8 byte offsets, like the real API
+    encoded = text.encode("utf-8")
+    supports = []
+    for index, match in enumerate(_SENTENCE_PATTERN.finditer(text)):
+        sentence = match.group(0).strip()
+        start = encoded.find(sentence.encode("utf-8"))
+        chunk_indices = [index % len(chunks)] + ([(index + 1) % len(chunks)] if index % 2 else [])
+        supports.append({
+            "segment": {"startIndex": start, "endIndex": start + len(sentence.encode("utf-8")), "text": sentence},
+            "groundingChunkIndices": chunk_indices,
+            "confidenceScores": [round(0.97 - 0.04 * ((seed + index + offset) % 5), 2) for offset in range(len(chunk_indices))]
+        })
+
+    chips = "".join(f'<a class="chip" href="https://www.google.com/search?q={query.replace(" ", "+")}">{query}</a>' for query in queries)
+    return {
+        "webSearchQueries": queries,
+        "searchEntryPoint": {"renderedContent": f'<div class="container"><div class="carousel">{chips}</div></div>'},
+        "groundingChunks": chunks,
+        "groundingSupports": supports,
+        "retrievalMetadata": {}
+    }
+
+def build_generate_content_response(
+    text: str = STUB_RESPONSE_TEXT,
+    prompt_tokens: int = 250,
+    grounded: bool = True,
+    queries: Optional[List[str]] = None,
+    seed: int = 0,
+    finish_reason: str = "STOP",
+    cached_tokens: int = 0
+) -> dict:
+    """Build a generateContent response body, with grounding metadata unless `grounded` is False"""
+    candidates_tokens = max(1, len(text) // CHARS_PER_TOKEN)
+    queries = queries or ["claim", "claim fact check"]
+    tool_use_tokens = TOOL_USE_TOKENS_PER_QUERY * len(queries) if grounded else 0
+
+    candidate = {
+        "content": {"role": "model", "parts": [{"text": text}]},
+        "finishReason": finish_reason,
+        "index": 0
+    }
+    usage = {
+        "promptTokenCount": prompt_tokens,
+        "candidatesTokenCount": candidates_tokens,
+        "totalTokenCount": prompt_tokens + candidates_tokens + tool_use_tokens,
+        "promptTokensDetails": [{"modality": "TEXT", "tokenCount": prompt_tokens}]
+    }
+    if cached_tokens:
+        usage["cachedContentTokenCount"] = cached_tokens
+    if grounded:
+        candidate["groundingMetadata"] = build_grounding_metadata(text, queries, seed)
+        usage["toolUsePromptTokenCount"] = tool_use_tokens
+
+    return {"candidates": [candidate], "usageMetadata": usage, "modelVersion": "stub"}
+
+def _answer(request: dict) -> Tuple[str, bool, List[str], int]:
+    """
+    Choose the answer for a request
+
+    Returns:
+        Tuple of (text, grounded, search queries, seed)
+    """
+    prompt = _request_text(request)
+    seed = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8], 16)
+    generation_config = request.get("generationConfig") or {}
+
+    if request.get("tools"):
+        verdict = STUB_VERDICTS[seed % len(STUB_VERDICTS)]
+        if generation_config.get("responseMimeType") == "application/json":
+            text = json.dumps({
+                "verdict": verdict["verdict"],
+                "points": verdict["brief_points"],
+                "conclusion": verdict["conclusion"],
+                "confidence": verdict["confidence"]
+            })
+        else:
+            text = format_prose(verdict)
+        return text, True, _search_queries(prompt), seed
+
+    # Summaries keep the opening words of the text, within the requested length
+    summary = _SUMMARY_PROMPT_PATTERN.match(prompt)
+    if summary:
+        words = prompt[summary.end():].split()[:int(summary.group(1))]
+        return " ".join(words), False, [], seed
+
+    # Other ungrounded calls are image descriptions (first step of the two-step image path)
+    return STUB_DESCRIPTION_TEXT, False, [], seed
+
+def _timestamp(moment: float) -> str:
+    """RFC 3339 timestamp of a time.time() value"""
+    return datetime.fromtimestamp(moment, timezone.utc).isoformat().replace("+00:00", "Z")
+
+def _ttl_seconds(body: dict, default: float = 3600.0) -> float:
+    """Lifetime requested by a cachedContents body, as a "3600s" duration or an absolute expireTime"""
+    if body.get("ttl"):
+        return float(str(body["ttl"]).rstrip("s"))
+    if body.get("expireTime"):
+        expire_time = datetime.fromisoformat(body["expireTime"].replace("Z", "+00:00"))
+        return (expire_time - datetime.now(timezone.utc)).total_seconds()
+    return default
+
+def _apply_output_limit(text: str, request: dict) -> Tuple[str, str]:
+    """
+    Cut the answer at generationConfig.maxOutputTokens, like the real API
+
+    Returns:
+        Tuple of (text, finish reason)
+    """
+    limit = (request.get("generationConfig") or {}).get("maxOutputTokens")
+    if limit and len(text) > limit * CHARS_PER_TOKEN:
+        return text[:limit * CHARS_PER_TOKEN], "MAX_TOKENS"
+    return text, "STOP"
+
+class StubGeminiHandler(BaseHTTPRequestHandler):
+    """Request handler answering Gemini generateContent calls"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency: LatencyModel = LatencyModel()
+    stream_chunk_delay_ms: float = 0.0
+    output_token_ms: float = 0.0
+    prompt_token_ms: float = 0.0
+    context_caching: bool = False
+    min_cache_tokens: int = 0
+    faults: FaultInjector = FaultInjector()
+    # Cached contents by name, replaced with a fresh dict by start_stub_server
+    caches: dict = {}
+    # Per-server totals, replaced with a fresh dict by start_stub_server
+    usage: dict = {}
+    usage_lock = threading.Lock()
+
+    def _count(self, key: str, amount: int = 1):
+        with self.usage_lock:
+            self.usage[key] += amount
+
+    def handle(self):
+        # Clients that stop waiting (timeouts, cancelled hedges) close the connection mid-response
+        try:
+            super().handle()
+        except (BrokenPipeError, ConnectionResetError):
+            self._count("disconnected")
+
+    def _error_response(self, code: int, status: str, message: str):
+        """Answer with a Google API error body"""
+        body = json.dumps({"error": {"code": code, "message": message, "status": status}}).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json_response(self, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _cached_content_body(self, name: str, entry: dict) -> dict:
+        return {
+            "name": name,
+            "model": entry["model"],
+            "displayName": entry.get("displayName", ""),
+            "createTime": _timestamp(entry["created"]),
+            "updateTime": _timestamp(entry["updated"]),
+            "expireTime": _timestamp(entry["expires"]),
+            "usageMetadata": {"totalTokenCount": entry["tokens"]}
+        }
+
+    def _create_cached_content(self, body: dict):
+        """Store a system instruction and tools under a new cachedContents/ name"""
+        if not self.context_caching:
+            self._error_response(404, "NOT_FOUND", "Method not found.")
+            return
+
+        tokens = estimate_prompt_tokens(body)
+        if tokens < self.min_cache_tokens:
+            self._error_response(
+                400, "INVALID_ARGUMENT",
+                f"Cached content is too small. total_token_count={tokens}, min_total_token_count={self.min_cache_tokens}"
+            )
+            return
+
+        now = time.time()
+        name = f"cachedContents/{uuid.uuid4().hex[:16]}"
+        entry = {
+            "model": body.get("model", ""),
+            "displayName": body.get("displayName", ""),
+            "systemInstruction": body.get("systemInstruction"),
+            "tools": body.get("tools"),
+            "contents": body.get("contents"),
+            "tokens": tokens,
+            "created": now,
+            "updated": now,
+            "expires": now + _ttl_seconds(body)
+        }
+        with self.usage_lock:
+            self.caches[name] = entry
+            self.usage["caches_created"] += 1
+        self._json_response(self._cached_content_body(name, entry))
+
+    def _live_cache(self, name: str) -> Optional[dict]:
+        with self.usage_lock:
+            entry = self.caches.get(name)
+            if entry and entry["expires"] <= time.time():
+                del self.caches[name]
+                entry = None
+        return entry
+
+    def _resolve_cached_content(self, request: dict) -> Tuple[Optional[dict], int]:
+        """
+        Merge the cached content a request names into it
+
+        Returns:
+            Tuple of (effective request, cached tokens), or (None, 0) if the name is unknown or expired
+        """
+        name = request.get("cachedContent")
+        if not name:
+            return request, 0
+        entry = self._live_cache(name)
+        if not entry:
+            return None, 0
+
+        merged = dict(request)
+        merged["systemInstruction"] = entry["systemInstruction"]
+        if entry["tools"]:
+            merged["tools"] = entry["tools"]
+        merged["contents"] = (entry["contents"] or []) + request.get("contents", [])
+        return merged, entry["tokens"]
+
+    def do_PATCH(self):
+        """Update the TTL of a cached content"""
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        name = self.path.split("/v1beta/", 1)[-1].split("?", 1)[0]
+
+        entry = self._live_cache(name)
+        if not entry:
+            self._error_response(404, "NOT_FOUND", f"CachedContent not found (or permission denied): {name}")
+            return
+        entry["updated"] = time.time()
+        entry["expires"] = entry["updated"] + _ttl_seconds(body)
+        with self.usage_lock:
+            self.usage["caches_refreshed"] += 1
+        self._json_response(self._cached_content_body(name, entry))
+
+    def do_DELETE(self):
+        name = self.path.split("/v1beta/", 1)[-1].split("?", 1)[0]
+        with self.usage_lock:
+            self.caches.pop(name, None)
+        self._json_response({})
+
+    def _prefill_delay(self, prompt_tokens: int, cached_tokens: int):
+        """Prompt processing time; cached tokens are not processed again"""
+        if self.prompt_token_ms:
+            time.sleep((prompt_tokens - cached_tokens) * self.prompt_token_ms / 1000)
+
+    def _stream_response(self, request: dict, cached_tokens: int = 0):
+        """Send the answer as SSE chunks, with grounding and usage on the last one"""
+        text, grounded, queries, seed = _answer(request)
+        text, finish_reason = _apply_output_limit(text, request)
+        full = build_generate_content_response(
+            text, estimate_prompt_tokens(request), grounded, queries, seed, finish_reason, cached_tokens
+        )
+        self._prefill_delay(full["usageMetadata"]["promptTokenCount"], cached_tokens)
+        lines = text.split("\n")
+        pieces = [line + "\n" for line in lines[:-1]] + [lines[-1]]
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        for index, piece in enumerate(pieces):
+            if index < len(pieces) - 1:
+                chunk = {"candidates": [{"content": {"role": "model", "parts": [{"text": piece}]}, "index": 0}], "modelVersion": "stub"}
+            else:
+                chunk = json.loads(json.dumps(full))
+                chunk["candidates"][0]["content"]["parts"][0]["text"] = piece
+            event = f"data: {json.dumps(chunk)}\r\n\r\n".encode()
+            self.wfile.write(f"{len(event):x}\r\n".encode() + event + b"\r\n")
+            self.wfile.flush()
+            # Decoding time grows with the tokens generated
+            delay_ms = self.stream_chunk_delay_ms + self.output_token_ms * len(piece) / CHARS_PER_TOKEN
+            if delay_ms:
+                time.sleep(delay_ms / 1000)
+
+        self.wfile.write(b"0\r\n\r\n")
+        self._record_usage(full)
+
+    def _record_usage(self, response: dict):
+        metadata = response["usageMetadata"]
+        with self.usage_lock:
+            self.usage["requests"] += 1
+            self.usage["prompt_tokens"] += metadata["promptTokenCount"]
+            self.usage["candidates_tokens"] += metadata["candidatesTokenCount"]
+            self.usage["tool_use_prompt_tokens"] += metadata.get("toolUsePromptTokenCount", 0)
+            self.usage["cached_tokens"] += metadata.get("cachedContentTokenCount", 0)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+
+        delay = self.latency.sample()
+        if delay:
+            time.sleep(delay)
+
+        fault = self.faults.sample()
+        if fault == FaultInjector.THROTTLED:
+            self._count("throttled")
+            self._error_response(429, "RESOURCE_EXHAUSTED", "Resource has been exhausted (e.g. check quota).")
+            return
+        if fault == FaultInjector.UNAVAILABLE:
+            self._count("unavailable")
+            self._error_response(503, "UNAVAILABLE", "The model is overloaded. Please try again later.")
+            return
+
+        if self.path.split("?", 1)[0].endswith("/cachedContents"):
+            self._create_cached_content(request)
+            return
+
+        request, cached_tokens = self._resolve_cached_content(request)
+        if request is None:
+            self._error_response(403, "PERMISSION_DENIED", "CachedContent not found (or permission denied)")
+            return
+
+        if ":streamGenerateContent" in self.path:
+            self._stream_response(request, cached_tokens)
+            return
+
+        text, grounded, queries, seed = _answer(request)
+        text, finish_reason = _apply_output_limit(text, request)
+        response = build_generate_content_response(
+            text, estimate_prompt_tokens(request), grounded, queries, seed, finish_reason, cached_tokens
+        )
+        self._record_usage(response)
+        self._prefill_delay(response["usageMetadata"]["promptTokenCount"], cached_tokens)
+
+        # Decoding time grows with the tokens generated
+        if self.output_token_ms:
+            time.sleep(response["usageMetadata"]["candidatesTokenCount"] * self.output_token_ms / 1000)
+
+        self._json_response(response)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_stub_server(
+    port: int = 0,
+    latency_ms: float = 0.0,
+    stream_chunk_delay_ms: float = 0.0,
+    error_rate: float = 0.0,
+    latency: Optional[str] = None,
+    server_error_rate: float = 0.0,
+    requests_per_minute: float = 0.0,
+    seed: Optional[int] = None,
+    output_token_ms: float = 0.0,
+    prompt_token_ms: float = 0.0,
+    context_caching: bool = False,
+    min_cache_tokens: int = 0,
+    slow_rate: float = 0.0,
+    slow_ms: float = 0.0
+) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    Start the stand-in server on a background thread
+
+    Args:
+        port: Port to listen on (0 picks a free port)
+        latency_ms: Fixed latency before every response (time to first byte)
+        stream_chunk_delay_ms: Delay between streamed chunks
+        error_rate: Fraction of requests answered with 429 RESOURCE_EXHAUSTED
+        latency: Latency spec such as "lognormal:800:300" (overrides latency_ms)
+        server_error_rate: Fraction of requests answered with 503 UNAVAILABLE
+        requests_per_minute: Quota; requests beyond it within a minute get 429 (0 = unlimited)
+        seed: Random seed for repeatable latencies and failures
+        output_token_ms: Generation time per output token, added after the latency
+        prompt_token_ms: Processing time per prompt token not served from a cached content
+        context_caching: Serve cachedContents (otherwise its endpoint answers 404)
+        min_cache_tokens: Smallest cached content accepted, like the per-model minimum of the real API
+        slow_rate: Fraction of responses delayed by slow_ms on top of the latency (stragglers)
+        slow_ms: Extra delay of a straggler
+
+    Returns:
+        Tuple of (server, base_url)
+    """
+    handler = type("ConfiguredStubGeminiHandler", (StubGeminiHandler,), {
+        "latency": (
+            LatencyModel.from_spec(latency, seed, slow_rate, slow_ms) if latency
+            else LatencyModel("fixed", latency_ms, seed=seed, slow_rate=slow_rate, slow_ms=slow_ms)
+        ),
+        "stream_chunk_delay_ms": stream_chunk_delay_ms,
+        "output_token_ms": output_token_ms,
+        "prompt_token_ms": prompt_token_ms,
+        "context_caching": context_caching,
+        "min_cache_tokens": min_cache_tokens,
+        "caches": {},
+        "faults": FaultInjector(error_rate, server_error_rate, requests_per_minute, None if seed is None else seed + 1),
+        "usage": {
+            "requests": 0, "prompt_tokens": 0, "candidates_tokens": 0,
+            "tool_use_prompt_tokens": 0, "cached_tokens": 0, "caches_created": 0,
+            "caches_refreshed": 0, "throttled": 0, "unavailable": 0, "disconnected": 0
+        }
+    })
+    server_class = type("StubServer", (ThreadingHTTPServer,), {"request_queue_size": 1024})
+    server = server_class(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
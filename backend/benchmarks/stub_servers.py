@@ -0,0 +1,67 @@
+"""
+Run the stand-in Gemini and Speech-to-Text servers in the foreground
+
+Start them, then run the API against them in another shell with the
+printed environment variables, e.g. to load-test without quota or network.
+
+Usage (from the backend directory):
+    python -m benchmarks.stub_servers --gemini-latency lognormal:900:400 --speech-latency normal:300:80 \\
+        --speech-realtime-factor 0.1 --gemini-error-rate 0.02 --gemini-rpm 600 --seed 7
+"""
+import argparse
+import time
+from benchmarks.stub_gemini import start_stub_server
+from benchmarks.stub_speech import start_stub_speech_server
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in Gemini and Speech-to-Text servers")
+    parser.add_argument("--gemini-port", type=int, default=8790)
+    parser.add_argument("--speech-port", type=int, default=8791)
+    parser.add_argument("--gemini-latency", default="fixed:800", help="kind:mean_ms[:spread_ms]")
+    parser.add_argument("--gemini-stream-chunk-delay-ms", type=float, default=50)
+    parser.add_argument("--gemini-throttle-rate", type=float, default=0.0, help="Fraction of 429 responses")
+    parser.add_argument("--gemini-error-rate", type=float, default=0.0, help="Fraction of 503 responses")
+    parser.add_argument("--gemini-rpm", type=float, default=0, help="Per-minute quota (0 = unlimited)")
+    parser.add_argument("--speech-latency", default="fixed:300", help="kind:mean_ms[:spread_ms]")
+    parser.add_argument("--speech-realtime-factor", type=float, default=0.1, help="Processing seconds per audio second")
+    parser.add_argument("--speech-throttle-rate", type=float, default=0.0, help="Fraction of RESOURCE_EXHAUSTED responses")
+    parser.add_argument("--speech-error-rate", type=float, default=0.0, help="Fraction of UNAVAILABLE responses")
+    parser.add_argument("--speech-rpm", type=float, default=0, help="Per-minute quota (0 = unlimited)")
+    parser.add_argument("--seed", type=int, default=None, help="Make latencies and failures repeatable")
+    args = parser.parse_args()
+
+    gemini, base_url = start_stub_server(
+        port=args.gemini_port,
+        latency=args.gemini_latency,
+        stream_chunk_delay_ms=args.gemini_stream_chunk_delay_ms,
+        error_rate=args.gemini_throttle_rate,
+        server_error_rate=args.gemini_error_rate,
+        requests_per_minute=args.gemini_rpm,
+        seed=args.seed
+    )
+    speech, endpoint = start_stub_speech_server(
+        port=args.speech_port,
+        latency=args.speech_latency,
+        realtime_factor=args.speech_realtime_factor,
+        error_rate=args.speech_throttle_rate,
+        server_error_rate=args.speech_error_rate,
+        requests_per_minute=args.speech_rpm,
+        seed=args.seed
+    )
+
+    print("Stand-in servers running. Start the API with:")
+    print(f"  GEMINI_API_KEY=stub-key GEMINI_BASE_URL={base_url} SPEECH_API_ENDPOINT={endpoint} python main.py")
+    print("Press Ctrl+C to stop.")
+
+    try:
+        while True:
+            time.sleep(10)
+            print(f"gemini: {gemini.RequestHandlerClass.usage}  speech: {speech.servicer.usage}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        gemini.shutdown()
+        speech.stop(0)
+
+if __name__ == "__main__":
+    main()
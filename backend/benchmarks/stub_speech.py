@@ -0,0 +1,295 @@
+"""
+Local stand-in for the Cloud Speech-to-Text v1 gRPC API
+
+Serves `google.cloud.speech.v1.Speech/Recognize` and `StreamingRecognize`
+over a plaintext gRPC port so the real `speech_v1.SpeechClient` can be
+pointed at it through `SPEECH_API_ENDPOINT`. Transcripts are generated
+from the audio length (about 2.5 spoken words per second), mixing
+checkable claims with filler, and are deterministic per audio content.
+Like the real API, synchronous requests over one minute of audio are
+rejected with INVALID_ARGUMENT, and streams over about five minutes of
+audio are ended with OUT_OF_RANGE.
+
+Streams finalize one sentence per UTTERANCE_SECONDS of audio (counted
+from the start of the stream, with interim results in between when asked
+for), and whatever is left when the client closes its side.
+
+Latency is a sampled base delay (see benchmarks.stub_faults) plus a
+processing time proportional to the audio length, and requests can be
+throttled (RESOURCE_EXHAUSTED, randomly or over a per-minute quota) or
+failed (UNAVAILABLE).
+"""
+import hashlib
+import io
+import threading
+import time
+import uuid
+import wave
+from concurrent import futures
+from datetime import timedelta
+from typing import List, Optional, Tuple
+import grpc
+from google.cloud import speech_v1
+from benchmarks.stub_faults import FaultInjector, LatencyModel
+
+SERVICE_NAME = "google.cloud.speech.v1.Speech"
+
+# Longest audio the synchronous Recognize method accepts
+MAX_SYNC_AUDIO_SECONDS = 60.0
+# Longest audio one StreamingRecognize call accepts
+MAX_STREAM_AUDIO_SECONDS = 305.0
+# Streamed audio between final results
+UTTERANCE_SECONDS = 4.0
+WORDS_PER_SECOND = 2.5
+
+STUB_TRANSCRIPT_SENTENCES = [
+    "So today we are going to look at a few things people have been sharing online.",
+    "According to the World Health Organization, global life expectancy rose by more than six years between 2000 and 2019.",
+    "Um, you know, a lot of people were surprised by that.",
+    "The Great Wall of China is the only man-made structure visible from space with the naked eye.",
+    "Researchers at Stanford found that drinking coffee reduces the risk of heart disease by 15 percent.",
+    "I mean, that's, that's what they said anyway.",
+    "Unemployment in the United States fell to 3.5 percent in September 2019, the lowest rate in fifty years.",
+    "Like and subscribe if you want more videos like this.",
+    "Vaccines cause autism according to a study that was later retracted by The Lancet.",
+    "The Amazon rainforest produces 20 percent of the oxygen in the world's atmosphere.",
+    "Okay, so, let's move on to the next one.",
+    "Lightning never strikes the same place twice, scientists have confirmed."
+]
+
+def audio_duration_seconds(content: bytes, sample_rate_hertz: int, channels: int) -> float:
+    """
+    Duration of LINEAR16 audio, read from the WAV header when there is one
+
+    Args:
+        content: Audio bytes from RecognitionAudio
+        sample_rate_hertz: Rate from RecognitionConfig (0 = 16000)
+        channels: Channel count from RecognitionConfig (0 = 1)
+
+    Returns:
+        Duration in seconds
+    """
+    if content[:4] == b"RIFF":
+        try:
+            with wave.open(io.BytesIO(content)) as wav:
+                return wav.getnframes() / float(wav.getframerate())
+        except (wave.Error, EOFError):
+            pass
+    return len(content) / (2.0 * (sample_rate_hertz or 16000) * (channels or 1))
+
+def generate_transcript(content: bytes, duration: float) -> List[str]:
+    """
+    Sentences a speaker would fit into the audio, starting at a content-dependent position
+
+    Args:
+        content: Audio bytes (identical audio gives an identical transcript)
+        duration: Audio length in seconds
+
+    Returns:
+        Transcript sentences
+    """
+    offset = int(hashlib.sha256(content).hexdigest()[:8], 16)
+    budget = max(1, int(duration * WORDS_PER_SECOND))
+    sentences = []
+    words = 0
+    while words < budget:
+        sentence = STUB_TRANSCRIPT_SENTENCES[(offset + len(sentences)) % len(STUB_TRANSCRIPT_SENTENCES)]
+        sentences.append(sentence)
+        words += len(sentence.split())
+    return sentences
+
+def utterance_words(content: bytes) -> List[str]:
+    """Words of the sentence a streamed utterance is recognized as (deterministic per audio content)"""
+    offset = int(hashlib.sha256(content).hexdigest()[:8], 16)
+    return STUB_TRANSCRIPT_SENTENCES[offset % len(STUB_TRANSCRIPT_SENTENCES)].split()
+
+class StubSpeechServicer:
+    """Implements Recognize and StreamingRecognize with configurable latency and failures"""
+
+    def __init__(self, latency: LatencyModel, realtime_factor: float, faults: FaultInjector):
+        """
+        Initialize the servicer
+
+        Args:
+            latency: Base delay before every response
+            realtime_factor: Extra processing seconds per second of audio
+            faults: Failure injection
+        """
+        self.latency = latency
+        self.realtime_factor = realtime_factor
+        self.faults = faults
+        self.usage = {
+            "requests": 0, "audio_seconds": 0.0, "throttled": 0, "unavailable": 0, "rejected": 0,
+            "streams": 0, "stream_audio_seconds": 0.0, "stream_limit_exceeded": 0
+        }
+        self._lock = threading.Lock()
+
+    def _count(self, key: str, amount: float = 1):
+        with self._lock:
+            self.usage[key] += amount
+
+    def recognize(self, request: speech_v1.RecognizeRequest, context: grpc.ServicerContext) -> speech_v1.RecognizeResponse:
+        content = request.audio.content
+        duration = audio_duration_seconds(content, request.config.sample_rate_hertz, request.config.audio_channel_count)
+
+        time.sleep(self.latency.sample() + duration * self.realtime_factor)
+
+        fault = self.faults.sample()
+        if fault == FaultInjector.THROTTLED:
+            self._count("throttled")
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "Quota exceeded for quota metric 'Recognize requests'.")
+        if fault == FaultInjector.UNAVAILABLE:
+            self._count("unavailable")
+            context.abort(grpc.StatusCode.UNAVAILABLE, "The service is currently unavailable.")
+
+        if duration > MAX_SYNC_AUDIO_SECONDS:
+            self._count("rejected")
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "Sync input too long. For audio longer than 1 min use LongRunningRecognize with a 'uri' parameter."
+            )
+
+        sentences = generate_transcript(content, duration)
+        results = []
+        for index, sentence in enumerate(sentences):
+            end = duration * (index + 1) / len(sentences)
+            results.append(speech_v1.SpeechRecognitionResult(
+                alternatives=[speech_v1.SpeechRecognitionAlternative(
+                    transcript=sentence if index == 0 else f" {sentence}",
+                    confidence=0.86 + 0.01 * (index % 10)
+                )],
+                result_end_time=timedelta(seconds=round(end, 2)),
+                language_code=request.config.language_code.lower() or "en-us"
+            ))
+
+        with self._lock:
+            self.usage["requests"] += 1
+            self.usage["audio_seconds"] += duration
+
+        # Billing rounds up to whole seconds
+        return speech_v1.RecognizeResponse(
+            results=results,
+            total_billed_time=timedelta(seconds=int(duration) + (1 if duration % 1 else 0)),
+            request_id=uuid.uuid4().int >> 65
+        )
+
+    def _stream_result(self, words: List[str], is_final: bool, end_seconds: float, language_code: str):
+        return speech_v1.StreamingRecognizeResponse(results=[speech_v1.StreamingRecognitionResult(
+            alternatives=[speech_v1.SpeechRecognitionAlternative(
+                transcript=" ".join(words),
+                confidence=0.9 if is_final else 0.0
+            )],
+            is_final=is_final,
+            stability=0.0 if is_final else 0.8,
+            result_end_time=timedelta(seconds=round(end_seconds, 3)),
+            language_code=language_code
+        )])
+
+    def streaming_recognize(self, request_iterator, context: grpc.ServicerContext):
+        first = next(request_iterator, None)
+        if first is None or "streaming_config" not in first:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "The first request must contain a streaming_config.")
+        streaming_config = first.streaming_config
+        config = streaming_config.config
+        bytes_per_second = 2.0 * (config.sample_rate_hertz or 16000) * (config.audio_channel_count or 1)
+        language_code = config.language_code.lower() or "en-us"
+        utterance_bytes = int(UTTERANCE_SECONDS * bytes_per_second) & ~1
+
+        time.sleep(self.latency.sample())
+
+        fault = self.faults.sample()
+        if fault == FaultInjector.THROTTLED:
+            self._count("throttled")
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "Quota exceeded for quota metric 'Streaming requests'.")
+        if fault == FaultInjector.UNAVAILABLE:
+            self._count("unavailable")
+            context.abort(grpc.StatusCode.UNAVAILABLE, "The service is currently unavailable.")
+        self._count("streams")
+
+        pending = bytearray()
+        received = 0
+        finalized = 0
+        interim_second = 0
+
+        for request in request_iterator:
+            audio = request.audio_content
+            time.sleep(len(audio) / bytes_per_second * self.realtime_factor)
+            received += len(audio)
+            self._count("stream_audio_seconds", len(audio) / bytes_per_second)
+            if received / bytes_per_second > MAX_STREAM_AUDIO_SECONDS:
+                self._count("stream_limit_exceeded")
+                context.abort(
+                    grpc.StatusCode.OUT_OF_RANGE,
+                    f"Exceeded maximum allowed stream duration of {MAX_STREAM_AUDIO_SECONDS:.0f} seconds."
+                )
+            pending.extend(audio)
+
+            while len(pending) >= utterance_bytes:
+                finalized += utterance_bytes
+                yield self._stream_result(
+                    utterance_words(bytes(pending[:utterance_bytes])), True, finalized / bytes_per_second, language_code
+                )
+                del pending[:utterance_bytes]
+                interim_second = 0
+
+            # Interim hypotheses about once per second of audio, revised as more arrives
+            if streaming_config.interim_results and int(len(pending) / bytes_per_second) > interim_second:
+                interim_second = int(len(pending) / bytes_per_second)
+                words = utterance_words(bytes(pending))
+                shown = max(1, len(words) * len(pending) // utterance_bytes)
+                yield self._stream_result(words[:shown], False, received / bytes_per_second, language_code)
+
+        # Client closed its side: the rest is final
+        if pending:
+            yield self._stream_result(utterance_words(bytes(pending)), True, received / bytes_per_second, language_code)
+
+def start_stub_speech_server(
+    port: int = 0,
+    latency: str = "fixed:0",
+    realtime_factor: float = 0.0,
+    error_rate: float = 0.0,
+    server_error_rate: float = 0.0,
+    requests_per_minute: float = 0.0,
+    seed: Optional[int] = None,
+    max_workers: int = 64
+) -> Tuple[grpc.Server, str]:
+    """
+    Start the stand-in server on background threads
+
+    Args:
+        port: Port to listen on (0 picks a free port)
+        latency: Base latency spec such as "normal:300:80"
+        realtime_factor: Extra processing seconds per second of audio (e.g. 0.1)
+        error_rate: Fraction of requests answered with RESOURCE_EXHAUSTED
+        server_error_rate: Fraction of requests answered with UNAVAILABLE
+        requests_per_minute: Quota; requests beyond it within a minute get RESOURCE_EXHAUSTED (0 = unlimited)
+        seed: Random seed for repeatable latencies and failures
+        max_workers: Concurrent requests served
+
+    Returns:
+        Tuple of (server, endpoint) with the servicer as `server.servicer`
+    """
+    servicer = StubSpeechServicer(
+        LatencyModel.from_spec(latency, seed),
+        realtime_factor,
+        FaultInjector(error_rate, server_error_rate, requests_per_minute, None if seed is None else seed + 1)
+    )
+    handler = grpc.method_handlers_generic_handler(SERVICE_NAME, {
+        "Recognize": grpc.unary_unary_rpc_method_handler(
+            servicer.recognize,
+            request_deserializer=speech_v1.RecognizeRequest.deserialize,
+            response_serializer=speech_v1.RecognizeResponse.serialize
+        ),
+        "StreamingRecognize": grpc.stream_stream_rpc_method_handler(
+            servicer.streaming_recognize,
+            request_deserializer=speech_v1.StreamingRecognizeRequest.deserialize,
+            response_serializer=speech_v1.StreamingRecognizeResponse.serialize
+        )
+    })
+
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    server.add_generic_rpc_handlers((handler,))
+    bound_port = server.add_insecure_port(f"127.0.0.1:{port}")
+    server.start()
+    server.servicer = servicer
+    return server, f"127.0.0.1:{bound_port}"
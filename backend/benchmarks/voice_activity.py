@@ -0,0 +1,171 @@
+"""
+Speech-only chunking (voice activity detection) against fixed 50-second slicing
+
+Generates a recording of synthetic speech (voiced syllables with harmonics
+and noisy consonants, short pauses between words and longer ones between
+sentences) interleaved with long stretches of near-silence, background
+noise and a steady tone, and keeps the true position of every syllable.
+Transcribes it through the real client against the stand-in Speech server
+with SPEECH_VAD_ENABLED off and on, and reports the audio sent upstream
+(the billed seconds), requests, wall time, the share of true speech the
+chunks kept and how many chunk boundaries fall inside a syllable.
+
+Usage (from the backend directory):
+    python -m benchmarks.voice_activity --audio-minutes 20 --speech-share 0.5 \\
+        --latency normal:300:80 --realtime-factor 0.1 --seed 7
+"""
+import argparse
+import tempfile
+import time
+import wave
+from pathlib import Path
+from typing import Dict, List, Tuple
+import numpy as np
+from config.settings import settings
+from benchmarks.stub_speech import start_stub_speech_server
+from services.speech_to_text import SpeechToTextService
+from services.voice_activity import voice_activity_detector
+
+SAMPLE_RATE = 16000
+
+def _syllable(rng: np.random.Generator) -> np.ndarray:
+    """A voiced syllable (harmonics under an envelope), sometimes led by a noisy consonant"""
+    length = int(rng.uniform(0.12, 0.28) * SAMPLE_RATE)
+    t = np.arange(length) / SAMPLE_RATE
+    f0 = rng.uniform(100, 230)
+    voiced = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 6))
+    voiced *= np.hanning(length) * rng.uniform(0.1, 0.4)
+    if rng.random() < 0.3:
+        consonant = rng.normal(0, rng.uniform(0.02, 0.06), int(rng.uniform(0.04, 0.1) * SAMPLE_RATE))
+        return np.concatenate((consonant, voiced))
+    return voiced
+
+def _non_speech(rng: np.random.Generator, seconds: float) -> np.ndarray:
+    """Near-silence, background noise or a steady tone"""
+    length = int(seconds * SAMPLE_RATE)
+    kind = rng.integers(3)
+    if kind == 0:
+        return rng.normal(0, 0.0005, length)
+    if kind == 1:
+        return rng.normal(0, 0.003, length)
+    return 0.002 * np.sin(2 * np.pi * 60 * np.arange(length) / SAMPLE_RATE)
+
+def _generate(seconds: float, speech_share: float, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Synthetic recording and its ground truth
+
+    Returns:
+        Tuple of (samples in [-1, 1], boolean mask of samples inside a syllable)
+    """
+    rng = np.random.default_rng(seed)
+    pieces: List[np.ndarray] = []
+    truth: List[np.ndarray] = []
+    total = 0
+    target = int(seconds * SAMPLE_RATE)
+
+    def add(samples: np.ndarray, is_speech: bool):
+        nonlocal total
+        pieces.append(samples)
+        truth.append(np.full(len(samples), is_speech))
+        total += len(samples)
+
+    while total < target:
+        # A stretch of talk: sentences of words separated by pauses
+        talk_end = total + int(rng.uniform(20, 90) * SAMPLE_RATE * speech_share / 0.5)
+        while total < min(talk_end, target):
+            for _ in range(rng.integers(4, 16)):
+                for _ in range(rng.integers(1, 4)):
+                    add(_syllable(rng), True)
+                add(rng.normal(0, 0.0005, int(rng.uniform(0.05, 0.2) * SAMPLE_RATE)), False)
+            add(rng.normal(0, 0.0005, int(rng.uniform(0.4, 1.5) * SAMPLE_RATE)), False)
+        if total < target:
+            add(_non_speech(rng, rng.uniform(20, 90) * (1 - speech_share) / 0.5), False)
+
+    samples = np.concatenate(pieces)[:target]
+    return np.clip(samples, -1, 1), np.concatenate(truth)[:target]
+
+def _write_wav(path: Path, samples: np.ndarray):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes((samples * 32767).astype("<i2").tobytes())
+
+def _chunks(vad: bool, path: Path, total: int) -> List[List[Tuple[int, int]]]:
+    if vad:
+        return voice_activity_detector.chunk_ranges(str(path))
+    step = 50 * SAMPLE_RATE
+    return [[(start, min(start + step, total))] for start in range(0, total, step)]
+
+def _coverage(chunks: List[List[Tuple[int, int]]], truth: np.ndarray) -> Dict:
+    """Share of the audio and of the true speech sent, and chunk boundaries that split a syllable"""
+    sent = np.zeros(len(truth), dtype=bool)
+    cuts_in_speech = 0
+    for chunk in chunks:
+        for start, end in chunk:
+            sent[start:end] = True
+        for start, end in (chunk[0], chunk[-1]):
+            cuts_in_speech += int(0 < start and truth[start - 1] and truth[start])
+            cuts_in_speech += int(end < len(truth) and truth[end - 1] and truth[end])
+    return {
+        "sent_share": sent.mean(),
+        "speech_kept": sent[truth].mean(),
+        # Each internal cut is seen from both chunks it separates
+        "cuts_in_speech": cuts_in_speech // 2
+    }
+
+def _run_mode(args, path: Path, truth: np.ndarray, vad: bool) -> Dict:
+    speech, endpoint = start_stub_speech_server(
+        latency=args.latency, realtime_factor=args.realtime_factor, seed=args.seed
+    )
+    settings.SPEECH_API_ENDPOINT = endpoint
+    settings.SPEECH_VAD_ENABLED = vad
+    settings.SPEECH_STREAMING_ENABLED = False
+    service = SpeechToTextService()
+
+    analysis_started = time.perf_counter()
+    chunks = _chunks(vad, path, len(truth))
+    analysis = time.perf_counter() - analysis_started
+
+    started = time.perf_counter()
+    service.transcribe_audio(str(path))
+    wall = time.perf_counter() - started
+
+    speech.stop(0)
+    return {
+        "wall": wall,
+        "analysis": analysis if vad else 0.0,
+        "requests": speech.servicer.usage["requests"],
+        "audio_seconds": speech.servicer.usage["audio_seconds"],
+        **_coverage(chunks, truth)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare speech-only chunking with fixed slicing")
+    parser.add_argument("--audio-minutes", type=float, default=20)
+    parser.add_argument("--speech-share", type=float, default=0.5, help="Rough share of talk stretches")
+    parser.add_argument("--latency", default="normal:300:80", help="kind:mean_ms[:spread_ms]")
+    parser.add_argument("--realtime-factor", type=float, default=0.1, help="Processing seconds per audio second")
+    parser.add_argument("--concurrency", type=int, default=settings.SPEECH_CHUNK_CONCURRENCY)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    settings.SPEECH_CHUNK_CONCURRENCY = args.concurrency
+
+    samples, truth = _generate(args.audio_minutes * 60, args.speech_share, args.seed)
+    with tempfile.TemporaryDirectory() as workdir:
+        path = Path(workdir) / "recording.wav"
+        _write_wav(path, samples)
+        results = {"fixed 50 s": _run_mode(args, path, truth, vad=False), "vad": _run_mode(args, path, truth, vad=True)}
+
+    print(f"{args.audio_minutes:g} min recording, {truth.mean():.0%} inside syllables, latency {args.latency}"
+          f" + {args.realtime_factor:.2f} s per audio second, concurrency {args.concurrency}\n")
+    print(f"{'chunking':<11} {'sent s':>8} {'sent':>6} {'speech kept':>12} {'cuts in speech':>15}"
+          f" {'requests':>9} {'wall s':>8} {'vad s':>6}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<11} {result['audio_seconds']:>8.0f} {result['sent_share']:>6.0%} {result['speech_kept']:>12.2%}"
+            f" {result['cuts_in_speech']:>15} {result['requests']:>9} {result['wall']:>8.2f} {result['analysis']:>6.2f}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -12,9 +12,60 @@ class Settings:
     # API Keys
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
 
+    # Gemini HTTP client (one pooled client is shared by the whole process)
+    GEMINI_BASE_URL: str = os.getenv("GEMINI_BASE_URL", "")
+    GEMINI_TIMEOUT_SECONDS: float = float(os.getenv("GEMINI_TIMEOUT_SECONDS", "60"))
+    GEMINI_MAX_CONNECTIONS: int = int(os.getenv("GEMINI_MAX_CONNECTIONS", "100"))
+    GEMINI_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("GEMINI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    GEMINI_KEEPALIVE_EXPIRY_SECONDS: float = float(os.getenv("GEMINI_KEEPALIVE_EXPIRY_SECONDS", "60"))
+
+    # Grounded fact-checks as schema-constrained JSON (verdict, points, conclusion, confidence) instead of prose
+    GEMINI_STRUCTURED_OUTPUT: bool = os.getenv("GEMINI_STRUCTURED_OUTPUT", "false").lower() == "true"
+    GEMINI_STRUCTURED_MAX_OUTPUT_TOKENS: int = int(os.getenv("GEMINI_STRUCTURED_MAX_OUTPUT_TOKENS", "768"))
+
+    # Fact-check system instructions stored as provider cached content and referenced by name
+    GEMINI_CONTEXT_CACHE_ENABLED: bool = os.getenv("GEMINI_CONTEXT_CACHE_ENABLED", "false").lower() == "true"
+    GEMINI_CONTEXT_CACHE_TTL_SECONDS: float = float(os.getenv("GEMINI_CONTEXT_CACHE_TTL_SECONDS", "3600"))
+    GEMINI_CONTEXT_CACHE_REFRESH_MARGIN_SECONDS: float = float(os.getenv("GEMINI_CONTEXT_CACHE_REFRESH_MARGIN_SECONDS", "300"))
+    # After a failed creation (e.g. model without caching, instructions under the minimum size) send them inline this long
+    GEMINI_CONTEXT_CACHE_RETRY_SECONDS: float = float(os.getenv("GEMINI_CONTEXT_CACHE_RETRY_SECONDS", "600"))
+
+    # Hedged grounded fact-checks: a second identical call once the first outlasts the tracked latency percentile
+    GEMINI_HEDGING_ENABLED: bool = os.getenv("GEMINI_HEDGING_ENABLED", "false").lower() == "true"
+    GEMINI_HEDGE_PERCENTILE: float = float(os.getenv("GEMINI_HEDGE_PERCENTILE", "95"))
+    # Largest share of calls that may be hedged (each hedge is a billed upstream call). Hedging after pN
+    # alone hedges about (100 - N)% of calls; the cap leaves room for bursts but stops hedging from
+    # doubling traffic when the whole upstream slows down
+    GEMINI_HEDGE_MAX_RATIO: float = float(os.getenv("GEMINI_HEDGE_MAX_RATIO", "0.1"))
+    GEMINI_HEDGE_MIN_SAMPLES: int = int(os.getenv("GEMINI_HEDGE_MIN_SAMPLES", "20"))
+    GEMINI_HEDGE_WINDOW: int = int(os.getenv("GEMINI_HEDGE_WINDOW", "500"))
+    GEMINI_HEDGE_MIN_DELAY_MS: float = float(os.getenv("GEMINI_HEDGE_MIN_DELAY_MS", "250"))
+
+    # Image fact-checks: one grounded multimodal request, with describe-then-check as the fallback
+    GEMINI_IMAGE_SINGLE_CALL: bool = os.getenv("GEMINI_IMAGE_SINGLE_CALL", "true").lower() == "true"
+    # Uploaded images are re-encoded without metadata and downscaled before upload
+    IMAGE_PREPROCESSING_ENABLED: bool = os.getenv("IMAGE_PREPROCESSING_ENABLED", "true").lower() == "true"
+    IMAGE_MAX_DIMENSION: int = int(os.getenv("IMAGE_MAX_DIMENSION", "1536"))
+    IMAGE_JPEG_QUALITY: int = int(os.getenv("IMAGE_JPEG_QUALITY", "85"))
+
     # Google Cloud Platform
     GCP_PROJECT_ID: str = os.getenv("GCP_PROJECT_ID", "")
     GCP_CREDENTIALS_PATH: str = os.getenv("GCP_CREDENTIALS_PATH", "./gcp-credentials.json")
+    # host:port of a plaintext Speech-to-Text gRPC endpoint (e.g. benchmarks/stub_speech.py); no credentials are sent
+    SPEECH_API_ENDPOINT: str = os.getenv("SPEECH_API_ENDPOINT", "")
+    # Audio over a minute is transcribed in chunks, this many at a time
+    SPEECH_CHUNK_CONCURRENCY: int = int(os.getenv("SPEECH_CHUNK_CONCURRENCY", "8"))
+    # Or over streaming recognition, reconnecting before each stream reaches the ~5 minute limit
+    SPEECH_STREAMING_ENABLED: bool = os.getenv("SPEECH_STREAMING_ENABLED", "false").lower() == "true"
+    SPEECH_STREAM_MAX_SECONDS: float = float(os.getenv("SPEECH_STREAM_MAX_SECONDS", "290"))
+    SPEECH_STREAM_FRAME_MS: int = int(os.getenv("SPEECH_STREAM_FRAME_MS", "100"))
+    # Chunked transcription sends only the speech found by voice activity detection, packed into
+    # chunks of at most SPEECH_VAD_MAX_CHUNK_SECONDS cut at pauses
+    SPEECH_VAD_ENABLED: bool = os.getenv("SPEECH_VAD_ENABLED", "true").lower() == "true"
+    SPEECH_VAD_THRESHOLD_DB: float = float(os.getenv("SPEECH_VAD_THRESHOLD_DB", "12"))
+    SPEECH_VAD_MIN_SILENCE_MS: float = float(os.getenv("SPEECH_VAD_MIN_SILENCE_MS", "300"))
+    SPEECH_VAD_PADDING_MS: float = float(os.getenv("SPEECH_VAD_PADDING_MS", "200"))
+    SPEECH_VAD_MAX_CHUNK_SECONDS: float = float(os.getenv("SPEECH_VAD_MAX_CHUNK_SECONDS", "55"))
 
     # JWT Configuration
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
@@ -56,6 +107,69 @@ class Settings:
     USERS_CSV: Path = DATA_FOLDER / "users.csv"
     FACT_CHECKS_CSV: Path = DATA_FOLDER / "fact_checks.csv"
     ADMIN_COMMENTS_CSV: Path = DATA_FOLDER / "admin_comments.csv"
+    USAGE_CSV: Path = DATA_FOLDER / "usage_daily.csv"
+
+    # Gemini token usage is aggregated per user and day in memory and flushed on this interval
+    USAGE_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("USAGE_FLUSH_INTERVAL_SECONDS", "60"))
+
+    # Fact-check result cache (in-memory LRU in front of an on-disk store)
+    CACHE_FOLDER: Path = ROOT_DIR / os.getenv("CACHE_FOLDER", "./Data/cache")
+    FACT_CHECK_CACHE_ENABLED: bool = os.getenv("FACT_CHECK_CACHE_ENABLED", "true").lower() == "true"
+    FACT_CHECK_CACHE_TTL_HOURS: float = float(os.getenv("FACT_CHECK_CACHE_TTL_HOURS", "24"))
+    FACT_CHECK_CACHE_MEMORY_ENTRIES: int = int(os.getenv("FACT_CHECK_CACHE_MEMORY_ENTRIES", "1000"))
+    FACT_CHECK_CACHE_DISK_ENTRIES: int = int(os.getenv("FACT_CHECK_CACHE_DISK_ENTRIES", "100000"))
+
+    # Near-duplicate claim detection (MinHash + LSH over recent fact checks)
+    NEAR_DUPLICATE_ENABLED: bool = os.getenv("NEAR_DUPLICATE_ENABLED", "true").lower() == "true"
+    NEAR_DUPLICATE_THRESHOLD: float = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.75"))
+    NEAR_DUPLICATE_MAX_AGE_HOURS: float = float(os.getenv("NEAR_DUPLICATE_MAX_AGE_HOURS", "24"))
+    NEAR_DUPLICATE_MAX_ENTRIES: int = int(os.getenv("NEAR_DUPLICATE_MAX_ENTRIES", "50000"))
+
+    # Near-duplicate image detection (pHash multi-index lookup, confirmed by dHash)
+    IMAGE_DUPLICATE_ENABLED: bool = os.getenv("IMAGE_DUPLICATE_ENABLED", "true").lower() == "true"
+    IMAGE_DUPLICATE_MAX_DISTANCE: int = int(os.getenv("IMAGE_DUPLICATE_MAX_DISTANCE", "8"))
+    IMAGE_DUPLICATE_MAX_DHASH_DISTANCE: int = int(os.getenv("IMAGE_DUPLICATE_MAX_DHASH_DISTANCE", "12"))
+    IMAGE_DUPLICATE_MAX_AGE_HOURS: float = float(os.getenv("IMAGE_DUPLICATE_MAX_AGE_HOURS", "168"))
+    IMAGE_DUPLICATE_MAX_ENTRIES: int = int(os.getenv("IMAGE_DUPLICATE_MAX_ENTRIES", "50000"))
+
+    # Claim extraction for long inputs (each claim is fact-checked concurrently)
+    CLAIM_SPLIT_MIN_CHARS: int = int(os.getenv("CLAIM_SPLIT_MIN_CHARS", "1500"))
+    CLAIM_MAX_CLAIMS: int = int(os.getenv("CLAIM_MAX_CLAIMS", "8"))
+    CLAIM_CHECK_CONCURRENCY: int = int(os.getenv("CLAIM_CHECK_CONCURRENCY", "4"))
+
+    # Transcript condensation before fact-checking (local extraction, Gemini summary as fallback)
+    TRANSCRIPT_CONDENSE_ENABLED: bool = os.getenv("TRANSCRIPT_CONDENSE_ENABLED", "true").lower() == "true"
+    TRANSCRIPT_CONDENSE_MIN_CHARS: int = int(os.getenv("TRANSCRIPT_CONDENSE_MIN_CHARS", "3000"))
+    TRANSCRIPT_CONDENSE_MAX_TOKENS: int = int(os.getenv("TRANSCRIPT_CONDENSE_MAX_TOKENS", "800"))
+    TRANSCRIPT_CONDENSE_SUMMARY_FALLBACK: bool = os.getenv("TRANSCRIPT_CONDENSE_SUMMARY_FALLBACK", "true").lower() == "true"
+
+    # Pre-flight input sizing: token estimate per fact check, checked locally before any Gemini call
+    INPUT_MAX_TOKENS: int = int(os.getenv("INPUT_MAX_TOKENS", "8000"))
+    # Submitted text over the budget: "reject" (413) or "trim"; transcripts are always trimmed
+    INPUT_OVERSIZE_ACTION: str = os.getenv("INPUT_OVERSIZE_ACTION", "reject").lower()
+    # Hard limit on submitted text, rejected whatever the action
+    INPUT_MAX_CHARS: int = int(os.getenv("INPUT_MAX_CHARS", "200000"))
+
+    # Batch fact-check jobs (POST /api/fact-check/batch)
+    BATCH_MAX_ITEMS: int = int(os.getenv("BATCH_MAX_ITEMS", "500"))
+    BATCH_CONCURRENCY: int = int(os.getenv("BATCH_CONCURRENCY", "8"))
+    BATCH_JOB_TTL_HOURS: float = float(os.getenv("BATCH_JOB_TTL_HOURS", "24"))
+
+    # Upstream resilience (rate limiting, retries, circuit breaking) for Gemini and Speech-to-Text
+    GEMINI_REQUESTS_PER_MINUTE: float = float(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "1000"))
+    GEMINI_BURST: int = int(os.getenv("GEMINI_BURST", "50"))
+    SPEECH_REQUESTS_PER_MINUTE: float = float(os.getenv("SPEECH_REQUESTS_PER_MINUTE", "300"))
+    SPEECH_BURST: int = int(os.getenv("SPEECH_BURST", "20"))
+    UPSTREAM_MAX_ATTEMPTS: int = int(os.getenv("UPSTREAM_MAX_ATTEMPTS", "4"))
+    UPSTREAM_RETRY_BASE_SECONDS: float = float(os.getenv("UPSTREAM_RETRY_BASE_SECONDS", "0.5"))
+    UPSTREAM_RETRY_MAX_SECONDS: float = float(os.getenv("UPSTREAM_RETRY_MAX_SECONDS", "8"))
+    UPSTREAM_CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("UPSTREAM_CIRCUIT_FAILURE_THRESHOLD", "10"))
+    UPSTREAM_CIRCUIT_RESET_SECONDS: float = float(os.getenv("UPSTREAM_CIRCUIT_RESET_SECONDS", "30"))
+    UPSTREAM_RATE_LIMIT_MAX_WAIT_SECONDS: float = float(os.getenv("UPSTREAM_RATE_LIMIT_MAX_WAIT_SECONDS", "10"))
+
+    # Backup Configuration
+    BACKUP_FOLDER: Path = ROOT_DIR / os.getenv("BACKUP_FOLDER", "./Data/backups")
+    BACKUP_SEGMENT_SIZE_KB: int = int(os.getenv("BACKUP_SEGMENT_SIZE_KB", "1024"))
 
     # Upload subdirectories
     VIDEO_UPLOAD_FOLDER: Path = UPLOAD_FOLDER / "videos"
@@ -73,6 +187,8 @@ class Settings:
             cls.VIDEO_UPLOAD_FOLDER,
             cls.AUDIO_UPLOAD_FOLDER,
             cls.IMAGE_UPLOAD_FOLDER,
+            cls.BACKUP_FOLDER,
+            cls.CACHE_FOLDER,
         ]
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
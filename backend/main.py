@@ -3,6 +3,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from config.settings import settings
 from routes import auth, upload, fact_check, history, admin
+from services.gemini_service import close_shared_client
+from services.database import Database
+from services.similarity_index import similarity_index
+from services.image_hash_index import image_hash_index
+from services.usage_tracker import usage_tracker
+from starlette.concurrency import run_in_threadpool
+import asyncio
 import uvicorn
 
 # Create FastAPI application
@@ -72,6 +79,17 @@ async def startup_event():
     print(f"🔑 JWT secret configured: {'Yes' if settings.JWT_SECRET_KEY else 'No'}")
     print(f"🔑 Gemini API configured: {'Yes' if settings.GEMINI_API_KEY else 'No'}")
     print(f"🌐 CORS origins: {', '.join(settings.CORS_ORIGINS)}")
+    if settings.NEAR_DUPLICATE_ENABLED:
+        fact_checks = await run_in_threadpool(Database.get_all_fact_checks)
+        await run_in_threadpool(similarity_index.load_fact_checks, fact_checks)
+        print(f"🔎 Near-duplicate index: {len(similarity_index)} recent claims")
+    if settings.IMAGE_DUPLICATE_ENABLED:
+        fact_checks = await run_in_threadpool(Database.get_all_fact_checks)
+        await run_in_threadpool(image_hash_index.load_fact_checks, fact_checks)
+        print(f"🖼️ Image hash index: {len(image_hash_index)} recent images")
+    app.state.usage_flush_task = asyncio.create_task(
+        usage_tracker.run_periodic_flush(settings.USAGE_FLUSH_INTERVAL_SECONDS)
+    )
     print("✅ API is ready!")
 
 # Shutdown event
@@ -79,6 +97,9 @@ async def startup_event():
 async def shutdown_event():
     """Shutdown event"""
     print("👋 Fact Checker API is shutting down...")
+    app.state.usage_flush_task.cancel()
+    await run_in_threadpool(usage_tracker.flush)
+    close_shared_client()
 
 # Run the application
 if __name__ == "__main__":
@@ -26,6 +26,14 @@ class FactCheckResult(BaseModel):
     gemini_response: str
     citations: List[dict]
     timestamp: str
+    cached: bool = False
+    similar_to: Optional[int] = None
+    similarity: Optional[float] = None
+    claims: Optional[List[dict]] = None
+    claims_skipped: Optional[int] = None
+    condensation: Optional[dict] = None
+    structured: Optional[dict] = None
+    preflight: Optional[dict] = None
 
 class FactCheckResponse(BaseModel):
     """Schema for fact check response"""
@@ -38,6 +46,9 @@ class FactCheckResponse(BaseModel):
     citations: List[dict]
     timestamp: str
     admin_comments: Optional[List[dict]] = []
+    usage: Optional[dict] = None
+    condensation: Optional[dict] = None
+    preflight: Optional[dict] = None
 
 class FactCheckHistory(BaseModel):
     """Schema for fact check history"""
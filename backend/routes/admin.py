@@ -1,8 +1,19 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from fastapi.security import HTTPAuthorizationCredentials
-from typing import List
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional
 from models.comment import CommentCreate, CommentResponse
 from services.database import Database
+from services.backup_service import BackupService
+from services.result_cache import fact_check_cache
+from services.similarity_index import similarity_index
+from services.single_flight import gemini_single_flight
+from services.context_cache import context_cache
+from services.hedging import gemini_hedger
+from services.resilience import gemini_resilience, speech_resilience
+from services.image_preprocessor import image_preprocessor
+from services.usage_tracker import usage_tracker
+from config.settings import settings
 from middleware.auth_middleware import AuthMiddleware, security
 from utils.helpers import Helpers
 
@@ -238,3 +249,199 @@ async def get_comments(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error retrieving comments: {str(e)}"
         )
+
+@router.post("/backups")
+async def create_backup(
+    data: dict = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """
+    Create a point-in-time backup of the Data directory (admin only)
+
+    Args:
+        data: Optional {"incremental": bool}, defaults to incremental
+        credentials: JWT token
+
+    Returns:
+        Snapshot manifest summary
+    """
+    # Verify admin authentication
+    admin = await AuthMiddleware.verify_admin(credentials)
+
+    incremental = (data or {}).get("incremental", True)
+
+    try:
+        # Segmenting and copying run off the event loop; writers are only fenced briefly
+        manifest = await run_in_threadpool(BackupService.create_snapshot, bool(incremental))
+
+        return Helpers.create_response(
+            success=True,
+            message="Backup created successfully",
+            data={
+                "snapshot_id": manifest["snapshot_id"],
+                "type": manifest["type"],
+                "parent": manifest["parent"],
+                "created_at": manifest["created_at"],
+                "uploads_count": len(manifest["uploads"]),
+                "stats": manifest["stats"]
+            }
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error creating backup: {str(e)}"
+        )
+
+@router.get("/backups")
+async def list_backups(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """
+    List existing backups (admin only)
+
+    Args:
+        credentials: JWT token
+
+    Returns:
+        List of snapshot summaries
+    """
+    # Verify admin authentication
+    admin = await AuthMiddleware.verify_admin(credentials)
+
+    try:
+        return Helpers.create_response(
+            success=True,
+            data=BackupService.list_snapshots()
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error listing backups: {str(e)}"
+        )
+
+@router.get("/cache/stats")
+async def get_cache_stats(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """
+    Get fact-check result cache hit rates (admin only)
+
+    Args:
+        credentials: JWT token
+
+    Returns:
+        Cache statistics
+    """
+    # Verify admin authentication
+    admin = await AuthMiddleware.verify_admin(credentials)
+
+    return Helpers.create_response(
+        success=True,
+        data=fact_check_cache.stats()
+    )
+
+@router.post("/cache/invalidate")
+async def invalidate_cache(
+    data: dict = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """
+    Invalidate cached fact-check results (admin only)
+
+    Near-duplicate entries are removed too, so the text is checked afresh.
+
+    Args:
+        data: Optional {"text": "..."}; without text the whole cache is cleared
+        credentials: JWT token
+
+    Returns:
+        Number of cache and near-duplicate index entries removed
+    """
+    # Verify admin authentication
+    admin = await AuthMiddleware.verify_admin(credentials)
+
+    text = (data or {}).get("text")
+
+    try:
+        if text:
+            removed = 1 if await run_in_threadpool(fact_check_cache.invalidate, text) else 0
+            near_duplicates = similarity_index.remove_text(text, settings.NEAR_DUPLICATE_THRESHOLD)
+        else:
+            removed = await run_in_threadpool(fact_check_cache.clear)
+            near_duplicates = similarity_index.clear()
+
+        return Helpers.create_response(
+            success=True,
+            message="Cache invalidated",
+            data={"removed": removed, "near_duplicates_removed": near_duplicates}
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error invalidating cache: {str(e)}"
+        )
+
+@router.get("/metrics")
+async def get_metrics(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """
+    Get upstream call metrics (admin only)
+
+    Args:
+        credentials: JWT token
+
+    Returns:
+        Metrics grouped by component
+    """
+    # Verify admin authentication
+    admin = await AuthMiddleware.verify_admin(credentials)
+
+    return Helpers.create_response(
+        success=True,
+        data={
+            "single_flight": gemini_single_flight.stats(),
+            "gemini": gemini_resilience.stats(),
+            "context_cache": context_cache.stats(),
+            "hedging": gemini_hedger.stats(),
+            "speech": speech_resilience.stats(),
+            "image_preprocessing": image_preprocessor.stats()
+        }
+    )
+
+@router.get("/usage")
+async def get_usage(
+    days: int = 7,
+    user_id: Optional[int] = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """
+    Get Gemini token usage per user and per day (admin only)
+
+    Args:
+        days: Number of days to include
+        user_id: Restrict to one user
+        credentials: JWT token
+
+    Returns:
+        Totals, breakdowns by upload type and user, and daily rows
+    """
+    # Verify admin authentication
+    admin = await AuthMiddleware.verify_admin(credentials)
+
+    try:
+        report = await run_in_threadpool(usage_tracker.report, max(1, days), user_id)
+
+        return Helpers.create_response(
+            success=True,
+            data=report
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error getting usage: {str(e)}"
+        )
@@ -1,20 +1,384 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from models.fact_check import FactCheckProcess, FactCheckResult
 from services.database import Database
 from services.speech_to_text import SpeechToTextService
-from services.gemini_service import GeminiService
+from services.gemini_service import GeminiService, get_gemini_service
 from services.video_processor import VideoProcessor
+from services.result_cache import fact_check_cache
+from services.similarity_index import similarity_index
+from services.image_hash_index import compute_image_hashes, image_hash_index
+from services.claim_extractor import ClaimExtractor
+from services.transcript_condenser import TranscriptCondenser
+from services.single_flight import gemini_single_flight
+from services.usage_tracker import usage_tracker
+from services.batch_jobs import batch_jobs
+from services.resilience import UpstreamUnavailableError
+from services.input_budget import InputBudget, InputTooLargeError
+from services.file_handler import FileHandler
+from config.settings import settings
 from middleware.auth_middleware import AuthMiddleware, security
 from utils.helpers import Helpers
 from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, Optional, Tuple
+import asyncio
+import json
+import math
+import threading
+import time
 
 router = APIRouter(prefix="/api/fact-check", tags=["Fact Checking"])
 
+def _upstream_unavailable(error: UpstreamUnavailableError) -> HTTPException:
+    """503 telling the client when to retry, instead of a generic 500"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=f"Fact-checking service is temporarily unavailable: {str(error)}",
+        headers={"Retry-After": str(max(1, math.ceil(error.retry_after)))}
+    )
+
+def _preflight_text(text: str) -> Tuple[str, Dict]:
+    """
+    Size submitted text locally before any upstream call
+
+    Args:
+        text: Text as submitted
+
+    Returns:
+        Tuple of (text to fact-check, pre-flight report)
+
+    Raises:
+        HTTPException: 413 if the text is over INPUT_MAX_CHARS, or over INPUT_MAX_TOKENS
+            while INPUT_OVERSIZE_ACTION is "reject"
+    """
+    try:
+        return InputBudget.check(text, settings.INPUT_MAX_TOKENS, settings.INPUT_OVERSIZE_ACTION, settings.INPUT_MAX_CHARS)
+    except InputTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
+
+async def _find_prior_result(text: str) -> Optional[Dict]:
+    """
+    Look up an exact (cache) or near-duplicate (MinHash) prior result
+
+    The cache's disk tier is read off the event loop.
+
+    Args:
+        text: Text to fact-check
+
+    Returns:
+        Result dictionary flagged as cached, or None
+    """
+    if settings.FACT_CHECK_CACHE_ENABLED:
+        cached = await run_in_threadpool(fact_check_cache.get, text)
+        if cached is not None:
+            return {**cached, "cached": True}
+
+    if settings.NEAR_DUPLICATE_ENABLED:
+        match = similarity_index.query(text, settings.NEAR_DUPLICATE_THRESHOLD)
+        if match is not None:
+            similar_to, similarity, payload = match
+            return {
+                **payload,
+                "cached": True,
+                "similar_to": similar_to,
+                "similarity": round(similarity, 3)
+            }
+
+    return None
+
+async def _fact_check_text(
+    gemini_service: GeminiService,
+    text: str,
+    force_fresh: bool = False
+) -> Dict:
+    """
+    Fact-check text, reusing an exact or near-duplicate prior result when allowed
+
+    Args:
+        gemini_service: Gemini service
+        text: Text to fact-check
+        force_fresh: Skip both the result cache and near-duplicate reuse
+
+    Returns:
+        Result dictionary with response, citations, the token `usage` of
+        this request, a `cached` flag and, for near-duplicate reuse,
+        `similar_to` / `similarity`
+    """
+    if not force_fresh:
+        prior = await _find_prior_result(text)
+        if prior is not None:
+            return prior
+
+    return await _fact_check_text_fresh(gemini_service, text)
+
+async def _fact_check_text_fresh(gemini_service: GeminiService, text: str) -> Dict:
+    """
+    Fact-check text upstream and cache the result, without looking for a prior one
+
+    Args:
+        gemini_service: Gemini service
+        text: Text to fact-check
+
+    Returns:
+        Result dictionary with response, citations, the token `usage` of
+        this request and `cached` set to False
+    """
+    made_call = False
+
+    async def upstream() -> Dict:
+        nonlocal made_call
+        made_call = True
+        result = await gemini_service.fact_check_text_async(text)
+        if settings.FACT_CHECK_CACHE_ENABLED:
+            await run_in_threadpool(fact_check_cache.set, text, {
+                "response": result["response"],
+                "citations": result["citations"],
+                "structured": result.get("structured")
+            })
+        return result
+
+    # Concurrent identical submissions share one upstream call, billed to the caller that made it
+    result = await gemini_single_flight.do(f"text:{fact_check_cache.make_key(text)}", upstream)
+
+    return {**result, "cached": False, "usage": result["usage"] if made_call else {}}
+
+async def _fact_check_claims(
+    gemini_service: GeminiService,
+    text: str,
+    force_fresh: bool = False
+) -> Optional[Dict]:
+    """
+    Split long text into claims and fact-check them concurrently
+
+    Args:
+        gemini_service: Gemini service
+        text: Long text or transcript
+        force_fresh: Skip cached and near-duplicate results for each claim
+
+    Returns:
+        Merged result dictionary, or None if fewer than two claims were found
+
+    Raises:
+        UpstreamUnavailableError: If every claim failed because the service is unavailable
+    """
+    claims = ClaimExtractor.extract_claims(text, settings.CLAIM_MAX_CLAIMS)
+    if len(claims) < 2:
+        return None
+    skipped = ClaimExtractor.count_claims(text) - len(claims)
+
+    semaphore = asyncio.Semaphore(settings.CLAIM_CHECK_CONCURRENCY)
+
+    async def check(claim: str) -> Dict:
+        async with semaphore:
+            return await _fact_check_text(gemini_service, claim, force_fresh)
+
+    results = await asyncio.gather(*[check(claim) for claim in claims], return_exceptions=True)
+    return ClaimExtractor.merge_results(claims, results, skipped)
+
+async def _fact_check_content(
+    gemini_service: GeminiService,
+    text: str,
+    force_fresh: bool = False
+) -> Dict:
+    """
+    Fact-check text, splitting long inputs into individually checked claims
+
+    The whole text is looked up first, so a resubmitted long input reuses
+    its merged result; the caller indexes this same text.
+
+    Args:
+        gemini_service: Gemini service
+        text: Text or transcript
+        force_fresh: Skip cached and near-duplicate results
+
+    Returns:
+        Result dictionary
+    """
+    if len(text) < settings.CLAIM_SPLIT_MIN_CHARS:
+        return await _fact_check_text(gemini_service, text, force_fresh)
+
+    if not force_fresh:
+        prior = await _find_prior_result(text)
+        if prior is not None:
+            return prior
+
+    merged = await _fact_check_claims(gemini_service, text, force_fresh)
+    if merged is None:
+        return await _fact_check_text_fresh(gemini_service, text)
+
+    # A partial result is not reused; its failed claims are retried next time
+    if settings.FACT_CHECK_CACHE_ENABLED and not any("error" in claim for claim in merged["claims"]):
+        await run_in_threadpool(fact_check_cache.set, text, {
+            "response": merged["response"],
+            "citations": merged["citations"],
+            "claims": merged["claims"],
+            "claims_skipped": merged["claims_skipped"]
+        })
+    return merged
+
+async def _condense_transcript(gemini_service: GeminiService, transcript: str) -> Tuple[str, Optional[Dict], Dict]:
+    """
+    Shorten a long transcript to its factual assertions
+
+    Filler is stripped and repeated sentences dropped, then the most
+    check-worthy sentences are kept within TRANSCRIPT_CONDENSE_MAX_TOKENS.
+    A Gemini summary is only requested when no sentence qualifies (for
+    example a transcript without sentence punctuation).
+
+    Args:
+        gemini_service: Gemini service
+        transcript: Transcript as recognized
+
+    Returns:
+        Tuple of (text to fact-check, condensation report or None, usage of the summary call)
+    """
+    if not settings.TRANSCRIPT_CONDENSE_ENABLED or len(transcript) < settings.TRANSCRIPT_CONDENSE_MIN_CHARS:
+        return transcript, None, {}
+
+    sentences = TranscriptCondenser.clean_sentences(transcript)
+    selected = TranscriptCondenser.condense(sentences, settings.TRANSCRIPT_CONDENSE_MAX_TOKENS)
+    if selected:
+        condensed = " ".join(selected)
+        return condensed, TranscriptCondenser.report(transcript, condensed, "extractive"), {}
+
+    cleaned = " ".join(sentences)
+    if settings.TRANSCRIPT_CONDENSE_SUMMARY_FALLBACK:
+        try:
+            summary, usage = await gemini_service.generate_summary_async(
+                cleaned,
+                max_words=settings.TRANSCRIPT_CONDENSE_MAX_TOKENS * 3 // 4,
+                include_usage=True
+            )
+            if summary and summary.strip():
+                return summary.strip(), TranscriptCondenser.report(transcript, summary.strip(), "summary"), usage
+        except UpstreamUnavailableError:
+            raise
+        except Exception as e:
+            print(f"Warning: Could not summarize transcript, checking it without compression: {e}")
+
+    return cleaned, TranscriptCondenser.report(transcript, cleaned, "filler_only"), {}
+
+async def _fact_check_transcript(
+    gemini_service: GeminiService,
+    transcript: str,
+    force_fresh: bool = False
+) -> Dict:
+    """
+    Fact-check a speech transcript, condensing it first when it is long
+
+    Args:
+        gemini_service: Gemini service
+        transcript: Transcript as recognized (stored unchanged on the record)
+        force_fresh: Skip cached and near-duplicate results
+
+    Returns:
+        Result dictionary with the `checked_text` actually fact-checked, a
+        `preflight` report and, when the transcript was condensed, a
+        `condensation` report
+    """
+    text, condensation, summary_usage = await _condense_transcript(gemini_service, transcript)
+    # A transcript cannot be shortened by the user, so one still over budget is trimmed
+    text, preflight = InputBudget.check(text, settings.INPUT_MAX_TOKENS, "trim")
+    result = await _fact_check_content(gemini_service, text, force_fresh)
+
+    if condensation is None:
+        return {**result, "checked_text": text, "preflight": preflight}
+    return {
+        **result,
+        "usage": GeminiService.combine_usage(result.get("usage"), summary_usage),
+        "checked_text": text,
+        "condensation": condensation,
+        "preflight": preflight
+    }
+
+def _record_usage(user: Dict, upload_type: str, result: Dict) -> Dict:
+    """
+    Account a fact check's Gemini token usage to its user
+
+    Args:
+        user: Authenticated user
+        upload_type: text, image, audio or video
+        result: Result dictionary
+
+    Returns:
+        Usage to store on the fact-check record
+    """
+    usage = GeminiService.combine_usage(result.get("usage"))
+    usage_tracker.record(user["user_id"], upload_type, usage)
+    return usage
+
+def _index_fact_check(fact_check: Dict, text: str, result: Dict):
+    """Make a freshly checked text (exactly as it was looked up) available for near-duplicate reuse"""
+    if settings.NEAR_DUPLICATE_ENABLED and text and not result.get("cached"):
+        payload = {"response": result["response"], "citations": result["citations"]}
+        if result.get("claims"):
+            payload.update(claims=result["claims"], claims_skipped=result.get("claims_skipped"))
+        similarity_index.add(fact_check["fact_check_id"], text, payload)
+
+async def _fact_check_image(gemini_service: GeminiService, file_path: str) -> Dict:
+    """
+    Fact-check an image, sharing one upstream call among identical concurrent uploads
+
+    Args:
+        gemini_service: Gemini service
+        file_path: Uploaded image
+
+    Returns:
+        Result dictionary; `usage` is empty for callers that joined another's call
+    """
+    made_call = False
+
+    async def upstream() -> Dict:
+        nonlocal made_call
+        made_call = True
+        return await gemini_service.fact_check_image_async(file_path)
+
+    file_hash = await run_in_threadpool(FileHandler.compute_file_hash, file_path)
+    result = await gemini_single_flight.do(f"image:{file_hash}", upstream)
+
+    return {**result, "usage": result["usage"] if made_call else {}}
+
+def _find_similar_image(image_hashes: Tuple[int, int]) -> Optional[Dict]:
+    """
+    Look up a perceptually similar, recently fact-checked image
+
+    Args:
+        image_hashes: (phash, dhash) of the uploaded image
+
+    Returns:
+        Result dictionary flagged as cached, or None
+    """
+    match = image_hash_index.query(image_hashes)
+    if match is None:
+        return None
+
+    similar_to, similarity, payload = match
+    return {
+        **payload,
+        "cached": True,
+        "similar_to": similar_to,
+        "similarity": round(similarity, 3)
+    }
+
+def _index_image_fact_check(fact_check: Dict, image_hashes: Optional[Tuple[int, int]], result: Dict):
+    """Make a freshly checked image available for near-duplicate reuse"""
+    if settings.IMAGE_DUPLICATE_ENABLED and image_hashes and not result.get("cached"):
+        image_hash_index.add(
+            fact_check["fact_check_id"],
+            image_hashes,
+            {"response": result["response"], "citations": result["citations"]}
+        )
+
 @router.post("/text", response_model=FactCheckResult)
 async def fact_check_text_only(
     data: dict,
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    gemini_service: GeminiService = Depends(get_gemini_service)
 ):
     """
     Fact-check text directly without file upload
@@ -22,6 +386,7 @@ async def fact_check_text_only(
     Args:
         data: Text content to fact-check
         credentials: JWT token
+        gemini_service: Gemini service bound to the shared client
 
     Returns:
         Fact-check result with citations
@@ -37,43 +402,190 @@ async def fact_check_text_only(
             detail="text is required"
         )
 
-    try:
-        # Initialize Gemini service
-        gemini_service = GeminiService()
+    # Oversized input fails here, before any upstream call
+    checked_text, preflight = _preflight_text(text_content)
 
+    try:
         # Fact-check the text
-        result = gemini_service.fact_check_text(text_content)
+        result = await _fact_check_content(gemini_service, checked_text, bool(data.get("force_fresh")))
         gemini_response = result["response"]
         citations = result["citations"]
 
         # Save fact-check to database
-        fact_check = Database.create_fact_check(
+        fact_check = await run_in_threadpool(
+            Database.create_fact_check,
             user_id=user["user_id"],
             upload_type="text",
             file_path=None,
             extracted_text=text_content,
             gemini_response=gemini_response,
-            citations=citations
+            citations=citations,
+            usage=_record_usage(user, "text", result),
+            preflight=preflight
         )
+        _index_fact_check(fact_check, checked_text, result)
 
         return FactCheckResult(
             fact_check_id=fact_check["fact_check_id"],
             extracted_text=text_content,
             gemini_response=gemini_response,
             citations=citations,
-            timestamp=fact_check["timestamp"]
+            timestamp=fact_check["timestamp"],
+            cached=result["cached"],
+            similar_to=result.get("similar_to"),
+            similarity=result.get("similarity"),
+            claims=result.get("claims"),
+            claims_skipped=result.get("claims_skipped"),
+            condensation=result.get("condensation"),
+            structured=result.get("structured"),
+            preflight=preflight
         )
 
+    except UpstreamUnavailableError as e:
+        raise _upstream_unavailable(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing fact-check: {str(e)}"
         )
 
+def _sse(event: str, data: Dict) -> str:
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@router.post("/text/stream")
+async def fact_check_text_stream(
+    data: dict,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    gemini_service: GeminiService = Depends(get_gemini_service)
+):
+    """
+    Fact-check text and stream the result as Server-Sent Events
+
+    Events: `started`, `verdict` (as soon as the model produces it), `chunk`
+    (analysis text as it arrives), `citations`, then `done` with the saved
+    fact_check_id, or `error`.
+
+    Args:
+        data: Text content to fact-check
+        credentials: JWT token
+        gemini_service: Gemini service bound to the shared client
+
+    Returns:
+        text/event-stream response
+    """
+    # Verify authentication
+    user = await AuthMiddleware.verify_token(credentials)
+
+    text_content = data.get("text")
+
+    if not text_content:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="text is required"
+        )
+
+    force_fresh = bool(data.get("force_fresh"))
+    checked_text, preflight = _preflight_text(text_content)
+
+    async def event_stream() -> AsyncIterator[str]:
+        yield _sse("started", {"preflight": preflight})
+
+        try:
+            result = None if force_fresh else await _find_prior_result(checked_text)
+
+            # Cached and near-duplicate results are replayed as one burst
+            if result is not None:
+                yield _sse("verdict", {"verdict": GeminiService.extract_verdict(result["response"])})
+                yield _sse("chunk", {"text": result["response"]})
+            else:
+                async for event in gemini_service.fact_check_text_stream(checked_text):
+                    if event["event"] == "result":
+                        result = {**event["data"], "cached": False}
+                    else:
+                        yield _sse(event["event"], event["data"])
+
+                if result is None:
+                    yield _sse("error", {"detail": "Error processing fact-check: the model stream ended without a result"})
+                    return
+
+                if settings.FACT_CHECK_CACHE_ENABLED:
+                    await run_in_threadpool(fact_check_cache.set, checked_text, {
+                        "response": result["response"],
+                        "citations": result["citations"]
+                    })
+
+            yield _sse("citations", {"citations": result["citations"]})
+
+            # Save fact-check to database
+            fact_check = await run_in_threadpool(
+                Database.create_fact_check,
+                user_id=user["user_id"],
+                upload_type="text",
+                file_path=None,
+                extracted_text=text_content,
+                gemini_response=result["response"],
+                citations=result["citations"],
+                usage=_record_usage(user, "text", result),
+                preflight=preflight
+            )
+            _index_fact_check(fact_check, checked_text, result)
+
+            yield _sse("done", {
+                "fact_check_id": fact_check["fact_check_id"],
+                "gemini_response": result["response"],
+                "timestamp": fact_check["timestamp"],
+                "cached": result["cached"],
+                "similar_to": result.get("similar_to"),
+                "similarity": result.get("similarity")
+            })
+
+        except Exception as e:
+            yield _sse("error", {"detail": f"Error processing fact-check: {str(e)}"})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+class _ClientDisconnected(Exception):
+    """The client of a streaming request went away while its audio was being transcribed"""
+
+def _transcribe_upload(
+    speech_service: SpeechToTextService,
+    file_path: str,
+    upload_type: str,
+    on_partial: Optional[Callable[[str], None]] = None
+) -> str:
+    """
+    Transcribe an uploaded audio or video file (blocking)
+
+    Args:
+        speech_service: Speech-to-Text service
+        file_path: Uploaded file
+        upload_type: audio or video
+        on_partial: Called with the transcript so far while long audio is streamed
+
+    Returns:
+        Transcribed text
+    """
+    if upload_type == "video":
+        audio_path = VideoProcessor.extract_audio_from_video(file_path)
+    else:
+        audio_path = VideoProcessor.convert_audio_format(file_path)
+
+    try:
+        return speech_service.transcribe_audio(audio_path, on_partial)
+    finally:
+        # Clean up temporary audio file
+        VideoProcessor.cleanup_temp_file(audio_path)
+
 @router.post("/process", response_model=FactCheckResult)
 async def process_fact_check(
     data: dict,
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    gemini_service: GeminiService = Depends(get_gemini_service)
 ):
     """
     Process fact-check for uploaded file
@@ -81,6 +593,7 @@ async def process_fact_check(
     Args:
         data: File path and upload type
         credentials: JWT token
+        gemini_service: Gemini service bound to the shared client
 
     Returns:
         Fact-check result with citations
@@ -101,45 +614,32 @@ async def process_fact_check(
         extracted_text = None
         gemini_response = None
         citations = []
+        result = {}
+        image_hashes = None
 
         # Initialize services
         speech_service = SpeechToTextService()
-        gemini_service = GeminiService()
 
         # Process based on upload type
-        if upload_type == "video":
-            # Extract audio from video
-            audio_path = VideoProcessor.extract_audio_from_video(file_path)
-
-            # Transcribe audio
-            extracted_text = speech_service.transcribe_audio(audio_path)
-
-            # Clean up temporary audio file
-            VideoProcessor.cleanup_temp_file(audio_path)
-
-            # Fact-check the transcribed text
-            result = gemini_service.fact_check_text(extracted_text)
-            gemini_response = result["response"]
-            citations = result["citations"]
-
-        elif upload_type == "audio":
-            # Convert audio to proper format if needed
-            converted_audio = VideoProcessor.convert_audio_format(file_path)
+        if upload_type in ("video", "audio"):
+            # Transcribe the audio (extracted from video, or converted to WAV)
+            extracted_text = await run_in_threadpool(_transcribe_upload, speech_service, file_path, upload_type)
 
-            # Transcribe audio
-            extracted_text = speech_service.transcribe_audio(converted_audio)
-
-            # Clean up temporary file
-            VideoProcessor.cleanup_temp_file(converted_audio)
-
-            # Fact-check the transcribed text
-            result = gemini_service.fact_check_text(extracted_text)
+            # Fact-check the transcribed text (condensed first when long)
+            result = await _fact_check_transcript(gemini_service, extracted_text, bool(data.get("force_fresh")))
             gemini_response = result["response"]
             citations = result["citations"]
 
         elif upload_type == "image":
-            # Fact-check image directly
-            result = gemini_service.fact_check_image(file_path)
+            # Perceptual hashes let recompressed, resized or watermarked re-uploads reuse a prior verdict
+            if settings.IMAGE_DUPLICATE_ENABLED:
+                image_hashes = await run_in_threadpool(compute_image_hashes, file_path)
+                if image_hashes and not data.get("force_fresh"):
+                    result = _find_similar_image(image_hashes) or {}
+
+            if not result:
+                # Fact-check image directly
+                result = await _fact_check_image(gemini_service, file_path)
             gemini_response = result["response"]
             citations = result["citations"]
             extracted_text = None
@@ -151,29 +651,336 @@ async def process_fact_check(
             )
 
         # Save fact-check to database
-        fact_check = Database.create_fact_check(
+        fact_check = await run_in_threadpool(
+            Database.create_fact_check,
             user_id=user["user_id"],
             upload_type=upload_type,
             file_path=file_path,
             extracted_text=extracted_text,
             gemini_response=gemini_response,
-            citations=citations
+            citations=citations,
+            usage=_record_usage(user, upload_type, result),
+            condensation=result.get("condensation"),
+            preflight=result.get("preflight")
         )
+        _index_fact_check(fact_check, result.get("checked_text"), result)
+        _index_image_fact_check(fact_check, image_hashes, result)
 
         return FactCheckResult(
             fact_check_id=fact_check["fact_check_id"],
             extracted_text=extracted_text,
             gemini_response=gemini_response,
             citations=citations,
-            timestamp=fact_check["timestamp"]
+            timestamp=fact_check["timestamp"],
+            cached=result.get("cached", False),
+            similar_to=result.get("similar_to"),
+            similarity=result.get("similarity"),
+            claims=result.get("claims"),
+            claims_skipped=result.get("claims_skipped"),
+            condensation=result.get("condensation"),
+            structured=result.get("structured"),
+            preflight=result.get("preflight")
         )
 
+    except UpstreamUnavailableError as e:
+        raise _upstream_unavailable(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing fact-check: {str(e)}"
         )
 
+@router.post("/process/stream")
+async def process_fact_check_stream(
+    data: dict,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    gemini_service: GeminiService = Depends(get_gemini_service)
+):
+    """
+    Transcribe and fact-check an uploaded audio or video file, streaming progress as Server-Sent Events
+
+    Events: `started`, `partial` (the transcript so far, while long audio is
+    transcribed with SPEECH_STREAMING_ENABLED; it may still be revised),
+    `transcript` with the final text, then `done` with the saved result, or `error`.
+
+    Args:
+        data: File path and upload type (audio or video)
+        credentials: JWT token
+        gemini_service: Gemini service bound to the shared client
+
+    Returns:
+        text/event-stream response
+    """
+    # Verify authentication
+    user = await AuthMiddleware.verify_token(credentials)
+
+    file_path = data.get("file_path")
+    upload_type = data.get("upload_type")
+
+    if not file_path or upload_type not in ("audio", "video"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="file_path and an upload_type of audio or video are required"
+        )
+
+    async def event_stream() -> AsyncIterator[str]:
+        yield _sse("started", {"upload_type": upload_type})
+
+        try:
+            # Partial transcripts arrive on a worker thread and are handed to the event loop
+            loop = asyncio.get_running_loop()
+            partials: asyncio.Queue = asyncio.Queue()
+            client_gone = threading.Event()
+
+            def on_partial(transcript: str):
+                # Raising inside the recognition loop ends a streaming transcription early
+                if client_gone.is_set():
+                    raise _ClientDisconnected("Client disconnected; transcription stopped")
+                loop.call_soon_threadsafe(partials.put_nowait, transcript)
+
+            transcription = asyncio.ensure_future(run_in_threadpool(
+                _transcribe_upload, SpeechToTextService(), file_path, upload_type, on_partial
+            ))
+            partial = None
+
+            try:
+                while True:
+                    partial = asyncio.ensure_future(partials.get())
+                    await asyncio.wait({partial, transcription}, return_when=asyncio.FIRST_COMPLETED)
+                    if not partial.done():
+                        break
+                    yield _sse("partial", {"transcript": partial.result()})
+            finally:
+                # Also reached when the client disconnects and the stream is closed
+                if partial is not None:
+                    partial.cancel()
+                if not transcription.done():
+                    client_gone.set()
+                    # Nobody awaits the transcription any more; retrieve its outcome quietly
+                    transcription.add_done_callback(lambda future: future.cancelled() or future.exception())
+
+            extracted_text = await transcription
+            yield _sse("transcript", {"extracted_text": extracted_text})
+
+            # Fact-check the transcribed text (condensed first when long)
+            result = await _fact_check_transcript(gemini_service, extracted_text, bool(data.get("force_fresh")))
+
+            # Save fact-check to database
+            fact_check = await run_in_threadpool(
+                Database.create_fact_check,
+                user_id=user["user_id"],
+                upload_type=upload_type,
+                file_path=file_path,
+                extracted_text=extracted_text,
+                gemini_response=result["response"],
+                citations=result["citations"],
+                usage=_record_usage(user, upload_type, result),
+                condensation=result.get("condensation"),
+                preflight=result.get("preflight")
+            )
+            _index_fact_check(fact_check, result.get("checked_text"), result)
+
+            yield _sse("done", FactCheckResult(
+                fact_check_id=fact_check["fact_check_id"],
+                extracted_text=extracted_text,
+                gemini_response=result["response"],
+                citations=result["citations"],
+                timestamp=fact_check["timestamp"],
+                cached=result.get("cached", False),
+                similar_to=result.get("similar_to"),
+                similarity=result.get("similarity"),
+                claims=result.get("claims"),
+                claims_skipped=result.get("claims_skipped"),
+                condensation=result.get("condensation"),
+                structured=result.get("structured"),
+                preflight=result.get("preflight")
+            ).model_dump())
+
+        except Exception as e:
+            yield _sse("error", {"detail": f"Error processing fact-check: {str(e)}"})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+async def _run_batch_job(job: Dict, gemini_service: GeminiService, user: Dict, force_fresh: bool):
+    """
+    Fact-check every item of a batch job, then save all results with one write
+
+    Each item is reported done with its verdict as soon as its check
+    returns; its fact_check_id follows once the batch is saved.
+
+    Args:
+        job: Job dictionary (updated in place as items progress)
+        gemini_service: Gemini service
+        user: Job owner
+        force_fresh: Skip cached and near-duplicate results
+    """
+    job["status"] = "running"
+    semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+    results: Dict[int, Dict] = {}
+
+    async def check(item: Dict):
+        async with semaphore:
+            item["status"] = "running"
+            try:
+                result = await _fact_check_content(gemini_service, item["checked_text"], force_fresh)
+            except Exception as e:
+                item["status"] = "error"
+                item["error"] = str(e)
+                return
+            results[item["index"]] = result
+            item.update({
+                "status": "done",
+                "verdict": GeminiService.extract_verdict(result["response"]),
+                "cached": result.get("cached", False),
+                "response": result["response"],
+                "citations": result["citations"]
+            })
+
+    try:
+        await asyncio.gather(*[check(item) for item in job["items"]])
+
+        # One batched commit for every successful item
+        done = [item for item in job["items"] if item["index"] in results]
+        records = [
+            {
+                "user_id": user["user_id"],
+                "upload_type": "text",
+                "file_path": None,
+                "extracted_text": item["text"],
+                "gemini_response": results[item["index"]]["response"],
+                "citations": results[item["index"]]["citations"],
+                "usage": _record_usage(user, "text", results[item["index"]]),
+                "preflight": item.get("preflight")
+            }
+            for item in done
+        ]
+        fact_checks = await run_in_threadpool(Database.bulk_create_fact_checks, records)
+
+        for item, fact_check in zip(done, fact_checks):
+            _index_fact_check(fact_check, item["checked_text"], results[item["index"]])
+            item["fact_check_id"] = fact_check["fact_check_id"]
+
+        job["status"] = "completed"
+
+    except Exception as e:
+        job["status"] = "failed"
+        job["error"] = str(e)
+        for item in job["items"]:
+            if item["status"] != "error":
+                item["status"] = "error"
+                item["error"] = item.get("error") or "Batch could not be saved"
+
+    finally:
+        job["finished_at"] = time.time()
+
+@router.post("/batch", status_code=status.HTTP_202_ACCEPTED)
+async def create_batch_fact_check(
+    data: dict,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    gemini_service: GeminiService = Depends(get_gemini_service)
+):
+    """
+    Queue many texts for fact-checking
+
+    Items are checked concurrently (at most BATCH_CONCURRENCY at a time) and
+    saved together once all of them have finished.
+
+    Args:
+        data: {"texts": [...], "force_fresh": bool}
+        credentials: JWT token
+        gemini_service: Gemini service bound to the shared client
+
+    Returns:
+        Job id to poll with GET /api/fact-check/batch/{job_id}
+    """
+    # Verify authentication
+    user = await AuthMiddleware.verify_token(credentials)
+
+    texts = data.get("texts")
+
+    if not isinstance(texts, list) or not texts:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="texts must be a non-empty list"
+        )
+
+    if len(texts) > settings.BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch may contain at most {settings.BATCH_MAX_ITEMS} texts"
+        )
+
+    if not all(isinstance(text, str) and text.strip() for text in texts):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Every item in texts must be a non-empty string"
+        )
+
+    # The whole batch is refused up front if any item is too large
+    checked = []
+    for index, text in enumerate(texts):
+        try:
+            checked.append(_preflight_text(text))
+        except HTTPException as e:
+            raise HTTPException(status_code=e.status_code, detail=f"Item {index}: {e.detail}")
+
+    job = batch_jobs.create(user["user_id"], texts)
+    for item, (checked_text, preflight) in zip(job["items"], checked):
+        # The original text is stored on the record, as by /text; the trimmed one is checked and indexed
+        item["checked_text"] = checked_text
+        item["preflight"] = preflight
+    batch_jobs.start(job, _run_batch_job(job, gemini_service, user, bool(data.get("force_fresh"))))
+
+    return Helpers.create_response(
+        success=True,
+        message="Batch queued",
+        data={"job_id": job["job_id"], "total": len(texts)}
+    )
+
+@router.get("/batch/{job_id}")
+async def get_batch_fact_check(
+    job_id: str,
+    include_results: bool = True,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """
+    Get the progress and results of a batch job
+
+    Args:
+        job_id: Job id returned by POST /api/fact-check/batch
+        include_results: Include response and citations of finished items
+        credentials: JWT token
+
+    Returns:
+        Job status with per-item progress
+    """
+    # Verify authentication
+    user = await AuthMiddleware.verify_token(credentials)
+
+    job = batch_jobs.get(job_id)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Batch job not found"
+        )
+
+    # Check if user owns this job or is admin
+    if job["user_id"] != user["user_id"] and user["role"] != "Admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+
+    return Helpers.create_response(
+        success=True,
+        data=batch_jobs.progress(job, include_results)
+    )
+
 @router.get("/result/{fact_check_id}")
 async def get_fact_check_result(
     fact_check_id: int,
@@ -0,0 +1,46 @@
+"""
+Online backup of the Data directory
+
+Usage (from the backend directory):
+    python -m scripts.backup              # incremental snapshot
+    python -m scripts.backup --full       # full snapshot
+    python -m scripts.backup --list       # list snapshots
+    python -m scripts.backup --restore <snapshot_id> --target <dir>
+"""
+import argparse
+import sys
+from pathlib import Path
+from services.backup_service import BackupService
+from utils.helpers import Helpers
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Snapshot the CSV tables and upload metadata")
+    parser.add_argument("--full", action="store_true", help="Write every segment instead of only changed ones")
+    parser.add_argument("--list", action="store_true", help="List existing snapshots")
+    parser.add_argument("--restore", metavar="SNAPSHOT_ID", help="Restore the tables of a snapshot")
+    parser.add_argument("--target", type=Path, help="Directory to restore into")
+    args = parser.parse_args()
+
+    if args.list:
+        for snapshot in BackupService.list_snapshots():
+            print(f"{snapshot['snapshot_id']}  {snapshot['type']:<11}  {snapshot['created_at']}")
+        return 0
+
+    if args.restore:
+        if not args.target:
+            parser.error("--restore requires --target")
+        restored = BackupService.restore_snapshot(args.restore, args.target)
+        for name, path in restored.items():
+            print(f"✅ {name}: {path}")
+        return 0
+
+    manifest = BackupService.create_snapshot(incremental=not args.full)
+    stats = manifest["stats"]
+    print(f"✅ Snapshot {manifest['snapshot_id']} ({manifest['type']})")
+    print(f"   Write fence held: {stats['fence_ms']} ms")
+    print(f"   Segments: {stats['segments_total']}, written: {Helpers.format_file_size(stats['bytes_written'])}")
+    print(f"   Uploads recorded: {len(manifest['uploads'])}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Bulk import of historical fact checks or users
+
+Streams CSV or NDJSON input, validates every row against the `models/`
+schemas and writes accepted rows in large batches. Each batch gets one
+block of ids and one append to the table, instead of one full rewrite of
+the CSV per row. Run it while the API is stopped: the CSV tables have no
+cross-process locking.
+
+Usage (from the backend directory):
+    python -m scripts.bulk_import fact_checks legacy_checks.ndjson
+    python -m scripts.bulk_import users legacy_users.csv --batch-size 50000
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+from pydantic import ValidationError
+from models.fact_check import FactCheck
+from models.user import User
+from services.database import Database
+from utils.validators import Validators
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Fact checks come from the text endpoint as well as file uploads
+FACT_CHECK_UPLOAD_TYPES = ["text", "image", "audio", "video"]
+# Rejections echoed to stderr when no --rejects file is given
+MAX_REPORTED_REJECTS = 20
+
+def iter_rows(input_path: Path) -> Iterator[Dict]:
+    """
+    Stream rows from a CSV or NDJSON file without loading it into memory
+
+    Args:
+        input_path: Input file (.csv, .ndjson or .jsonl)
+
+    Yields:
+        One dictionary per input row
+    """
+    if input_path.suffix.lower() == ".csv":
+        with open(input_path, "r", encoding="utf-8", newline="") as f:
+            yield from csv.DictReader(f)
+    else:
+        with open(input_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+def validate_fact_check(row: Dict) -> Dict:
+    """
+    Validate a fact check row against the FactCheck schema
+
+    Args:
+        row: Raw input row
+
+    Returns:
+        Record ready for Database.bulk_create_fact_checks
+    """
+    citations = row.get("citations") or []
+    if isinstance(citations, str):
+        citations = json.loads(citations)
+
+    # Ids are allocated on write; 0 is a placeholder for validation only
+    fact_check = FactCheck(
+        fact_check_id=0,
+        user_id=row.get("user_id"),
+        upload_type=row.get("upload_type"),
+        file_path=row.get("file_path") or "",
+        extracted_text=row.get("extracted_text") or None,
+        gemini_response=row.get("gemini_response"),
+        citations=json.dumps(citations),
+        timestamp=row.get("timestamp")
+    )
+
+    if fact_check.upload_type not in FACT_CHECK_UPLOAD_TYPES:
+        raise ValueError(
+            f"Invalid upload_type: {fact_check.upload_type!r} (expected one of {', '.join(FACT_CHECK_UPLOAD_TYPES)})"
+        )
+
+    return {
+        "user_id": fact_check.user_id,
+        "upload_type": fact_check.upload_type,
+        "file_path": fact_check.file_path,
+        "extracted_text": fact_check.extracted_text,
+        "gemini_response": fact_check.gemini_response,
+        "citations": citations,
+        "timestamp": fact_check.timestamp.strftime(TIMESTAMP_FORMAT)
+    }
+
+def validate_user(row: Dict, seen_emails: Set[str]) -> Dict:
+    """
+    Validate a user row against the User schema
+
+    Args:
+        row: Raw input row
+        seen_emails: Emails already present or imported
+
+    Returns:
+        Record ready for Database.bulk_create_users
+    """
+    user = User(
+        user_id=0,
+        email=row.get("email"),
+        password_hash=row.get("password_hash"),
+        role=row.get("role"),
+        created_at=row.get("created_at"),
+        last_login=row.get("last_login") or row.get("created_at")
+    )
+
+    if not Validators.validate_email(user.email):
+        raise ValueError(f"Invalid email format: {user.email}")
+    if not Validators.validate_role(user.role):
+        raise ValueError(f"Invalid role: {user.role}")
+    if user.email in seen_emails:
+        raise ValueError(f"Duplicate email: {user.email}")
+    seen_emails.add(user.email)
+
+    return {
+        "email": user.email,
+        "password_hash": user.password_hash,
+        "role": user.role,
+        "created_at": user.created_at.strftime(TIMESTAMP_FORMAT),
+        "last_login": user.last_login.strftime(TIMESTAMP_FORMAT)
+    }
+
+def run_import(
+    table: str,
+    input_path: Path,
+    batch_size: int,
+    rejects_path: Optional[Path] = None
+) -> Dict:
+    """
+    Import rows into a table in batches
+
+    Args:
+        table: "fact_checks" or "users"
+        input_path: Input CSV/NDJSON file
+        batch_size: Rows per write
+        rejects_path: Optional NDJSON file collecting rejected rows
+
+    Returns:
+        Import statistics
+    """
+    if table == "users":
+        seen_emails = {user["email"] for user in Database.get_all_users()}
+        validate = lambda row: validate_user(row, seen_emails)
+        write_batch = Database.bulk_create_users
+    else:
+        validate = validate_fact_check
+        write_batch = Database.bulk_create_fact_checks
+
+    stats = {"read": 0, "imported": 0, "rejected": 0, "batches": 0}
+    batch: List[Dict] = []
+    rejects = open(rejects_path, "w", encoding="utf-8") if rejects_path else None
+    started = time.perf_counter()
+
+    def flush():
+        write_batch(batch)
+        stats["imported"] += len(batch)
+        stats["batches"] += 1
+        elapsed = time.perf_counter() - started
+        print(f"   {stats['imported']:>10} rows  {stats['imported'] / elapsed:>10.0f} rows/s", flush=True)
+        batch.clear()
+
+    try:
+        for row in iter_rows(input_path):
+            stats["read"] += 1
+            try:
+                batch.append(validate(row))
+            except (ValidationError, ValueError, TypeError) as e:
+                stats["rejected"] += 1
+                if rejects:
+                    rejects.write(json.dumps({"line": stats["read"], "error": str(e), "row": row}) + "\n")
+                elif stats["rejected"] <= MAX_REPORTED_REJECTS:
+                    print(f"   ⚠️  Line {stats['read']} rejected: {e}", file=sys.stderr)
+                continue
+
+            if len(batch) >= batch_size:
+                flush()
+
+        if batch:
+            flush()
+    finally:
+        if rejects:
+            rejects.close()
+
+    stats["seconds"] = round(time.perf_counter() - started, 3)
+    stats["rows_per_second"] = round(stats["imported"] / stats["seconds"], 1) if stats["seconds"] else 0.0
+    return stats
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk import fact checks or users from CSV/NDJSON")
+    parser.add_argument("table", choices=["fact_checks", "users"])
+    parser.add_argument("input", type=Path, help="Input .csv, .ndjson or .jsonl file")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Rows per batched write (default: 10000)")
+    parser.add_argument("--rejects", type=Path, help="Write rejected rows with their errors to this NDJSON file")
+    args = parser.parse_args()
+
+    if not args.input.exists():
+        parser.error(f"Input file not found: {args.input}")
+
+    print(f"📥 Importing {args.table} from {args.input}")
+    stats = run_import(args.table, args.input, args.batch_size, args.rejects)
+
+    print(f"✅ Imported {stats['imported']} of {stats['read']} rows in {stats['batches']} batches")
+    print(f"   Rejected: {stats['rejected']}")
+    print(f"   Throughput: {stats['rows_per_second']} rows/s ({stats['seconds']} s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
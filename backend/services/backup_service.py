@@ -0,0 +1,290 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from config.settings import settings
+from services.database import Database
+
+class BackupService:
+    """Online point-in-time backups of the CSV tables and upload metadata"""
+
+    # Only one snapshot runs at a time; writers are fenced separately
+    _backup_lock = threading.Lock()
+
+    @staticmethod
+    def _tables() -> Dict[str, Path]:
+        """Tables included in every snapshot"""
+        return {
+            "users": settings.USERS_CSV,
+            "fact_checks": settings.FACT_CHECKS_CSV,
+            "admin_comments": settings.ADMIN_COMMENTS_CSV,
+            "usage_daily": settings.USAGE_CSV,
+        }
+
+    @staticmethod
+    def _freeze_tables(staging_dir: Path) -> Tuple[Dict[str, Tuple[Path, int]], List[Dict]]:
+        """
+        Capture the current generation of every table under a short write fence.
+
+        `Database._write_csv` replaces table files atomically, so a hard link
+        pins the current generation without copying any data. A plain copy
+        is used where hard links are not supported. Bulk writers append in
+        place, so the length at fence time is recorded and is the end of
+        the snapshot. The fence is a file lock, so writers in other
+        processes (API workers, bulk imports) are held back too. Upload
+        metadata is listed inside the same fence.
+
+        Args:
+            staging_dir: Directory to hold the frozen table files
+
+        Returns:
+            Tuple of (mapping of table name to (frozen file, length in bytes), upload metadata)
+        """
+        frozen = {}
+        staging_dir.mkdir(parents=True, exist_ok=True)
+
+        with Database.write_fence():
+            for name, path in BackupService._tables().items():
+                if not path.exists():
+                    continue
+                target = staging_dir / f"{name}.csv"
+                length = path.stat().st_size
+                try:
+                    os.link(path, target)
+                except OSError:
+                    shutil.copy2(path, target)
+                frozen[name] = (target, length)
+            uploads = BackupService._collect_upload_metadata()
+
+        return frozen, uploads
+
+    @staticmethod
+    def _collect_upload_metadata() -> List[Dict]:
+        """
+        List uploaded files with their size and modification time
+
+        Returns:
+            List of upload metadata dictionaries
+        """
+        uploads = []
+        upload_folder = settings.UPLOAD_FOLDER
+
+        if not upload_folder.exists():
+            return uploads
+
+        for file in sorted(upload_folder.rglob("*")):
+            if not file.is_file() or file.name == ".gitkeep":
+                continue
+            stat = file.stat()
+            uploads.append({
+                "path": file.relative_to(upload_folder).as_posix(),
+                "size": stat.st_size,
+                "modified": stat.st_mtime
+            })
+
+        return uploads
+
+    @staticmethod
+    def _write_segments(
+        file_path: Path,
+        length: int,
+        snapshot_dir: Path,
+        known_segments: Dict[str, str]
+    ) -> Dict:
+        """
+        Split a frozen table into fixed-size segments and store new ones
+
+        Args:
+            file_path: Frozen table file
+            length: Number of bytes belonging to the snapshot
+            snapshot_dir: Directory of the snapshot being written
+            known_segments: Segment hash -> snapshot id already holding it
+
+        Returns:
+            Table entry for the manifest
+        """
+        segment_size = settings.BACKUP_SEGMENT_SIZE_KB * 1024
+        segments_dir = snapshot_dir / "segments"
+        file_hash = hashlib.sha256()
+        segments = []
+        bytes_written = 0
+
+        remaining = length
+
+        with open(file_path, "rb") as f:
+            while remaining > 0:
+                block = f.read(min(segment_size, remaining))
+                if not block:
+                    break
+                remaining -= len(block)
+
+                file_hash.update(block)
+                digest = hashlib.sha256(block).hexdigest()
+                stored_in = known_segments.get(digest)
+
+                if stored_in is None:
+                    segments_dir.mkdir(exist_ok=True)
+                    with open(segments_dir / digest, "wb") as out:
+                        out.write(block)
+                    stored_in = snapshot_dir.name
+                    known_segments[digest] = stored_in
+                    bytes_written += len(block)
+
+                segments.append({
+                    "sha256": digest,
+                    "size": len(block),
+                    "snapshot": stored_in
+                })
+
+        return {
+            "size": length - remaining,
+            "sha256": file_hash.hexdigest(),
+            "segments": segments,
+            "bytes_written": bytes_written
+        }
+
+    @staticmethod
+    def _read_manifest(snapshot_id: str) -> Optional[Dict]:
+        """Read a snapshot manifest, or None if it does not exist"""
+        manifest_path = settings.BACKUP_FOLDER / snapshot_id / "manifest.json"
+        if not manifest_path.exists():
+            return None
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def list_snapshots() -> List[Dict]:
+        """
+        List completed snapshots, oldest first
+
+        Returns:
+            List of manifest summaries
+        """
+        snapshots = []
+        if not settings.BACKUP_FOLDER.exists():
+            return snapshots
+
+        for snapshot_dir in sorted(settings.BACKUP_FOLDER.iterdir()):
+            if not snapshot_dir.is_dir() or snapshot_dir.name.startswith("."):
+                continue
+            manifest = BackupService._read_manifest(snapshot_dir.name)
+            if not manifest:
+                continue
+            snapshots.append({
+                "snapshot_id": manifest["snapshot_id"],
+                "created_at": manifest["created_at"],
+                "type": manifest["type"],
+                "parent": manifest.get("parent"),
+                "stats": manifest.get("stats", {})
+            })
+
+        return snapshots
+
+    @staticmethod
+    def create_snapshot(incremental: bool = True) -> Dict:
+        """
+        Create a consistent point-in-time backup without pausing writers.
+
+        Writers are fenced only while the current table generations are
+        pinned; segmenting, hashing and copying happen afterwards. An
+        incremental snapshot stores only the segments that are not already
+        held by the previous snapshot chain.
+
+        Args:
+            incremental: Reuse segments from the latest snapshot when possible
+
+        Returns:
+            Snapshot manifest
+        """
+        with BackupService._backup_lock:
+            snapshot_id = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:6]}"
+            snapshot_dir = settings.BACKUP_FOLDER / snapshot_id
+            staging_dir = settings.BACKUP_FOLDER / ".staging" / snapshot_id
+
+            parent = None
+            known_segments: Dict[str, str] = {}
+            if incremental:
+                previous = BackupService.list_snapshots()
+                if previous:
+                    parent = BackupService._read_manifest(previous[-1]["snapshot_id"])
+                    for table in parent["tables"].values():
+                        for segment in table["segments"]:
+                            known_segments[segment["sha256"]] = segment["snapshot"]
+
+            try:
+                fence_started = time.perf_counter()
+                frozen, uploads = BackupService._freeze_tables(staging_dir)
+                fence_ms = (time.perf_counter() - fence_started) * 1000
+
+                snapshot_dir.mkdir(parents=True)
+                tables = {}
+                for name, (frozen_path, length) in frozen.items():
+                    tables[name] = BackupService._write_segments(
+                        frozen_path, length, snapshot_dir, known_segments
+                    )
+            finally:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+
+            manifest = {
+                "snapshot_id": snapshot_id,
+                "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "type": "incremental" if parent else "full",
+                "parent": parent["snapshot_id"] if parent else None,
+                "tables": tables,
+                "uploads": uploads,
+                "stats": {
+                    "fence_ms": round(fence_ms, 3),
+                    "segments_total": sum(len(t["segments"]) for t in tables.values()),
+                    "bytes_written": sum(t["bytes_written"] for t in tables.values())
+                }
+            }
+
+            # Manifest is written last so a crashed snapshot is never listed
+            temp_manifest = snapshot_dir / "manifest.json.tmp"
+            with open(temp_manifest, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(temp_manifest, snapshot_dir / "manifest.json")
+
+            return manifest
+
+    @staticmethod
+    def restore_snapshot(snapshot_id: str, target_dir: Path) -> Dict[str, Path]:
+        """
+        Reassemble the tables of a snapshot into a directory
+
+        Args:
+            snapshot_id: Snapshot to restore
+            target_dir: Directory to write the restored CSV files to
+
+        Returns:
+            Mapping of table name to restored file
+        """
+        manifest = BackupService._read_manifest(snapshot_id)
+        if not manifest:
+            raise ValueError(f"Snapshot not found: {snapshot_id}")
+
+        target_dir.mkdir(parents=True, exist_ok=True)
+        restored = {}
+
+        for name, table in manifest["tables"].items():
+            file_hash = hashlib.sha256()
+            target = target_dir / f"{name}.csv"
+            with open(target, "wb") as out:
+                for segment in table["segments"]:
+                    segment_path = settings.BACKUP_FOLDER / segment["snapshot"] / "segments" / segment["sha256"]
+                    with open(segment_path, "rb") as f:
+                        block = f.read()
+                    file_hash.update(block)
+                    out.write(block)
+
+            if file_hash.hexdigest() != table["sha256"]:
+                raise ValueError(f"Checksum mismatch restoring table {name} from {snapshot_id}")
+            restored[name] = target
+
+        return restored
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+from config.settings import settings
+
+class BatchJobManager:
+    """In-memory registry of batch fact-check jobs and their per-item progress"""
+
+    def __init__(self, ttl_seconds: float):
+        """
+        Initialize the registry
+
+        Args:
+            ttl_seconds: Finished jobs older than this are dropped
+        """
+        self.ttl_seconds = ttl_seconds
+        self._jobs: Dict[str, Dict] = {}
+        # Running tasks are referenced here so they are not garbage collected
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._lock = threading.Lock()
+
+    def _expire_locked(self):
+        oldest_allowed = time.time() - self.ttl_seconds
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job["finished_at"] and job["finished_at"] < oldest_allowed]:
+            del self._jobs[job_id]
+
+    def create(self, user_id: int, texts: List[str]) -> Dict:
+        """
+        Register a new job
+
+        Args:
+            user_id: Owner of the job
+            texts: Texts to fact-check
+
+        Returns:
+            Job dictionary
+        """
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "user_id": user_id,
+            "status": "queued",
+            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "finished_at": None,
+            "error": None,
+            "items": [
+                {"index": index, "text": text, "status": "pending"}
+                for index, text in enumerate(texts)
+            ]
+        }
+
+        with self._lock:
+            self._expire_locked()
+            self._jobs[job["job_id"]] = job
+
+        return job
+
+    def start(self, job: Dict, coroutine):
+        """Run a job's coroutine in the background"""
+        task = asyncio.create_task(coroutine)
+        self._tasks[job["job_id"]] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job["job_id"], None))
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Get a job by id"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    @staticmethod
+    def progress(job: Dict, include_results: bool = True) -> Dict:
+        """
+        Summarize a job for the status endpoint
+
+        Args:
+            job: Job dictionary
+            include_results: Include response and citations of finished items
+
+        Returns:
+            Job status with counts and per-item progress
+        """
+        counts = {"pending": 0, "running": 0, "done": 0, "error": 0}
+        items = []
+        for item in job["items"]:
+            counts[item["status"]] += 1
+            view = {key: value for key, value in item.items() if key not in ("text", "checked_text")}
+            if not include_results:
+                view.pop("response", None)
+                view.pop("citations", None)
+            items.append(view)
+
+        return {
+            "job_id": job["job_id"],
+            "status": job["status"],
+            "created_at": job["created_at"],
+            "error": job["error"],
+            "total": len(job["items"]),
+            "completed": counts["done"] + counts["error"],
+            "counts": counts,
+            "items": items
+        }
+
+# Shared job registry
+batch_jobs = BatchJobManager(ttl_seconds=settings.BATCH_JOB_TTL_HOURS * 3600)
@@ -0,0 +1,192 @@
+import re
+from typing import Dict, List, Tuple
+from services.gemini_service import GeminiService
+from services.resilience import UpstreamUnavailableError
+from utils.helpers import Helpers
+
+# Signals that a sentence asserts something checkable
+_NUMBER_PATTERN = re.compile(r"\d|\b(?:percent|million|billion|thousand|hundred|half|twice|double|triple)\b", re.IGNORECASE)
+_FACTUAL_VERB_PATTERN = re.compile(
+    r"\b(?:is|are|was|were|has|have|had|will|causes?|caused|cures?|cured|kills?|killed|"
+    r"increases?|increased|decreases?|decreased|reduces?|reduced|prevents?|prevented|"
+    r"contains?|shows?|showed|proves?|proved|found|announced|reported|banned|approved|won|lost)\b",
+    re.IGNORECASE
+)
+_SUPERLATIVE_PATTERN = re.compile(r"\b(?:most|least|first|last|only|largest|smallest|highest|lowest|biggest|never|always|every|all)\b", re.IGNORECASE)
+_ATTRIBUTION_PATTERN = re.compile(r"\b(?:according to|study|studies|research|scientists|experts|doctors|government|officials|data|report|survey)\b", re.IGNORECASE)
+_OPINION_PATTERN = re.compile(r"\b(?:i think|i feel|i believe|in my opinion|i guess|maybe|perhaps|subscribe|like and share|thank you|thanks for watching)\b", re.IGNORECASE)
+_SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+|\n+")
+
+class ClaimExtractor:
+    """Split long transcripts into individual check-worthy claims"""
+
+    MIN_CLAIM_WORDS = 6
+
+    @staticmethod
+    def split_sentences(text: str) -> List[str]:
+        """
+        Split text into sentences
+
+        Args:
+            text: Transcript or long text
+
+        Returns:
+            List of non-empty sentences
+        """
+        return [sentence.strip() for sentence in _SENTENCE_SPLIT_PATTERN.split(text) if sentence.strip()]
+
+    @staticmethod
+    def score_sentence(sentence: str) -> int:
+        """
+        Score how check-worthy a sentence is
+
+        Args:
+            sentence: A single sentence
+
+        Returns:
+            Score; 0 means not worth checking
+        """
+        words = sentence.split()
+        if len(words) < ClaimExtractor.MIN_CLAIM_WORDS or sentence.endswith("?"):
+            return 0
+        if _OPINION_PATTERN.search(sentence):
+            return 0
+
+        score = 0
+        if _NUMBER_PATTERN.search(sentence):
+            score += 2
+        if _FACTUAL_VERB_PATTERN.search(sentence):
+            score += 1
+        if _SUPERLATIVE_PATTERN.search(sentence):
+            score += 1
+        if _ATTRIBUTION_PATTERN.search(sentence):
+            score += 1
+        # Capitalized words after the first usually name people, places or organisations
+        if any(word[:1].isupper() for word in words[1:]):
+            score += 1
+
+        return score if score >= 2 else 0
+
+    @staticmethod
+    def _scored_sentences(text: str) -> List[Tuple[int, int, str]]:
+        """(score, position, sentence) of every distinct check-worthy sentence"""
+        scored = []
+        seen = set()
+
+        for position, sentence in enumerate(ClaimExtractor.split_sentences(text)):
+            normalized = Helpers.normalize_claim_text(sentence)
+            if normalized in seen:
+                continue
+            seen.add(normalized)
+
+            score = ClaimExtractor.score_sentence(sentence)
+            if score:
+                scored.append((score, position, sentence))
+
+        return scored
+
+    @staticmethod
+    def count_claims(text: str) -> int:
+        """
+        Count the distinct check-worthy sentences, before any limit
+
+        Args:
+            text: Transcript or long text
+
+        Returns:
+            Number of candidate claims
+        """
+        return len(ClaimExtractor._scored_sentences(text))
+
+    @staticmethod
+    def extract_claims(text: str, max_claims: int) -> List[str]:
+        """
+        Extract the most check-worthy claims, in their original order
+
+        Args:
+            text: Transcript or long text
+            max_claims: Maximum number of claims to return
+
+        Returns:
+            List of claim sentences
+        """
+        scored = ClaimExtractor._scored_sentences(text)
+        top = sorted(scored, key=lambda item: (-item[0], item[1]))[:max_claims]
+        return [sentence for _, _, sentence in sorted(top, key=lambda item: item[1])]
+
+    @staticmethod
+    def merge_results(claims: List[str], results: List[Dict], skipped: int = 0) -> Dict:
+        """
+        Merge per-claim fact-check results into a single record
+
+        Args:
+            claims: Claim sentences
+            results: Result dictionary or exception per claim, as returned by
+                gather(return_exceptions=True); a cancelled claim counts as not checked
+            skipped: Check-worthy sentences left out by the claim limit
+
+        Returns:
+            Result dictionary with combined response, de-duplicated
+            citations tagged with their claim, summed token usage, a
+            per-claim breakdown and the number of claims skipped
+
+        Raises:
+            UpstreamUnavailableError: If no claim could be checked because the service is unavailable
+            Exception: If no claim could be checked for another reason
+        """
+        claim_results = []
+        citations = []
+        seen_urls = {}
+        sections = []
+
+        for index, (claim, result) in enumerate(zip(claims, results), start=1):
+            if isinstance(result, BaseException):
+                error = str(result) or type(result).__name__
+                claim_results.append({"claim": claim, "verdict": "Not checked", "error": error, "citations": []})
+                sections.append(f"**Claim {index}:** \"{claim}\"\nThis claim could not be checked: {error}")
+                continue
+
+            verdict = GeminiService.extract_verdict(result["response"])
+            claim_citations = []
+            for citation in result["citations"]:
+                claim_citations.append(citation)
+                if citation["url"] in seen_urls:
+                    seen_urls[citation["url"]]["claims"].append(index)
+                else:
+                    merged = {**citation, "claims": [index]}
+                    seen_urls[citation["url"]] = merged
+                    citations.append(merged)
+
+            claim_results.append({
+                "claim": claim,
+                "verdict": verdict,
+                "response": result["response"],
+                "citations": claim_citations,
+                "cached": result.get("cached", False)
+            })
+            sections.append(f"**Claim {index}:** \"{claim}\"\n{result['response']}")
+
+        checked = [claim for claim in claim_results if "error" not in claim]
+        if not checked:
+            unavailable = [result for result in results if isinstance(result, UpstreamUnavailableError)]
+            if unavailable:
+                raise unavailable[0]
+            raise Exception("None of the extracted claims could be fact-checked")
+
+        verdict_lines = "; ".join(f"Claim {i}: {claim['verdict']}" for i, claim in enumerate(claim_results, start=1))
+        skipped_note = f" {skipped} more check-worthy sentences were not checked." if skipped else ""
+        response = (
+            f"**VERDICT:** {len(checked)} of {len(claims)} claims checked individually.{skipped_note} {verdict_lines}\n\n"
+            + "\n\n".join(sections)
+        )
+
+        return {
+            "response": response,
+            "citations": citations,
+            "usage": GeminiService.combine_usage(*(
+                result.get("usage") for result in results if not isinstance(result, BaseException)
+            )),
+            "claims": claim_results,
+            "claims_skipped": skipped,
+            "cached": all(claim.get("cached") for claim in checked)
+        }
@@ -0,0 +1,201 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from google.genai import errors as genai_errors
+from google.genai import types
+from config.settings import settings
+
+# What the caller that finds an entry missing or about to expire has to do
+_CREATE = "create"
+_REFRESH = "refresh"
+
+class ContextCache:
+    """
+    Provider-side cached contents holding fixed system instructions.
+
+    One cached content per key (model, instruction variant) stores the
+    system instruction and tools, and requests reference it by name instead
+    of resending them. The first caller to see an entry within the refresh
+    margin extends its TTL while the others keep using it. When the provider
+    refuses to create one (caching not supported by the model, instructions
+    below the minimum cacheable size, a stand-in server without the
+    endpoint), the key stays uncached for a retry period and requests carry
+    the instructions inline.
+    """
+
+    def __init__(self, ttl_seconds: float, refresh_margin_seconds: float, retry_seconds: float):
+        """
+        Initialize an empty cache table
+
+        Args:
+            ttl_seconds: Lifetime requested for each cached content
+            refresh_margin_seconds: Renew entries this long before they expire
+            retry_seconds: Wait after a failed creation before trying again
+        """
+        self.ttl_seconds = ttl_seconds
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self.retry_seconds = retry_seconds
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._failed_until: Dict[str, float] = {}
+        self._busy = set()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "created": 0, "refreshed": 0, "failures": 0, "uncached": 0, "invalidated": 0}
+
+    def _ttl(self) -> str:
+        return f"{int(self.ttl_seconds)}s"
+
+    def _plan(self, key: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Decide how a request for `key` is served
+
+        Returns:
+            Tuple of (cached content name usable now or None, maintenance this caller must do or None)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            valid = entry is not None and now < entry["expires_at"]
+
+            if key in self._busy or (not valid and now < self._failed_until.get(key, 0)):
+                self._stats["hits" if valid else "uncached"] += 1
+                return (entry["name"] if valid else None), None
+
+            if not valid:
+                self._busy.add(key)
+                return None, _CREATE
+
+            if now >= entry["expires_at"] - self.refresh_margin_seconds:
+                self._busy.add(key)
+                return entry["name"], _REFRESH
+
+            self._stats["hits"] += 1
+            return entry["name"], None
+
+    def _stored(self, key: str, cached: types.CachedContent, action: str) -> str:
+        """Record a created or refreshed cached content and release the key"""
+        lifetime = self.ttl_seconds
+        if cached.expire_time:
+            expire_time = cached.expire_time
+            if expire_time.tzinfo is None:
+                expire_time = expire_time.replace(tzinfo=timezone.utc)
+            lifetime = (expire_time - datetime.now(timezone.utc)).total_seconds()
+
+        with self._lock:
+            self._entries[key] = {"name": cached.name, "expires_at": time.monotonic() + lifetime}
+            self._failed_until.pop(key, None)
+            self._busy.discard(key)
+            self._stats["created" if action == _CREATE else "refreshed"] += 1
+        return cached.name
+
+    def _failed(self, key: str, error: Exception, name: Optional[str]) -> Optional[str]:
+        """Release the key after a failed creation or refresh; an unexpired entry stays usable"""
+        with self._lock:
+            self._busy.discard(key)
+            self._stats["failures"] += 1
+            if name is None:
+                self._failed_until[key] = time.monotonic() + self.retry_seconds
+        print(f"Warning: Could not cache instructions '{key}', sending them inline: {error}")
+        return name
+
+    def _create_config(self, system_instruction: str, tools: List) -> types.CreateCachedContentConfig:
+        return types.CreateCachedContentConfig(
+            system_instruction=system_instruction,
+            tools=tools,
+            ttl=self._ttl(),
+            display_name="fact-check-instructions"
+        )
+
+    def get(self, client, model: str, key: str, system_instruction: str, tools: List) -> Optional[str]:
+        """
+        Name of the cached content for `key`, creating or refreshing it when due
+
+        Args:
+            client: genai.Client
+            model: Model the cached content is created for
+            key: Cache key (one per model and instruction variant)
+            system_instruction: Instruction text to cache
+            tools: Tools the cached requests use
+
+        Returns:
+            Cached content name, or None when the instructions must be sent inline
+        """
+        name, action = self._plan(key)
+        if action is None:
+            return name
+
+        try:
+            if action == _REFRESH:
+                try:
+                    cached = client.caches.update(name=name, config=types.UpdateCachedContentConfig(ttl=self._ttl()))
+                except genai_errors.ClientError:
+                    # Gone early (deleted or expired upstream); start over
+                    action = _CREATE
+                    cached = client.caches.create(model=model, config=self._create_config(system_instruction, tools))
+            else:
+                cached = client.caches.create(model=model, config=self._create_config(system_instruction, tools))
+        except Exception as e:
+            return self._failed(key, e, name)
+
+        return self._stored(key, cached, action)
+
+    async def get_async(self, client, model: str, key: str, system_instruction: str, tools: List) -> Optional[str]:
+        """
+        Async twin of get(), using the client's aio interface
+
+        Returns:
+            Cached content name, or None when the instructions must be sent inline
+        """
+        name, action = self._plan(key)
+        if action is None:
+            return name
+
+        try:
+            if action == _REFRESH:
+                try:
+                    cached = await client.aio.caches.update(name=name, config=types.UpdateCachedContentConfig(ttl=self._ttl()))
+                except genai_errors.ClientError:
+                    action = _CREATE
+                    cached = await client.aio.caches.create(model=model, config=self._create_config(system_instruction, tools))
+            else:
+                cached = await client.aio.caches.create(model=model, config=self._create_config(system_instruction, tools))
+        except Exception as e:
+            return self._failed(key, e, name)
+        except BaseException:
+            # Cancelled mid-call; let the next request retry the maintenance
+            with self._lock:
+                self._busy.discard(key)
+            raise
+
+        return self._stored(key, cached, action)
+
+    def invalidate(self, key: str):
+        """Forget the entry for `key` (e.g. the provider no longer knows its name)"""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._stats["invalidated"] += 1
+
+    def clear(self):
+        """Forget all entries and failures and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._failed_until.clear()
+            self._stats = dict.fromkeys(self._stats, 0)
+
+    def stats(self) -> Dict:
+        """
+        Cache counters
+
+        Returns:
+            Requests served from cached contents (hits) or inline while a key is unavailable (uncached),
+            creations, refreshes, failures, invalidations and live entries
+        """
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
+
+# Shared instance for the grounded fact-check instructions
+context_cache = ContextCache(
+    ttl_seconds=settings.GEMINI_CONTEXT_CACHE_TTL_SECONDS,
+    refresh_margin_seconds=settings.GEMINI_CONTEXT_CACHE_REFRESH_MARGIN_SECONDS,
+    retry_seconds=settings.GEMINI_CONTEXT_CACHE_RETRY_SECONDS
+)
@@ -1,13 +1,77 @@
 import pandas as pd
 import json
+import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional, List, Dict
 from pathlib import Path
 from config.settings import settings
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 class Database:
     """CSV-based database operations"""
 
+    # Serializes read-modify-write cycles on the CSV tables within this
+    # process; write_fence() adds a file lock shared with other processes
+    # (API workers, the backup and bulk import scripts). Backups hold the
+    # fence briefly to take a consistent point-in-time view.
+    _write_lock = threading.RLock()
+    _fence_depth = 0
+    _fence_file = None
+
+    # Highest id handed out per table, so ids allocated in blocks by bulk
+    # writers are never reissued by the single-row create_* methods
+    _id_high_water: Dict[str, int] = {}
+
+    @staticmethod
+    def _lock_file():
+        """Open and exclusively lock Data/.write.lock, waiting for other processes"""
+        settings.DATA_FOLDER.mkdir(parents=True, exist_ok=True)
+        handle = open(settings.DATA_FOLDER / ".write.lock", "a+b")
+        try:
+            if fcntl:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        except Exception:
+            handle.close()
+            raise
+        return handle
+
+    @staticmethod
+    def _unlock_file(handle):
+        try:
+            if fcntl:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            handle.close()
+
+    @staticmethod
+    @contextmanager
+    def write_fence():
+        """Block table writers in every process for the duration of the context (re-entrant)"""
+        with Database._write_lock:
+            if Database._fence_depth == 0:
+                Database._fence_file = Database._lock_file()
+            Database._fence_depth += 1
+            try:
+                yield
+            finally:
+                Database._fence_depth -= 1
+                if Database._fence_depth == 0:
+                    Database._unlock_file(Database._fence_file)
+                    Database._fence_file = None
+
     @staticmethod
     def _ensure_file_exists(file_path: Path, headers: List[str]):
         """Ensure CSV file exists with headers"""
@@ -26,8 +90,87 @@ class Database:
 
     @staticmethod
     def _write_csv(df: pd.DataFrame, file_path: Path):
-        """Write DataFrame to CSV"""
-        df.to_csv(file_path, index=False)
+        """Write DataFrame to CSV atomically (write temp file, then rename)"""
+        temp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
+        with Database.write_fence():
+            df.to_csv(temp_path, index=False)
+            os.replace(temp_path, file_path)
+
+    @staticmethod
+    def _allocate_ids(
+        file_path: Path,
+        id_column: str,
+        count: int = 1,
+        df: Optional[pd.DataFrame] = None
+    ) -> int:
+        """
+        Allocate a block of consecutive ids for a table (caller holds the write fence)
+
+        Args:
+            file_path: Table CSV path
+            id_column: Name of the id column
+            count: Number of ids to allocate
+            df: Freshly read table, if the caller already has it
+
+        Returns:
+            First id of the allocated block
+        """
+        key = str(file_path)
+        high = Database._id_high_water.get(key)
+
+        # Other processes may have added rows since the last allocation
+        if df is None:
+            try:
+                df = pd.read_csv(file_path, usecols=[id_column])
+            except Exception:
+                df = pd.DataFrame()
+
+        current = 0 if df.empty else int(df[id_column].max())
+        high = max(high or 0, current)
+
+        Database._id_high_water[key] = high + count
+        return high + 1
+
+    @staticmethod
+    def _append_rows(file_path: Path, rows: List[Dict]):
+        """
+        Append rows to a CSV table without rewriting it, under the write fence
+
+        Args:
+            file_path: Table CSV path
+            rows: Rows to append
+        """
+        if not rows:
+            return
+
+        with Database.write_fence():
+            if file_path.exists() and file_path.stat().st_size > 0:
+                columns = list(pd.read_csv(file_path, nrows=0).columns)
+                header = False
+
+                # A column added since the table was created needs one full rewrite
+                new_columns = [column for column in rows[0] if column not in columns]
+                if new_columns:
+                    df = pd.concat([Database._read_csv(file_path), pd.DataFrame(rows)], ignore_index=True)
+                    Database._write_csv(df, file_path)
+                    return
+            else:
+                columns = list(rows[0].keys())
+                header = True
+
+            pd.DataFrame(rows, columns=columns).to_csv(
+                file_path, mode='a', header=header, index=False
+            )
+
+    @staticmethod
+    def _parse_json_column(value) -> Dict:
+        """Parse a JSON dict column such as usage (empty for records created before it existed)"""
+        if not value:
+            return {}
+        try:
+            return json.loads(value)
+        except (TypeError, ValueError):
+            return {}
 
     # ============= USER OPERATIONS =============
 
@@ -66,33 +209,69 @@ class Database:
     @staticmethod
     def create_user(email: str, password_hash: str, role: str) -> Dict:
         """Create a new user"""
-        df = Database._read_csv(settings.USERS_CSV)
+        with Database.write_fence():
+            df = Database._read_csv(settings.USERS_CSV)
 
-        # Get next user_id
-        user_id = 1 if df.empty else int(df['user_id'].max()) + 1
+            # Get next user_id
+            user_id = Database._allocate_ids(settings.USERS_CSV, 'user_id', df=df)
 
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        new_user = {
-            'user_id': user_id,
-            'email': email,
-            'password_hash': password_hash,
-            'role': role,
-            'created_at': now,
-            'last_login': now
-        }
-
-        df = pd.concat([df, pd.DataFrame([new_user])], ignore_index=True)
-        Database._write_csv(df, settings.USERS_CSV)
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            new_user = {
+                'user_id': user_id,
+                'email': email,
+                'password_hash': password_hash,
+                'role': role,
+                'created_at': now,
+                'last_login': now
+            }
+
+            df = pd.concat([df, pd.DataFrame([new_user])], ignore_index=True)
+            Database._write_csv(df, settings.USERS_CSV)
 
         return new_user
 
+    @staticmethod
+    def bulk_create_users(records: List[Dict]) -> List[Dict]:
+        """
+        Create many users with a single append (ids allocated as one block)
+
+        Args:
+            records: Dicts with email, password_hash, role and optional
+                created_at / last_login
+
+        Returns:
+            Created user rows
+        """
+        if not records:
+            return []
+
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        with Database.write_fence():
+            first_id = Database._allocate_ids(settings.USERS_CSV, 'user_id', len(records))
+            new_users = [
+                {
+                    'user_id': first_id + offset,
+                    'email': record['email'],
+                    'password_hash': record['password_hash'],
+                    'role': record['role'],
+                    'created_at': record.get('created_at') or now,
+                    'last_login': record.get('last_login') or now
+                }
+                for offset, record in enumerate(records)
+            ]
+            Database._append_rows(settings.USERS_CSV, new_users)
+
+        return new_users
+
     @staticmethod
     def update_last_login(user_id: int):
         """Update user's last login timestamp"""
-        df = Database._read_csv(settings.USERS_CSV)
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        df.loc[df['user_id'] == user_id, 'last_login'] = now
-        Database._write_csv(df, settings.USERS_CSV)
+        with Database.write_fence():
+            df = Database._read_csv(settings.USERS_CSV)
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            df.loc[df['user_id'] == user_id, 'last_login'] = now
+            Database._write_csv(df, settings.USERS_CSV)
 
     @staticmethod
     def get_all_users() -> List[Dict]:
@@ -115,30 +294,79 @@ class Database:
         file_path: str,
         extracted_text: Optional[str],
         gemini_response: str,
-        citations: List[Dict]
+        citations: List[Dict],
+        usage: Optional[Dict] = None,
+        condensation: Optional[Dict] = None,
+        preflight: Optional[Dict] = None
     ) -> Dict:
-        """Create a new fact check record"""
-        df = Database._read_csv(settings.FACT_CHECKS_CSV)
+        """
+        Create a new fact check record (usage: Gemini token counts of the check;
+        condensation: how a long transcript was shortened before checking;
+        preflight: the local token estimate and whether the input was trimmed)
+        """
+        with Database.write_fence():
+            df = Database._read_csv(settings.FACT_CHECKS_CSV)
+
+            # Get next fact_check_id
+            fact_check_id = Database._allocate_ids(settings.FACT_CHECKS_CSV, 'fact_check_id', df=df)
+
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            new_fact_check = {
+                'fact_check_id': fact_check_id,
+                'user_id': user_id,
+                'upload_type': upload_type,
+                'file_path': file_path,
+                'extracted_text': extracted_text or '',
+                'gemini_response': gemini_response,
+                'citations': json.dumps(citations),
+                'timestamp': now,
+                'usage': json.dumps(usage or {}),
+                'condensation': json.dumps(condensation or {}),
+                'preflight': json.dumps(preflight or {})
+            }
+
+            df = pd.concat([df, pd.DataFrame([new_fact_check])], ignore_index=True)
+            Database._write_csv(df, settings.FACT_CHECKS_CSV)
+
+        return new_fact_check
+
+    @staticmethod
+    def bulk_create_fact_checks(records: List[Dict]) -> List[Dict]:
+        """
+        Create many fact check records with a single append (ids allocated as one block)
+
+        Args:
+            records: Dicts with the create_fact_check fields, optional usage/condensation/preflight and an optional timestamp
 
-        # Get next fact_check_id
-        fact_check_id = 1 if df.empty else int(df['fact_check_id'].max()) + 1
+        Returns:
+            Created fact check rows
+        """
+        if not records:
+            return []
 
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        new_fact_check = {
-            'fact_check_id': fact_check_id,
-            'user_id': user_id,
-            'upload_type': upload_type,
-            'file_path': file_path,
-            'extracted_text': extracted_text or '',
-            'gemini_response': gemini_response,
-            'citations': json.dumps(citations),
-            'timestamp': now
-        }
-
-        df = pd.concat([df, pd.DataFrame([new_fact_check])], ignore_index=True)
-        Database._write_csv(df, settings.FACT_CHECKS_CSV)
 
-        return new_fact_check
+        with Database.write_fence():
+            first_id = Database._allocate_ids(settings.FACT_CHECKS_CSV, 'fact_check_id', len(records))
+            new_fact_checks = [
+                {
+                    'fact_check_id': first_id + offset,
+                    'user_id': record['user_id'],
+                    'upload_type': record['upload_type'],
+                    'file_path': record.get('file_path') or '',
+                    'extracted_text': record.get('extracted_text') or '',
+                    'gemini_response': record['gemini_response'],
+                    'citations': json.dumps(record.get('citations') or []),
+                    'timestamp': record.get('timestamp') or now,
+                    'usage': json.dumps(record.get('usage') or {}),
+                    'condensation': json.dumps(record.get('condensation') or {}),
+                    'preflight': json.dumps(record.get('preflight') or {})
+                }
+                for offset, record in enumerate(records)
+            ]
+            Database._append_rows(settings.FACT_CHECKS_CSV, new_fact_checks)
+
+        return new_fact_checks
 
     @staticmethod
     def get_fact_check_by_id(fact_check_id: int) -> Optional[Dict]:
@@ -163,6 +391,9 @@ class Database:
                 result['citations'] = []
         else:
             result['citations'] = []
+        result['usage'] = Database._parse_json_column(result.get('usage'))
+        result['condensation'] = Database._parse_json_column(result.get('condensation'))
+        result['preflight'] = Database._parse_json_column(result.get('preflight'))
 
         return result
 
@@ -193,6 +424,9 @@ class Database:
                     result['citations'] = []
             else:
                 result['citations'] = []
+            result['usage'] = Database._parse_json_column(result.get('usage'))
+            result['condensation'] = Database._parse_json_column(result.get('condensation'))
+            result['preflight'] = Database._parse_json_column(result.get('preflight'))
 
         return results
 
@@ -219,6 +453,9 @@ class Database:
                     result['citations'] = []
             else:
                 result['citations'] = []
+            result['usage'] = Database._parse_json_column(result.get('usage'))
+            result['condensation'] = Database._parse_json_column(result.get('condensation'))
+            result['preflight'] = Database._parse_json_column(result.get('preflight'))
 
         return results
 
@@ -227,22 +464,23 @@ class Database:
     @staticmethod
     def create_comment(fact_check_id: int, admin_id: int, comment_text: str) -> Dict:
         """Create a new admin comment"""
-        df = Database._read_csv(settings.ADMIN_COMMENTS_CSV)
-
-        # Get next comment_id
-        comment_id = 1 if df.empty else int(df['comment_id'].max()) + 1
-
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        new_comment = {
-            'comment_id': comment_id,
-            'fact_check_id': fact_check_id,
-            'admin_id': admin_id,
-            'comment_text': comment_text,
-            'timestamp': now
-        }
-
-        df = pd.concat([df, pd.DataFrame([new_comment])], ignore_index=True)
-        Database._write_csv(df, settings.ADMIN_COMMENTS_CSV)
+        with Database.write_fence():
+            df = Database._read_csv(settings.ADMIN_COMMENTS_CSV)
+
+            # Get next comment_id
+            comment_id = Database._allocate_ids(settings.ADMIN_COMMENTS_CSV, 'comment_id', df=df)
+
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            new_comment = {
+                'comment_id': comment_id,
+                'fact_check_id': fact_check_id,
+                'admin_id': admin_id,
+                'comment_text': comment_text,
+                'timestamp': now
+            }
+
+            df = pd.concat([df, pd.DataFrame([new_comment])], ignore_index=True)
+            Database._write_csv(df, settings.ADMIN_COMMENTS_CSV)
 
         return new_comment
 
@@ -1,5 +1,6 @@
 import os
 import uuid
+import hashlib
 from pathlib import Path
 from typing import Tuple, Optional
 from fastapi import UploadFile
@@ -167,6 +168,23 @@ class FileHandler:
             print(f"Error getting file info: {e}")
             return {}
 
+    @staticmethod
+    def compute_file_hash(file_path: str) -> str:
+        """
+        Compute the SHA-256 content hash of a file
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Hex digest
+        """
+        file_hash = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                file_hash.update(block)
+        return file_hash.hexdigest()
+
     @staticmethod
     def cleanup_old_temp_files(max_age_hours: int = 24):
         """
@@ -1,24 +1,561 @@
 from google import genai
+from google.genai import errors as genai_errors
 from google.genai import types
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 from config.settings import settings
+from services.resilience import UpstreamUnavailableError, gemini_resilience
+from services.image_preprocessor import image_preprocessor
+from services.context_cache import context_cache
+from services.hedging import gemini_hedger
+import asyncio
+import httpx
+import mimetypes
+import threading
 import re
 import json
+import time
+
+IMAGE_DESCRIPTION_PROMPT = """Analyze this image carefully. Describe what you see including any visible text, claims, people, objects, settings, and notable details. Be objective and thorough in your description."""
+
+TEXT_ANALYSIS_FORMAT = """Provide your analysis in the following structured format:
+
+**VERDICT (First 2 lines - mark with **VERDICT:** prefix):**
+Clearly state the content classification (e.g., "Scientific and Factual", "Fictional and Artistic", "Religious and Cultural", "Misleading", "False Information", "Partially True", etc.). Provide a brief one-line summary of your verdict.
+
+**ANALYSIS (Next 5-6 lines with citations):**
+Provide 5-6 detailed points analyzing the content. Each point should:
+- Present specific facts or findings
+- Reference credible sources
+- Explain the evidence
+- Connect findings to the verdict
+
+**CONCLUSION (Last 1-2 lines - mark with **CONCLUSION:** prefix):**
+Summarize the overall assessment and final judgment.
+
+Do not use bullet points or numbered lists. Write in clear, flowing sentences with proper paragraph structure."""
+
+IMAGE_ANALYSIS_FORMAT = """Provide your analysis in the following structured format:
+
+**VERDICT (First 2 lines - mark with **VERDICT:** prefix):**
+Clearly state the content classification (e.g., "Authentic Image", "Manipulated/Edited", "Artistic Creation", "Historical Content", "Misleading Context", etc.). Provide a brief one-line summary of your verdict.
+
+**ANALYSIS (Next 5-6 lines with citations):**
+Provide 5-6 detailed points analyzing the image content. Each point should:
+- Verify any visible claims or text in the image
+- Reference credible sources about the subject matter
+- Explain the authenticity or context
+- Connect findings to the verdict
+
+**CONCLUSION (Last 1-2 lines - mark with **CONCLUSION:** prefix):**
+Summarize the overall assessment of the image's authenticity and accuracy.
+
+Do not use bullet points or numbered lists. Write in clear, flowing sentences with proper paragraph structure."""
+
+STRUCTURED_TEXT_FORMAT = """Respond only with JSON matching the response schema:
+- verdict: the content classification (e.g. "Scientific and Factual", "Fictional and Artistic", "Religious and Cultural", "Misleading", "False Information", "Partially True")
+- points: 3 to 6 concise evidence points, each naming its source
+- conclusion: one or two sentences with the overall judgment
+- confidence: how strongly the sources support the verdict, from 0 to 1"""
+
+STRUCTURED_IMAGE_FORMAT = """Respond only with JSON matching the response schema:
+- verdict: the content classification (e.g. "Authentic Image", "Manipulated/Edited", "Artistic Creation", "Historical Content", "Misleading Context")
+- points: 3 to 6 concise points verifying the visible claims or text, each naming its source
+- conclusion: one or two sentences on the image's authenticity and accuracy
+- confidence: how strongly the sources support the verdict, from 0 to 1"""
+
+# Fixed part of each grounded fact-check, sent as the system instruction together with
+# the output format; the request contents only carry the statement, description or image
+FACT_CHECK_INSTRUCTIONS = {
+    "text": "You are a fact-checking assistant. Analyze the statement you are given and verify its accuracy using reliable sources from the web.",
+    "image_description": "You are a fact-checking assistant. Based on the image description you are given, verify any claims or information using reliable web sources.",
+    "image": "You are a fact-checking assistant. Examine the image you are given carefully, including any visible text, claims, people, objects, settings and notable details, then verify any claims or information it contains using reliable web sources."
+}
+
+GROUNDING_TOOLS = [{'google_search': {}}]
+
+# Response schema for GEMINI_STRUCTURED_OUTPUT; the verdict is generated first
+FACT_CHECK_RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "verdict": {"type": "STRING"},
+        "points": {"type": "ARRAY", "items": {"type": "STRING"}, "max_items": 6},
+        "conclusion": {"type": "STRING"},
+        "confidence": {"type": "NUMBER", "minimum": 0, "maximum": 1}
+    },
+    "required": ["verdict", "points", "conclusion", "confidence"],
+    "property_ordering": ["verdict", "points", "conclusion", "confidence"]
+}
+
+# Set when the API rejects structured output itself (e.g. combined with search grounding); prose is
+# used until the time below, then structured output is tried again
+_structured_output_unsupported_until = 0.0
+_STRUCTURED_OUTPUT_RETRY_SECONDS = 3600
+# A 400 about the request shape, as opposed to one about this request's input
+_STRUCTURED_UNSUPPORTED_PATTERN = re.compile(
+    r"response[_ ]?(?:mime[_ ]?type|schema)|controlled generation|json mode",
+    re.IGNORECASE
+)
+
+# Token accounting fields reported for every upstream call
+USAGE_FIELDS = ("calls", "prompt_tokens", "response_tokens", "grounding_tokens", "total_tokens", "search_queries", "cached_tokens")
+
+# Verdict line of a formatted response, e.g. "**VERDICT:** Misleading"
+# (on the marker's line or, failing that, the next one)
+VERDICT_PATTERN = re.compile(r'VERDICT[^:\n]*:\**(?!\*)[ \t]*(?:\n[ \t]*)?(\S.*)')
+
+# Process-wide Gemini client, created lazily on first use
+_shared_client: Optional[genai.Client] = None
+_shared_client_lock = threading.Lock()
+
+def _create_client() -> genai.Client:
+    """
+    Create a Gemini client with a tuned, keep-alive connection pool
+
+    Returns:
+        Configured genai.Client
+    """
+    limits = httpx.Limits(
+        max_connections=settings.GEMINI_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.GEMINI_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.GEMINI_KEEPALIVE_EXPIRY_SECONDS
+    )
+
+    http_options = types.HttpOptions(
+        timeout=int(settings.GEMINI_TIMEOUT_SECONDS * 1000),
+        client_args={"limits": limits},
+        async_client_args={"limits": limits}
+    )
+    if settings.GEMINI_BASE_URL:
+        http_options.base_url = settings.GEMINI_BASE_URL
+
+    return genai.Client(api_key=settings.GEMINI_API_KEY, http_options=http_options)
+
+def get_shared_client() -> Optional[genai.Client]:
+    """
+    Get the process-wide Gemini client (thread-safe, created on first use)
+
+    Returns:
+        Shared genai.Client, or None if GEMINI_API_KEY is not set
+    """
+    global _shared_client
+
+    if _shared_client is None and settings.GEMINI_API_KEY:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = _create_client()
+
+    return _shared_client
+
+def close_shared_client():
+    """Close the shared Gemini client and its connection pool"""
+    global _shared_client
+
+    with _shared_client_lock:
+        if _shared_client is not None:
+            try:
+                _shared_client.close()
+            except Exception as e:
+                print(f"Warning: Could not close Gemini client: {e}")
+            _shared_client = None
+
+def get_gemini_service() -> "GeminiService":
+    """FastAPI dependency providing a GeminiService bound to the shared client"""
+    return GeminiService()
 
 class GeminiService:
     """Gemini 2.0 Flash API service with Google Search Grounding"""
 
-    def __init__(self):
-        """Initialize Gemini API"""
-        if settings.GEMINI_API_KEY:
-            self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
+    def __init__(self, client: Optional[genai.Client] = None):
+        """
+        Initialize Gemini API
+
+        Args:
+            client: Gemini client to use (default: the process-wide shared client)
+        """
+        self.client = client or get_shared_client()
+        if self.client:
             self.model_name = 'gemini-2.0-flash-exp'
         else:
             print("Warning: GEMINI_API_KEY not set")
-            self.client = None
             self.model_name = None
 
+    def _require_client(self):
+        """Raise if the Gemini client is not available"""
+        if not self.client:
+            raise Exception("Gemini API not initialized. Please check GEMINI_API_KEY.")
+
+    @staticmethod
+    def _system_instruction(kind: str, structured: bool = False) -> str:
+        """
+        Fixed instructions of a grounded fact-check
+
+        Args:
+            kind: "text", "image_description" or "image" (see FACT_CHECK_INSTRUCTIONS)
+            structured: Ask for JSON matching FACT_CHECK_RESPONSE_SCHEMA instead of prose
+
+        Returns:
+            System instruction text
+        """
+        if kind == "text":
+            output_format = STRUCTURED_TEXT_FORMAT if structured else TEXT_ANALYSIS_FORMAT
+        else:
+            output_format = STRUCTURED_IMAGE_FORMAT if structured else IMAGE_ANALYSIS_FORMAT
+        return f"{FACT_CHECK_INSTRUCTIONS[kind]}\n\n{output_format}"
+
+    @staticmethod
+    def _text_contents(text: str) -> str:
+        """Per-request contents of a text fact-check"""
+        return f'Statement: "{text}"'
+
+    @staticmethod
+    def _image_description_fact_check_contents(image_description: str) -> str:
+        """Per-request contents of the grounded step of the two-step image fact-check"""
+        return f'Image Description: "{image_description}"'
+
+    @staticmethod
+    def _fact_check_config(kind: str, structured: bool = False, cached_content: Optional[str] = None) -> types.GenerateContentConfig:
+        """
+        Grounded generation config for a fact-check
+
+        Args:
+            kind: Instruction variant (see FACT_CHECK_INSTRUCTIONS)
+            structured: Constrain the response to FACT_CHECK_RESPONSE_SCHEMA
+            cached_content: Name of a cached content holding the instructions and tools; sent inline if None
+
+        Returns:
+            GenerateContentConfig
+        """
+        if cached_content:
+            config = types.GenerateContentConfig(cached_content=cached_content, temperature=0.7)
+        else:
+            config = types.GenerateContentConfig(
+                system_instruction=GeminiService._system_instruction(kind, structured),
+                tools=GROUNDING_TOOLS,
+                temperature=0.7
+            )
+
+        if structured:
+            config.response_mime_type = "application/json"
+            config.response_schema = FACT_CHECK_RESPONSE_SCHEMA
+            config.max_output_tokens = settings.GEMINI_STRUCTURED_MAX_OUTPUT_TOKENS
+        return config
+
+    def _context_cache_key(self, kind: str, structured: bool) -> str:
+        return f"{self.model_name}:{kind}:{'json' if structured else 'prose'}"
+
+    def _cached_instructions(self, kind: str, structured: bool) -> Optional[str]:
+        """Cached content name for the instructions, or None to send them inline"""
+        if not settings.GEMINI_CONTEXT_CACHE_ENABLED:
+            return None
+        return context_cache.get(
+            self.client, self.model_name, self._context_cache_key(kind, structured),
+            self._system_instruction(kind, structured), GROUNDING_TOOLS
+        )
+
+    async def _cached_instructions_async(self, kind: str, structured: bool) -> Optional[str]:
+        """Async twin of _cached_instructions()"""
+        if not settings.GEMINI_CONTEXT_CACHE_ENABLED:
+            return None
+        return await context_cache.get_async(
+            self.client, self.model_name, self._context_cache_key(kind, structured),
+            self._system_instruction(kind, structured), GROUNDING_TOOLS
+        )
+
+    def _cached_content_lost(self, kind: str, structured: bool, error: Exception) -> bool:
+        """Forget a cached content the API no longer accepts; True if the request should be resent inline"""
+        if isinstance(error, genai_errors.ClientError) and error.code in (403, 404):
+            context_cache.invalidate(self._context_cache_key(kind, structured))
+            print(f"Warning: Cached instructions unavailable, resending them inline: {error}")
+            return True
+        return False
+
+    @staticmethod
+    def _use_structured_output() -> bool:
+        """Whether grounded fact-checks request schema-constrained JSON"""
+        return settings.GEMINI_STRUCTURED_OUTPUT and time.monotonic() >= _structured_output_unsupported_until
+
+    @staticmethod
+    def _structured_output_failed(error: Exception):
+        """
+        Log a failed structured request; stop asking for JSON for a while if the API rejects the request shape
+
+        Only a 400 naming the response schema or JSON mode counts; other 400s
+        (an oversized prompt, a bad image) concern that request alone.
+        """
+        global _structured_output_unsupported_until
+
+        if (isinstance(error, genai_errors.ClientError) and error.code == 400
+                and _STRUCTURED_UNSUPPORTED_PATTERN.search(str(error))):
+            _structured_output_unsupported_until = time.monotonic() + _STRUCTURED_OUTPUT_RETRY_SECONDS
+            print(
+                f"Warning: Structured output rejected by the Gemini API, using prose responses for the next "
+                f"{_STRUCTURED_OUTPUT_RETRY_SECONDS // 60} minutes: {error}"
+            )
+        else:
+            print(f"Warning: Structured fact-check failed, retrying with a prose response: {error}")
+
+    @staticmethod
+    def _read_image(image_path: str) -> Tuple[bytes, str]:
+        """
+        Load image bytes and their MIME type for upload
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            Tuple of (image bytes, MIME type); preprocessed unless IMAGE_PREPROCESSING_ENABLED is false
+        """
+        if settings.IMAGE_PREPROCESSING_ENABLED:
+            return image_preprocessor.prepare(image_path)
+
+        with open(image_path, 'rb') as f:
+            return f.read(), mimetypes.guess_type(image_path)[0] or 'image/jpeg'
+
+    def _image_description_contents(self, image_data: bytes, mime_type: str) -> list:
+        """Contents for the ungrounded image description call"""
+        return [
+            types.Part.from_bytes(data=image_data, mime_type=mime_type),
+            IMAGE_DESCRIPTION_PROMPT
+        ]
+
+    @staticmethod
+    def _extract_usage(response) -> Dict[str, int]:
+        """
+        Token usage of one upstream call
+
+        Args:
+            response: Gemini API response (or the last streamed chunk)
+
+        Returns:
+            Usage dictionary (see USAGE_FIELDS)
+        """
+        usage = dict.fromkeys(USAGE_FIELDS, 0)
+        usage["calls"] = 1
+
+        metadata = getattr(response, "usage_metadata", None)
+        if metadata:
+            usage["prompt_tokens"] = metadata.prompt_token_count or 0
+            usage["response_tokens"] = metadata.candidates_token_count or 0
+            usage["grounding_tokens"] = metadata.tool_use_prompt_token_count or 0
+            usage["total_tokens"] = metadata.total_token_count or 0
+            usage["cached_tokens"] = metadata.cached_content_token_count or 0
+
+        for candidate in getattr(response, "candidates", None) or []:
+            grounding = getattr(candidate, "grounding_metadata", None)
+            if grounding and grounding.web_search_queries:
+                usage["search_queries"] += len(grounding.web_search_queries)
+
+        return usage
+
+    @staticmethod
+    def combine_usage(*usages: Optional[Dict[str, int]]) -> Dict[str, int]:
+        """
+        Sum the usage of several upstream calls
+
+        Args:
+            *usages: Usage dictionaries (None entries are skipped)
+
+        Returns:
+            Combined usage dictionary
+        """
+        combined = dict.fromkeys(USAGE_FIELDS, 0)
+        for usage in usages:
+            for field in USAGE_FIELDS:
+                combined[field] += (usage or {}).get(field, 0)
+        return combined
+
+    @staticmethod
+    def format_structured_response(data: Dict) -> str:
+        """
+        Render a structured fact-check as the VERDICT/ANALYSIS/CONCLUSION text shown to users
+
+        Args:
+            data: Parsed JSON with verdict, points, conclusion and confidence
+
+        Returns:
+            Formatted response text
+        """
+        sections = [f"**VERDICT:** {data['verdict'].strip()}"]
+        sections.extend(point.strip() for point in data.get("points", []) if point.strip())
+        sections.append(f"**CONCLUSION:** {data['conclusion'].strip()}")
+        return "\n\n".join(sections)
+
+    def _build_structured_result(self, response) -> Dict[str, any]:
+        """
+        Turn a schema-constrained grounded response into the result dictionary
+
+        Raises:
+            ValueError: If the response is not complete JSON (e.g. cut off at the output token limit)
+        """
+        data = json.loads(response.text or "")
+        structured = {
+            "verdict": data["verdict"],
+            "points": data.get("points", []),
+            "conclusion": data["conclusion"],
+            "confidence": data.get("confidence")
+        }
+
+        return {
+            "response": self.format_structured_response(structured),
+            "citations": self._extract_citations_new(response, url_fallback=False),
+            "usage": self._extract_usage(response),
+            "structured": structured
+        }
+
+    def _build_result(self, response) -> Dict[str, any]:
+        """Turn a grounded response into the result dictionary"""
+        # Extract citations from grounding metadata
+        citations = self._extract_citations_new(response)
+
+        # Format the response text
+        formatted_response = self._format_response(response.text)
+
+        return {
+            "response": formatted_response,
+            "citations": citations,
+            "usage": self._extract_usage(response)
+        }
+
+    def _generate_grounded(self, kind: str, contents: Any, structured: bool):
+        """
+        One grounded generate_content call, referencing the cached instructions when there are any
+
+        Args:
+            kind: Instruction variant (see FACT_CHECK_INSTRUCTIONS)
+            contents: Per-request contents
+            structured: Ask for schema-constrained JSON
+
+        Returns:
+            Gemini API response
+        """
+        cached_content = self._cached_instructions(kind, structured)
+        if cached_content:
+            try:
+                return gemini_resilience.call(
+                    self.client.models.generate_content,
+                    model=self.model_name,
+                    contents=contents,
+                    config=self._fact_check_config(kind, structured, cached_content)
+                )
+            except genai_errors.ClientError as e:
+                if not self._cached_content_lost(kind, structured, e):
+                    raise
+
+        return gemini_resilience.call(
+            self.client.models.generate_content,
+            model=self.model_name,
+            contents=contents,
+            config=self._fact_check_config(kind, structured)
+        )
+
+    async def _generate_grounded_async(self, kind: str, contents: Any, structured: bool):
+        """
+        Async twin of _generate_grounded()
+
+        Returns:
+            Gemini API response
+        """
+        cached_content = await self._cached_instructions_async(kind, structured)
+        if cached_content:
+            try:
+                return await self._call_grounded_async(kind, structured, lambda: self.client.aio.models.generate_content(
+                    model=self.model_name,
+                    contents=contents,
+                    config=self._fact_check_config(kind, structured, cached_content)
+                ))
+            except genai_errors.ClientError as e:
+                if not self._cached_content_lost(kind, structured, e):
+                    raise
+
+        return await self._call_grounded_async(kind, structured, lambda: self.client.aio.models.generate_content(
+            model=self.model_name,
+            contents=contents,
+            config=self._fact_check_config(kind, structured)
+        ))
+
+    @staticmethod
+    async def _call_grounded_async(kind: str, structured: bool, request: Callable[[], Awaitable[Any]]):
+        """
+        Resilient grounded call, hedged when GEMINI_HEDGING_ENABLED is on
+
+        Args:
+            kind: Instruction variant; with `structured` it selects the latency profile hedging tracks
+            structured: Whether the request asks for JSON
+            request: Coroutine factory issuing the generate_content call
+
+        Returns:
+            Gemini API response
+        """
+        if not settings.GEMINI_HEDGING_ENABLED:
+            return await gemini_resilience.call_async(request)
+        return await gemini_hedger.call(
+            f"{kind}:{'json' if structured else 'prose'}",
+            lambda: gemini_resilience.call_async(request)
+        )
+
+    def _grounded_fact_check(self, kind: str, contents: Any) -> Dict[str, any]:
+        """
+        Run one grounded fact-check request
+
+        Asks for schema-constrained JSON when GEMINI_STRUCTURED_OUTPUT is on,
+        falling back to the prose format if that request is rejected or its
+        JSON is incomplete.
+
+        Args:
+            kind: Instruction variant (see FACT_CHECK_INSTRUCTIONS)
+            contents: Per-request contents (the statement, description or image)
+
+        Returns:
+            Dictionary with response, citations, token usage and, for JSON responses, `structured`
+        """
+        wasted_usage = None
+
+        if self._use_structured_output():
+            response = None
+            try:
+                response = self._generate_grounded(kind, contents, structured=True)
+                return self._build_structured_result(response)
+            except UpstreamUnavailableError:
+                raise
+            except Exception as e:
+                self._structured_output_failed(e)
+                wasted_usage = self._extract_usage(response) if response is not None else None
+
+        result = self._build_result(self._generate_grounded(kind, contents, structured=False))
+        if wasted_usage:
+            result["usage"] = self.combine_usage(wasted_usage, result["usage"])
+        return result
+
+    async def _grounded_fact_check_async(self, kind: str, contents: Any) -> Dict[str, any]:
+        """
+        Run one grounded fact-check request with the async client
+
+        Args:
+            kind: Instruction variant (see FACT_CHECK_INSTRUCTIONS)
+            contents: Per-request contents (the statement, description or image)
+
+        Returns:
+            Dictionary with response, citations, token usage and, for JSON responses, `structured`
+        """
+        wasted_usage = None
+
+        if self._use_structured_output():
+            response = None
+            try:
+                response = await self._generate_grounded_async(kind, contents, structured=True)
+                return self._build_structured_result(response)
+            except UpstreamUnavailableError:
+                raise
+            except Exception as e:
+                self._structured_output_failed(e)
+                wasted_usage = self._extract_usage(response) if response is not None else None
+
+        result = self._build_result(await self._generate_grounded_async(kind, contents, structured=False))
+        if wasted_usage:
+            result["usage"] = self.combine_usage(wasted_usage, result["usage"])
+        return result
+
     def fact_check_text(self, text: str) -> Dict[str, any]:
         """
         Fact-check text using Gemini with Google Search Grounding
@@ -27,146 +564,291 @@ class GeminiService:
             text: Text to fact-check
 
         Returns:
-            Dictionary with response and citations
+            Dictionary with response, citations and token usage
         """
-        if not self.client:
-            raise Exception("Gemini API not initialized. Please check GEMINI_API_KEY.")
+        self._require_client()
 
-        prompt = f"""You are a fact-checking assistant. Analyze the following statement and verify its accuracy using reliable sources from the web.
+        try:
+            return self._grounded_fact_check("text", self._text_contents(text))
 
-Statement: "{text}"
+        except UpstreamUnavailableError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error during fact-checking: {str(e)}")
 
-Provide your analysis in the following structured format:
+    async def fact_check_text_async(self, text: str) -> Dict[str, any]:
+        """
+        Fact-check text without blocking the event loop (async client)
 
-**VERDICT (First 2 lines - mark with **VERDICT:** prefix):**
-Clearly state the content classification (e.g., "Scientific and Factual", "Fictional and Artistic", "Religious and Cultural", "Misleading", "False Information", "Partially True", etc.). Provide a brief one-line summary of your verdict.
+        Args:
+            text: Text to fact-check
 
-**ANALYSIS (Next 5-6 lines with citations):**
-Provide 5-6 detailed points analyzing the content. Each point should:
-- Present specific facts or findings
-- Reference credible sources
-- Explain the evidence
-- Connect findings to the verdict
+        Returns:
+            Dictionary with response, citations and token usage
+        """
+        self._require_client()
 
-**CONCLUSION (Last 1-2 lines - mark with **CONCLUSION:** prefix):**
-Summarize the overall assessment and final judgment.
+        try:
+            return await self._grounded_fact_check_async("text", self._text_contents(text))
 
-Do not use bullet points or numbered lists. Write in clear, flowing sentences with proper paragraph structure."""
+        except UpstreamUnavailableError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error during fact-checking: {str(e)}")
+
+    async def _text_fact_check_chunks(self, text: str) -> AsyncIterator:
+        """
+        Streamed chunks of a grounded text fact-check
+
+        Resends the instructions inline if the cached content is rejected
+        before the first chunk arrives.
+
+        Args:
+            text: Text to fact-check
+
+        Yields:
+            Response chunks from the streaming API
+        """
+        cached_content = await self._cached_instructions_async("text", False)
+        started = False
 
         try:
-            # Use Google Search grounding
-            config = types.GenerateContentConfig(
-                tools=[{'google_search': {}}],
-                temperature=0.7
-            )
-            
-            response = self.client.models.generate_content(
+            stream = await gemini_resilience.call_async(lambda: self.client.aio.models.generate_content_stream(
                 model=self.model_name,
-                contents=prompt,
-                config=config
-            )
+                contents=self._text_contents(text),
+                config=self._fact_check_config("text", cached_content=cached_content)
+            ))
+            async for chunk in stream:
+                started = True
+                yield chunk
+            return
+        except genai_errors.ClientError as e:
+            if started or not cached_content or not self._cached_content_lost("text", False, e):
+                raise
+
+        stream = await gemini_resilience.call_async(lambda: self.client.aio.models.generate_content_stream(
+            model=self.model_name,
+            contents=self._text_contents(text),
+            config=self._fact_check_config("text")
+        ))
+        async for chunk in stream:
+            yield chunk
+
+    async def fact_check_text_stream(self, text: str) -> AsyncIterator[Dict]:
+        """
+        Stream a grounded fact-check of text as it is generated
 
-            # Extract citations from grounding metadata
-            citations = self._extract_citations_new(response)
-            
-            # Format the response text
-            formatted_response = self._format_response(response.text)
+        Args:
+            text: Text to fact-check
 
-            return {
-                "response": formatted_response,
-                "citations": citations
-            }
+        Yields:
+            {"event": "verdict", "data": {"verdict": ...}} as soon as the verdict line is complete,
+            {"event": "chunk", "data": {"text": ...}} for the text that follows it, then
+            {"event": "result", "data": {"response": ..., "citations": [...], "usage": {...}}} once the stream ends
+        """
+        self._require_client()
 
+        buffer = ""
+        sent_upto = 0
+        verdict_sent = False
+        citations = []
+        last_chunk = None
+
+        try:
+            async for chunk in self._text_fact_check_chunks(text):
+                # Usage metadata is cumulative; the last chunk carries the totals
+                if chunk.usage_metadata:
+                    last_chunk = chunk
+
+                # Grounding metadata usually arrives with the final chunks
+                for citation in self._extract_citations_new(chunk, url_fallback=False):
+                    if citation not in citations:
+                        citations.append(citation)
+
+                buffer += chunk.text or ""
+
+                if not verdict_sent:
+                    match = VERDICT_PATTERN.search(buffer)
+                    # Wait until the verdict line is terminated
+                    if not match or match.end() >= len(buffer):
+                        continue
+                    verdict_sent = True
+                    sent_upto = match.end()
+                    yield {"event": "verdict", "data": {"verdict": match.group(1).strip().strip('*').strip()}}
+
+                if len(buffer) > sent_upto:
+                    yield {"event": "chunk", "data": {"text": buffer[sent_upto:]}}
+                    sent_upto = len(buffer)
+
+        except UpstreamUnavailableError:
+            raise
         except Exception as e:
             raise Exception(f"Error during fact-checking: {str(e)}")
 
+        if not verdict_sent:
+            yield {"event": "verdict", "data": {"verdict": self.extract_verdict(buffer)}}
+            match = VERDICT_PATTERN.search(buffer)
+            sent_upto = match.end() if match else 0
+            if len(buffer) > sent_upto:
+                yield {"event": "chunk", "data": {"text": buffer[sent_upto:]}}
+
+        if not citations:
+            citations = self._extract_urls_from_text(buffer)
+
+        yield {
+            "event": "result",
+            "data": {
+                "response": self._format_response(buffer),
+                "citations": citations,
+                "usage": self._extract_usage(last_chunk)
+            }
+        }
+
+    @staticmethod
+    def _single_call_image_contents(image_data: bytes, mime_type: str) -> list:
+        """Per-request contents of the one-request grounded image fact-check"""
+        return [types.Part.from_bytes(data=image_data, mime_type=mime_type)]
+
     def fact_check_image(self, image_path: str) -> Dict[str, any]:
         """
-        Fact-check image using Gemini in two steps:
-        1. Extract description without grounding
-        2. Fact-check the description with Google Search grounding
+        Fact-check image using Gemini with Google Search grounding
+
+        Sends the image and the fact-check instructions in one grounded
+        request; falls back to the two-step path if that request fails or
+        GEMINI_IMAGE_SINGLE_CALL is disabled.
 
         Args:
             image_path: Path to the image file
 
         Returns:
-            Dictionary with response and citations
+            Dictionary with response, citations and token usage
         """
-        if not self.client:
-            raise Exception("Gemini API not initialized. Please check GEMINI_API_KEY.")
+        self._require_client()
 
         try:
-            # Step 1: Extract description from image (without grounding)
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
-            
-            description_prompt = """Analyze this image carefully. Describe what you see including any visible text, claims, people, objects, settings, and notable details. Be objective and thorough in your description."""
-
-            # Upload image and get description
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=[
-                    types.Part.from_bytes(data=image_data, mime_type='image/jpeg'),
-                    description_prompt
-                ]
-            )
-            
-            image_description = response.text
-
-            # Step 2: Fact-check the description with Google Search grounding
-            fact_check_prompt = f"""You are a fact-checking assistant. Based on this image description, verify any claims or information using reliable web sources.
-
-Image Description: "{image_description}"
-
-Provide your analysis in the following structured format:
-
-**VERDICT (First 2 lines - mark with **VERDICT:** prefix):**
-Clearly state the content classification (e.g., "Authentic Image", "Manipulated/Edited", "Artistic Creation", "Historical Content", "Misleading Context", etc.). Provide a brief one-line summary of your verdict.
+            image_data, mime_type = self._read_image(image_path)
+            wasted_usage = None
+
+            if settings.GEMINI_IMAGE_SINGLE_CALL:
+                try:
+                    result = self._grounded_fact_check("image", self._single_call_image_contents(image_data, mime_type))
+                    if result["response"]:
+                        return result
+                    print("Warning: Single-call image fact-check returned no text, using two-step path")
+                    wasted_usage = result["usage"]
+                except UpstreamUnavailableError:
+                    raise
+                except Exception as e:
+                    print(f"Warning: Single-call image fact-check failed, using two-step path: {e}")
+
+            result = self._fact_check_image_two_step(image_data, mime_type)
+            result["usage"] = self.combine_usage(wasted_usage, result["usage"])
+            return result
+
+        except UpstreamUnavailableError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error during image fact-checking: {str(e)}")
 
-**ANALYSIS (Next 5-6 lines with citations):**
-Provide 5-6 detailed points analyzing the image content. Each point should:
-- Verify any visible claims or text in the image
-- Reference credible sources about the subject matter
-- Explain the authenticity or context
-- Connect findings to the verdict
+    def _fact_check_image_two_step(self, image_data: bytes, mime_type: str) -> Dict[str, any]:
+        """
+        Fact-check image in two steps:
+        1. Extract description without grounding
+        2. Fact-check the description with Google Search grounding
 
-**CONCLUSION (Last 1-2 lines - mark with **CONCLUSION:** prefix):**
-Summarize the overall assessment of the image's authenticity and accuracy.
+        Args:
+            image_data: Image bytes
+            mime_type: MIME type of image_data
 
-Do not use bullet points or numbered lists. Write in clear, flowing sentences with proper paragraph structure."""
+        Returns:
+            Dictionary with response, citations and token usage
+        """
+        # Step 1: Extract description from image (without grounding)
+        response = gemini_resilience.call(
+            self.client.models.generate_content,
+            model=self.model_name,
+            contents=self._image_description_contents(image_data, mime_type)
+        )
+
+        # Step 2: Fact-check the description with Google Search grounding
+        result = self._grounded_fact_check(
+            "image_description", self._image_description_fact_check_contents(response.text)
+        )
+        result["usage"] = self.combine_usage(self._extract_usage(response), result["usage"])
+        return result
+
+    async def fact_check_image_async(self, image_path: str) -> Dict[str, any]:
+        """
+        Image fact-check without blocking the event loop (async client)
 
-            # Use Google Search grounding for fact-checking
-            config = types.GenerateContentConfig(
-                tools=[{'google_search': {}}],
-                temperature=0.7
-            )
-            
-            fact_check_response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=fact_check_prompt,
-                config=config
-            )
+        Single grounded request, with the two-step path as fallback.
 
-            # Extract citations from fact-check response
-            citations = self._extract_citations_new(fact_check_response)
-            
-            # Format the response
-            formatted_response = self._format_response(fact_check_response.text)
+        Args:
+            image_path: Path to the image file
 
-            return {
-                "response": formatted_response,
-                "citations": citations
-            }
+        Returns:
+            Dictionary with response, citations and token usage
+        """
+        self._require_client()
 
+        try:
+            image_data, mime_type = await asyncio.to_thread(self._read_image, image_path)
+            wasted_usage = None
+
+            if settings.GEMINI_IMAGE_SINGLE_CALL:
+                try:
+                    result = await self._grounded_fact_check_async(
+                        "image", self._single_call_image_contents(image_data, mime_type)
+                    )
+                    if result["response"]:
+                        return result
+                    print("Warning: Single-call image fact-check returned no text, using two-step path")
+                    wasted_usage = result["usage"]
+                except UpstreamUnavailableError:
+                    raise
+                except Exception as e:
+                    print(f"Warning: Single-call image fact-check failed, using two-step path: {e}")
+
+            result = await self._fact_check_image_two_step_async(image_data, mime_type)
+            result["usage"] = self.combine_usage(wasted_usage, result["usage"])
+            return result
+
+        except UpstreamUnavailableError:
+            raise
         except Exception as e:
             raise Exception(f"Error during image fact-checking: {str(e)}")
 
-    def _extract_citations_new(self, response) -> List[Dict]:
+    async def _fact_check_image_two_step_async(self, image_data: bytes, mime_type: str) -> Dict[str, any]:
+        """
+        Two-step image fact-check with the async client
+
+        Args:
+            image_data: Image bytes
+            mime_type: MIME type of image_data
+
+        Returns:
+            Dictionary with response, citations and token usage
+        """
+        # Step 1: Extract description from image (without grounding)
+        response = await gemini_resilience.call_async(lambda: self.client.aio.models.generate_content(
+            model=self.model_name,
+            contents=self._image_description_contents(image_data, mime_type)
+        ))
+
+        # Step 2: Fact-check the description with Google Search grounding
+        result = await self._grounded_fact_check_async(
+            "image_description", self._image_description_fact_check_contents(response.text)
+        )
+        result["usage"] = self.combine_usage(self._extract_usage(response), result["usage"])
+        return result
+
+    def _extract_citations_new(self, response, url_fallback: bool = True) -> List[Dict]:
         """
         Extract citations from google-genai response with grounding metadata
 
         Args:
-            response: Gemini API response from google-genai
+            response: Gemini API response (or streamed chunk) from google-genai
+            url_fallback: Fall back to URLs found in the response text
 
         Returns:
             List of citation dictionaries
@@ -209,12 +891,13 @@ Do not use bullet points or numbered lists. Write in clear, flowing sentences wi
                                                         citations.append(citation)
 
             # Fallback: extract URLs from text if no grounding metadata
-            if not citations:
+            if not citations and url_fallback:
                 citations = self._extract_urls_from_text(response.text)
 
         except Exception as e:
             print(f"Error extracting citations: {e}")
-            citations = self._extract_urls_from_text(response.text)
+            if url_fallback:
+                citations = self._extract_urls_from_text(response.text)
 
         return citations
     
@@ -239,6 +922,22 @@ Do not use bullet points or numbered lists. Write in clear, flowing sentences wi
         
         return text
 
+    @staticmethod
+    def extract_verdict(text: str) -> str:
+        """
+        Extract the verdict line from a formatted response
+
+        Args:
+            text: Formatted response text
+
+        Returns:
+            Verdict text, or "Unknown" if no VERDICT marker is present
+        """
+        match = VERDICT_PATTERN.search(text)
+        if not match:
+            return "Unknown"
+        return match.group(1).strip().strip('*').strip() or "Unknown"
+
     def _extract_urls_from_text(self, text: str) -> List[Dict]:
         """
         Extract URLs from response text as fallback
@@ -264,27 +963,61 @@ Do not use bullet points or numbered lists. Write in clear, flowing sentences wi
 
         return citations
 
-    def generate_summary(self, text: str, max_words: int = 100) -> str:
+    def generate_summary(self, text: str, max_words: int = 100, include_usage: bool = False) -> Union[str, Tuple[str, Dict]]:
         """
         Generate a summary of the text
 
         Args:
             text: Text to summarize
             max_words: Maximum words in summary
+            include_usage: Also return the token usage of the request
 
         Returns:
-            Summary text
+            Summary text, or (summary text, usage) with include_usage
         """
-        if not self.client:
-            raise Exception("Gemini API not initialized. Please check GEMINI_API_KEY.")
+        self._require_client()
 
         prompt = f"Summarize the following text in {max_words} words or less:\n\n{text}"
 
         try:
-            response = self.client.models.generate_content(
+            response = gemini_resilience.call(
+                self.client.models.generate_content,
                 model=self.model_name,
                 contents=prompt
             )
+            if include_usage:
+                return response.text, self._extract_usage(response)
+            return response.text
+        except UpstreamUnavailableError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error generating summary: {str(e)}")
+
+    async def generate_summary_async(self, text: str, max_words: int = 100, include_usage: bool = False) -> Union[str, Tuple[str, Dict]]:
+        """
+        Generate a summary of the text without blocking the event loop
+
+        Args:
+            text: Text to summarize
+            max_words: Maximum words in summary
+            include_usage: Also return the token usage of the request
+
+        Returns:
+            Summary text, or (summary text, usage) with include_usage
+        """
+        self._require_client()
+
+        prompt = f"Summarize the following text in {max_words} words or less:\n\n{text}"
+
+        try:
+            response = await gemini_resilience.call_async(lambda: self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=prompt
+            ))
+            if include_usage:
+                return response.text, self._extract_usage(response)
             return response.text
+        except UpstreamUnavailableError:
+            raise
         except Exception as e:
             raise Exception(f"Error generating summary: {str(e)}")
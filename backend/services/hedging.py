@@ -0,0 +1,154 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+from config.settings import settings
+
+class RequestHedger:
+    """
+    Hedged async upstream calls.
+
+    Tracks recent call latencies per key. When a call has not returned by
+    the configured percentile of them, an identical second call is started;
+    the first to succeed wins and the other is cancelled. Hedges draw on a
+    budget that grows by `max_hedge_ratio` per call, so they never exceed
+    that share of traffic.
+    """
+
+    def __init__(
+        self,
+        percentile: float,
+        max_hedge_ratio: float,
+        min_samples: int,
+        window: int,
+        min_delay_seconds: float,
+        max_budget: float = 10.0
+    ):
+        """
+        Initialize the hedger
+
+        Args:
+            percentile: Latency percentile (0-100) after which a call is hedged
+            max_hedge_ratio: Largest share of calls that may be hedged (e.g. 0.05)
+            min_samples: Latencies needed for a key before its calls are hedged
+            window: Recent latencies kept per key
+            min_delay_seconds: Never hedge sooner than this
+            max_budget: Unused hedges that can be saved up for a burst of slow calls
+        """
+        self.percentile = percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_samples = min_samples
+        self.window = window
+        self.min_delay_seconds = min_delay_seconds
+        self.max_budget = max_budget
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._budget = 0.0
+        self._stats = {"calls": 0, "hedged": 0, "hedge_wins": 0, "budget_exhausted": 0}
+
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """
+        Seconds to wait for a call before hedging it
+
+        Args:
+            key: Call family (calls with different latency profiles use different keys)
+
+        Returns:
+            The tracked latency percentile, or None until enough calls have been seen
+        """
+        samples = self._latencies.get(key)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, math.ceil(self.percentile / 100 * len(ordered)) - 1)
+        return max(self.min_delay_seconds, ordered[index])
+
+    def _record(self, key: str, seconds: float):
+        samples = self._latencies.setdefault(key, deque(maxlen=self.window))
+        samples.append(seconds)
+
+    def _take_budget(self) -> bool:
+        if self._budget >= 1:
+            self._budget -= 1
+            return True
+        self._stats["budget_exhausted"] += 1
+        return False
+
+    async def call(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await `fn`, hedging it with a second call if it is slow
+
+        Args:
+            key: Call family whose latencies set the hedge delay
+            fn: Coroutine factory; called once, or twice when hedged
+
+        Returns:
+            Result of the first call to succeed
+        """
+        self._stats["calls"] += 1
+        self._budget = min(self.max_budget, self._budget + self.max_hedge_ratio)
+        delay = self.hedge_delay(key)
+
+        started = time.monotonic()
+        primary = asyncio.ensure_future(fn())
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+                if not done and self._take_budget():
+                    result = await self._race(primary, asyncio.ensure_future(fn()))
+                    # The primary took at least this long; recording the faster hedge
+                    # instead would pull the percentile down and hedge ever more calls
+                    self._record(key, time.monotonic() - started)
+                    return result
+            result = await primary
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        self._record(key, time.monotonic() - started)
+        return result
+
+    async def _race(self, primary: asyncio.Future, hedge: asyncio.Future) -> Any:
+        """Return the first successful attempt, cancelling the other; raise if both fail"""
+        self._stats["hedged"] += 1
+        pending = {primary, hedge}
+        error = None
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    if task is hedge:
+                        self._stats["hedge_wins"] += 1
+                    return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise error
+
+    def stats(self) -> Dict:
+        """
+        Hedging counters
+
+        Returns:
+            Calls, hedges issued, hedges that won, hedges refused by the budget,
+            hedged share of calls and the current hedge delay per key in ms
+        """
+        delays = {key: self.hedge_delay(key) for key in self._latencies}
+        return {
+            **self._stats,
+            "hedge_rate": round(self._stats["hedged"] / self._stats["calls"], 4) if self._stats["calls"] else 0.0,
+            "hedge_delay_ms": {key: round(delay * 1000) for key, delay in delays.items() if delay is not None}
+        }
+
+# Shared instance for grounded Gemini fact-checks
+gemini_hedger = RequestHedger(
+    percentile=settings.GEMINI_HEDGE_PERCENTILE,
+    max_hedge_ratio=settings.GEMINI_HEDGE_MAX_RATIO,
+    min_samples=settings.GEMINI_HEDGE_MIN_SAMPLES,
+    window=settings.GEMINI_HEDGE_WINDOW,
+    min_delay_seconds=settings.GEMINI_HEDGE_MIN_DELAY_MS / 1000
+)
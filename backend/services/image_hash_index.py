@@ -0,0 +1,267 @@
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from PIL import Image, ImageOps, UnidentifiedImageError
+from config.settings import settings
+from utils.helpers import Helpers
+
+HASH_BITS = 64
+
+def _dct_matrix(size: int) -> np.ndarray:
+    """Orthonormal DCT-II basis, so a 2-D DCT is M @ X @ M.T"""
+    n = np.arange(size)
+    matrix = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size)) * np.sqrt(2 / size)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+_DCT_32 = _dct_matrix(32)
+
+def _bits_to_int(bits: np.ndarray) -> int:
+    return int("".join("1" if bit else "0" for bit in bits.ravel()), 2)
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes"""
+    return (a ^ b).bit_count()
+
+def compute_image_hashes(image_path: str) -> Optional[Tuple[int, int]]:
+    """
+    Compute the perceptual (pHash) and difference (dHash) hashes of an image
+
+    Both survive recompression, resizing and small overlays such as
+    watermarks; pHash is used for lookup and dHash to confirm a match.
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        Tuple of (phash, dhash) as 64-bit integers, or None if the file is not an image
+    """
+    try:
+        with Image.open(image_path) as image:
+            image.draft("L", (64, 64))
+            image = ImageOps.exif_transpose(image).convert("L")
+    except (UnidentifiedImageError, OSError):
+        return None
+
+    # pHash: low-frequency 8x8 DCT coefficients compared with their median (DC excluded)
+    pixels = np.asarray(image.resize((32, 32), Image.LANCZOS), dtype=np.float64)
+    low = (_DCT_32 @ pixels @ _DCT_32.T)[:8, :8].ravel()
+    phash = _bits_to_int(low > np.median(low[1:]))
+
+    # dHash: horizontal brightness gradient on a 9x8 thumbnail
+    pixels = np.asarray(image.resize((9, 8), Image.LANCZOS), dtype=np.int16)
+    dhash = _bits_to_int(pixels[:, 1:] > pixels[:, :-1])
+
+    return phash, dhash
+
+class MultiIndexHashTable:
+    """
+    Multi-index hashing over 64-bit hashes for Hamming-radius queries.
+
+    Each hash is split into `chunks` substrings, each with its own table.
+    If two hashes are within radius r, at least one substring pair is
+    within r // chunks bits (pigeonhole), so a query only probes the
+    buckets near its own substrings instead of scanning every hash.
+    """
+
+    def __init__(self, radius: int, chunks: int = 4):
+        """
+        Initialize empty tables
+
+        Args:
+            radius: Largest Hamming distance that queries must find
+            chunks: Number of substrings (must divide 64)
+        """
+        self.radius = radius
+        self.chunks = chunks
+        self.chunk_bits = HASH_BITS // chunks
+        self._chunk_mask = (1 << self.chunk_bits) - 1
+        self._tables: List[Dict[int, set]] = [defaultdict(set) for _ in range(chunks)]
+        self._hashes: Dict[int, int] = {}
+
+        # Every bit flip pattern within the per-substring radius
+        chunk_radius = radius // chunks
+        self._flips = [0]
+        for bits in range(1, chunk_radius + 1):
+            self._flips.extend(sum(1 << bit for bit in combo) for combo in combinations(range(self.chunk_bits), bits))
+
+    def _substrings(self, value: int) -> List[int]:
+        return [(value >> (i * self.chunk_bits)) & self._chunk_mask for i in range(self.chunks)]
+
+    def add(self, key: int, value: int):
+        """Add or replace the hash of a key"""
+        self.remove(key)
+        self._hashes[key] = value
+        for table, substring in zip(self._tables, self._substrings(value)):
+            table[substring].add(key)
+
+    def remove(self, key: int):
+        """Remove a key"""
+        value = self._hashes.pop(key, None)
+        if value is None:
+            return
+        for table, substring in zip(self._tables, self._substrings(value)):
+            bucket = table.get(substring)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del table[substring]
+
+    def query(self, value: int) -> List[Tuple[int, int]]:
+        """
+        Find keys whose hash is within the radius
+
+        Args:
+            value: Hash to look up
+
+        Returns:
+            List of (distance, key)
+        """
+        candidates = set()
+        for table, substring in zip(self._tables, self._substrings(value)):
+            for flip in self._flips:
+                bucket = table.get(substring ^ flip)
+                if bucket:
+                    candidates.update(bucket)
+
+        matches = []
+        for key in candidates:
+            distance = hamming_distance(value, self._hashes[key])
+            if distance <= self.radius:
+                matches.append((distance, key))
+        return matches
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+class ImageHashIndex:
+    """
+    In-memory index of recently fact-checked images by perceptual hash.
+
+    A multi-index hash table over pHash finds candidates within a
+    Hamming radius; dHash must also be close for a match.
+    """
+
+    def __init__(self, max_phash_distance: int, max_dhash_distance: int, max_entries: int, max_age_seconds: float):
+        """
+        Initialize the index
+
+        Args:
+            max_phash_distance: pHash Hamming radius for candidates
+            max_dhash_distance: dHash Hamming distance required to confirm a match
+            max_entries: Oldest entries are evicted beyond this size
+            max_age_seconds: Entries older than this are never matched
+        """
+        self.max_phash_distance = max_phash_distance
+        self.max_dhash_distance = max_dhash_distance
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self._entries: "OrderedDict[int, Dict]" = OrderedDict()
+        self._table = MultiIndexHashTable(max_phash_distance)
+        self._lock = threading.Lock()
+
+    def _remove_locked(self, key: int):
+        if self._entries.pop(key, None) is not None:
+            self._table.remove(key)
+
+    def add(self, key: int, hashes: Tuple[int, int], payload: Dict, created_at: Optional[float] = None):
+        """
+        Add a fact-checked image
+
+        Args:
+            key: Fact check id
+            hashes: (phash, dhash) from compute_image_hashes
+            payload: Data returned on a match (e.g. response and citations)
+            created_at: Epoch seconds of the fact check (default: now)
+        """
+        phash, dhash = hashes
+
+        with self._lock:
+            self._entries[key] = {
+                "phash": phash,
+                "dhash": dhash,
+                "payload": payload,
+                "created_at": created_at or time.time()
+            }
+            self._entries.move_to_end(key)
+            self._table.add(key, phash)
+
+            while len(self._entries) > self.max_entries:
+                self._remove_locked(next(iter(self._entries)))
+
+    def query(self, hashes: Tuple[int, int]) -> Optional[Tuple[int, float, Dict]]:
+        """
+        Find the closest recent image
+
+        Args:
+            hashes: (phash, dhash) of the new image
+
+        Returns:
+            Tuple of (key, similarity, payload), or None
+        """
+        phash, dhash = hashes
+        oldest_allowed = time.time() - self.max_age_seconds
+        best = None
+
+        with self._lock:
+            for distance, key in self._table.query(phash):
+                entry = self._entries[key]
+                if entry["created_at"] < oldest_allowed:
+                    continue
+                if hamming_distance(dhash, entry["dhash"]) > self.max_dhash_distance:
+                    continue
+                if best is None or distance < best[0]:
+                    best = (distance, key, entry["payload"])
+
+        if best is None:
+            return None
+        distance, key, payload = best
+        return key, 1 - distance / HASH_BITS, payload
+
+    def remove(self, key: int):
+        """Remove a fact check from the index"""
+        with self._lock:
+            self._remove_locked(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load_fact_checks(self, fact_checks: List[Dict]):
+        """
+        Warm the index from stored image fact checks whose files still exist
+
+        Args:
+            fact_checks: Records as returned by Database.get_all_fact_checks
+        """
+        oldest_allowed = time.time() - self.max_age_seconds
+
+        for fact_check in reversed(fact_checks[:self.max_entries]):
+            if fact_check.get("upload_type") != "image" or not Path(str(fact_check.get("file_path"))).is_file():
+                continue
+            created_at = Helpers.parse_timestamp(str(fact_check.get("timestamp", ""))).timestamp()
+            if created_at < oldest_allowed:
+                continue
+            hashes = compute_image_hashes(fact_check["file_path"])
+            if hashes is None:
+                continue
+            self.add(
+                int(fact_check["fact_check_id"]),
+                hashes,
+                {
+                    "response": fact_check["gemini_response"],
+                    "citations": fact_check["citations"]
+                },
+                created_at=created_at
+            )
+
+# Shared index instance
+image_hash_index = ImageHashIndex(
+    max_phash_distance=settings.IMAGE_DUPLICATE_MAX_DISTANCE,
+    max_dhash_distance=settings.IMAGE_DUPLICATE_MAX_DHASH_DISTANCE,
+    max_entries=settings.IMAGE_DUPLICATE_MAX_ENTRIES,
+    max_age_seconds=settings.IMAGE_DUPLICATE_MAX_AGE_HOURS * 3600
+)
@@ -0,0 +1,148 @@
+import hashlib
+import io
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Tuple
+from PIL import Image, ImageOps, UnidentifiedImageError
+from config.settings import settings
+
+# Formats Gemini accepts as-is; anything else is re-encoded to JPEG (or PNG with transparency)
+_PASSTHROUGH_FORMATS = {"JPEG", "PNG", "WEBP"}
+
+_EXTENSIONS = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp"}
+_MIME_TYPES = {"JPEG": "image/jpeg", "PNG": "image/png", "WEBP": "image/webp"}
+
+class ImagePreprocessor:
+    """Normalize uploaded images before they are sent to Gemini, cached by content hash"""
+
+    def __init__(self, cache_dir: Path, max_dimension: int, jpeg_quality: int):
+        """
+        Initialize the preprocessor
+
+        Args:
+            cache_dir: Directory for prepared images
+            max_dimension: Longest side after downscaling, in pixels
+            jpeg_quality: Quality for JPEG and WebP re-encoding
+        """
+        self.cache_dir = cache_dir
+        self.max_dimension = max_dimension
+        self.jpeg_quality = jpeg_quality
+        self._lock = threading.Lock()
+        self._stats = {"cache_hits": 0, "processed": 0, "bytes_in": 0, "bytes_out": 0}
+
+    def _cache_path(self, digest: str, image_format: str) -> Path:
+        return self.cache_dir / digest[:2] / f"{digest}{_EXTENSIONS[image_format]}"
+
+    def _cached(self, digest: str) -> Tuple[bytes, str]:
+        """Prepared image for a content hash, or (b"", "") on a miss"""
+        for image_format in _EXTENSIONS:
+            path = self._cache_path(digest, image_format)
+            try:
+                return path.read_bytes(), _MIME_TYPES[image_format]
+            except OSError:
+                continue
+        return b"", ""
+
+    def _encode(self, raw: bytes) -> Tuple[bytes, str]:
+        """
+        Decode, orient, downscale and re-encode an image without metadata
+
+        Args:
+            raw: Original file bytes
+
+        Returns:
+            Tuple of (encoded bytes, output format)
+        """
+        try:
+            image = Image.open(io.BytesIO(raw))
+            source_format = image.format
+            # JPEG can decode straight to a reduced scale, skipping most of the work for large photos
+            image.draft("RGB", (self.max_dimension, self.max_dimension))
+            image.load()
+        except (UnidentifiedImageError, OSError) as e:
+            raise ValueError(f"Unsupported or corrupt image: {e}")
+
+        # Apply the EXIF orientation before the EXIF block is dropped
+        image = ImageOps.exif_transpose(image)
+        if getattr(image, "is_animated", False):
+            image.seek(0)
+
+        has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+        if source_format in _PASSTHROUGH_FORMATS:
+            output_format = source_format
+        else:
+            output_format = "PNG" if has_alpha else "JPEG"
+
+        if output_format == "JPEG":
+            image = image.convert("RGB")
+        elif image.mode not in ("RGB", "RGBA", "L", "LA"):
+            image = image.convert("RGBA" if has_alpha else "RGB")
+
+        image.thumbnail((self.max_dimension, self.max_dimension), Image.LANCZOS)
+
+        # Saving without exif/icc/pnginfo arguments drops all metadata
+        buffer = io.BytesIO()
+        if output_format == "PNG":
+            image.save(buffer, format="PNG", optimize=True)
+        else:
+            image.save(buffer, format=output_format, quality=self.jpeg_quality, optimize=True)
+
+        return buffer.getvalue(), output_format
+
+    def prepare(self, image_path: str) -> Tuple[bytes, str]:
+        """
+        Prepare an image for upload
+
+        Detects the real format from the file contents, strips EXIF and
+        other metadata, downscales to max_dimension and re-encodes.
+
+        Args:
+            image_path: Path to the uploaded image
+
+        Returns:
+            Tuple of (image bytes, MIME type)
+        """
+        with open(image_path, "rb") as f:
+            raw = f.read()
+
+        key = f"{hashlib.sha256(raw).hexdigest()}-{self.max_dimension}-{self.jpeg_quality}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+        data, mime_type = self._cached(digest)
+        if data:
+            with self._lock:
+                self._stats["cache_hits"] += 1
+            return data, mime_type
+
+        data, output_format = self._encode(raw)
+
+        path = self._cache_path(digest, output_format)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            self._stats["processed"] += 1
+            self._stats["bytes_in"] += len(raw)
+            self._stats["bytes_out"] += len(data)
+
+        return data, _MIME_TYPES[output_format]
+
+    def stats(self) -> Dict:
+        """
+        Preprocessing counters
+
+        Returns:
+            Cache hits, images processed and bytes before/after
+        """
+        with self._lock:
+            return dict(self._stats)
+
+# Shared preprocessor instance
+image_preprocessor = ImagePreprocessor(
+    cache_dir=settings.CACHE_FOLDER / "images",
+    max_dimension=settings.IMAGE_MAX_DIMENSION,
+    jpeg_quality=settings.IMAGE_JPEG_QUALITY
+)
@@ -0,0 +1,96 @@
+import re
+import time
+from typing import Dict, Optional, Tuple
+from utils.helpers import Helpers
+from utils.validators import Validators
+
+# End of a sentence or line, where an oversized input is preferably cut
+_BOUNDARY_PATTERN = re.compile(r"[.!?][\"')\]]*\s+|\n+")
+
+class InputTooLargeError(Exception):
+    """Raised when an input exceeds the size limits before any upstream call is made"""
+
+    def __init__(self, message: str, estimated_tokens: int, max_tokens: int):
+        super().__init__(message)
+        self.estimated_tokens = estimated_tokens
+        self.max_tokens = max_tokens
+
+class InputBudget:
+    """Local pre-flight sizing of fact-check inputs, so oversized ones never reach Gemini"""
+
+    @staticmethod
+    def trim(text: str, max_tokens: int) -> str:
+        """
+        Cut text to an estimated token budget, at a sentence boundary where possible
+
+        Args:
+            text: Text to shorten
+            max_tokens: Token budget (see Helpers.estimate_tokens)
+
+        Returns:
+            The longest prefix within the budget, ending at the last sentence or line
+            break in its second half, else at a word boundary
+        """
+        max_chars = max_tokens * 4
+        if len(text) <= max_chars:
+            return text
+
+        window = text[:max_chars]
+        cut = None
+        for match in _BOUNDARY_PATTERN.finditer(window):
+            cut = match.end()
+        if cut is None or cut < max_chars // 2:
+            cut = window.rfind(" ")
+            if cut < max_chars // 2:
+                cut = max_chars
+        return window[:cut].rstrip()
+
+    @staticmethod
+    def check(text: str, max_tokens: int, action: str = "reject", max_chars: Optional[int] = None) -> Tuple[str, Dict]:
+        """
+        Estimate the tokens of an input and enforce the budget
+
+        Args:
+            text: Input to fact-check
+            max_tokens: Token budget per fact check
+            action: "reject" raises for inputs over the budget, "trim" shortens them
+            max_chars: Hard character limit, rejected whatever the action (None = no limit)
+
+        Returns:
+            Tuple of (text to fact-check, pre-flight report with the estimate, budget,
+            action taken, tokens kept and the time the check took)
+
+        Raises:
+            InputTooLargeError: If the input is over max_chars, or over the budget with action "reject"
+        """
+        started = time.perf_counter()
+        estimated_tokens = Helpers.estimate_tokens(text)
+
+        if max_chars is not None:
+            is_valid, error = Validators.validate_text_length(text, max_length=max_chars)
+            if not is_valid:
+                raise InputTooLargeError(
+                    f"{error} (got {len(text):,}, about {estimated_tokens:,} tokens)",
+                    estimated_tokens,
+                    max_tokens
+                )
+
+        if estimated_tokens <= max_tokens:
+            checked, taken = text, "accepted"
+        elif action == "trim":
+            checked, taken = InputBudget.trim(text, max_tokens), "trimmed"
+        else:
+            raise InputTooLargeError(
+                f"Text is about {estimated_tokens:,} tokens, over the limit of {max_tokens:,} tokens "
+                f"(roughly {max_tokens * 4:,} characters) per fact check. Shorten it or split it into several checks.",
+                estimated_tokens,
+                max_tokens
+            )
+
+        return checked, {
+            "estimated_tokens": estimated_tokens,
+            "max_tokens": max_tokens,
+            "action": taken,
+            "checked_tokens": Helpers.estimate_tokens(checked),
+            "elapsed_us": round((time.perf_counter() - started) * 1e6, 1)
+        }
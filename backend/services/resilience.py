@@ -0,0 +1,393 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+import httpx
+from google.api_core import exceptions as gcp_exceptions
+from google.genai import errors as genai_errors
+from config.settings import settings
+
+# HTTP status codes worth retrying: throttling, timeouts and transient server errors
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# gRPC (Speech-to-Text) equivalents of the codes above
+_RETRYABLE_GCP_ERRORS = (
+    gcp_exceptions.TooManyRequests,
+    gcp_exceptions.ResourceExhausted,
+    gcp_exceptions.ServiceUnavailable,
+    gcp_exceptions.InternalServerError,
+    gcp_exceptions.DeadlineExceeded,
+    gcp_exceptions.GatewayTimeout,
+)
+
+class UpstreamUnavailableError(Exception):
+    """An upstream API is throttled or unhealthy; the request may be retried later"""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class CircuitOpenError(UpstreamUnavailableError):
+    """The circuit breaker is open and the call was not attempted"""
+
+class RateLimitTimeoutError(UpstreamUnavailableError):
+    """The local rate limit could not grant a slot within the allowed wait"""
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Decide whether a failed upstream call is worth retrying
+
+    Args:
+        error: Exception raised by the Gemini or Speech client
+
+    Returns:
+        True for throttling, timeouts, transient server errors and dropped connections
+    """
+    if isinstance(error, genai_errors.APIError):
+        return error.code in RETRYABLE_STATUS_CODES
+    if isinstance(error, _RETRYABLE_GCP_ERRORS):
+        return True
+    return isinstance(error, (httpx.TimeoutException, httpx.TransportError))
+
+def _retry_after_seconds(error: Exception) -> float:
+    """Server-requested delay from a Retry-After header, if any"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return 0.0
+    try:
+        return float(headers.get("retry-after", 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+class TokenBucket:
+    """Thread-safe token bucket; callers reserve a token and wait out the returned delay"""
+
+    def __init__(self, rate_per_second: float, capacity: float):
+        """
+        Initialize a full bucket
+
+        Args:
+            rate_per_second: Sustained refill rate (the quota)
+            capacity: Maximum burst size
+        """
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, max_wait: float) -> float:
+        """
+        Reserve one token
+
+        Tokens may go negative; the caller is queued behind earlier
+        reservations and must sleep for the returned delay.
+
+        Args:
+            max_wait: Longest acceptable delay in seconds
+
+        Returns:
+            Seconds to wait before making the call
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            delay = max(0.0, (1 - self._tokens) / self.rate)
+            if delay > max_wait:
+                raise RateLimitTimeoutError(
+                    f"Rate limit exceeded; next slot in {delay:.1f}s",
+                    retry_after=delay
+                )
+            self._tokens -= 1
+            return delay
+
+    def available(self) -> float:
+        """Tokens currently available (negative while callers are queued)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """
+        Initialize a closed breaker
+
+        Args:
+            failure_threshold: Consecutive retryable failures that open the circuit
+            reset_timeout: Seconds to stay open before letting a probe through
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self.times_opened = 0
+
+    def before_call(self) -> bool:
+        """
+        Raise CircuitOpenError unless a call may be attempted now
+
+        Returns:
+            True if this call is the half-open probe
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self._opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError("Upstream circuit is open", retry_after=remaining)
+                self.state = self.HALF_OPEN
+
+            if self.state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    raise CircuitOpenError("Upstream circuit is half-open; probe in flight", retry_after=1.0)
+                self._probe_in_flight = True
+                return True
+
+            return False
+
+    def record_success(self):
+        """Upstream answered; close the circuit"""
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """Upstream failed with a retryable error"""
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release(self, probe: bool):
+        """
+        The call was not made or had no outcome (rate limited, cancelled)
+
+        Args:
+            probe: Whether the call was the half-open probe (from before_call); only
+                then is the probe slot freed, never another caller's
+        """
+        if not probe:
+            return
+        with self._lock:
+            self._probe_in_flight = False
+
+class ResilientCaller:
+    """Rate limiting, jittered exponential retries and circuit breaking for one upstream API"""
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: float,
+        burst: int,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        failure_threshold: int,
+        reset_timeout: float,
+        max_rate_limit_wait: float
+    ):
+        """
+        Initialize the caller
+
+        Args:
+            name: Upstream name used in errors and metrics
+            requests_per_minute: Sustained request quota
+            burst: Requests allowed back to back
+            max_attempts: Attempts per call, including the first
+            base_delay: First retry delay in seconds
+            max_delay: Cap on a single retry delay in seconds
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open
+            max_rate_limit_wait: Longest a call may queue for a rate-limit slot
+        """
+        self.name = name
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.bucket = TokenBucket(requests_per_minute / 60, burst)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self._metrics_lock = threading.Lock()
+        self._metrics = {
+            "calls": 0,
+            "attempts": 0,
+            "successes": 0,
+            "failures": 0,
+            "retries": 0,
+            "retryable_errors": 0,
+            "non_retryable_errors": 0,
+            "rate_limit_waits": 0,
+            "rate_limit_wait_seconds": 0.0,
+            "rate_limit_rejections": 0,
+            "circuit_rejections": 0,
+        }
+
+    def _count(self, name: str, amount: float = 1):
+        with self._metrics_lock:
+            self._metrics[name] += amount
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """Full-jitter exponential delay, never shorter than a server Retry-After"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return max(random.uniform(0, ceiling), min(_retry_after_seconds(error), self.max_delay))
+
+    def _admit(self) -> Tuple[float, bool]:
+        """Check the breaker and reserve a rate-limit slot; returns (delay to wait, whether this is the probe)"""
+        try:
+            probe = self.breaker.before_call()
+        except CircuitOpenError:
+            self._count("circuit_rejections")
+            raise
+
+        try:
+            delay = self.bucket.reserve(self.max_rate_limit_wait)
+        except RateLimitTimeoutError:
+            self.breaker.release(probe)
+            self._count("rate_limit_rejections")
+            raise
+
+        if delay:
+            self._count("rate_limit_waits")
+            self._count("rate_limit_wait_seconds", delay)
+        self._count("attempts")
+        return delay, probe
+
+    def _on_error(self, attempt: int, error: Exception) -> float:
+        """
+        Record a failed attempt
+
+        Returns:
+            Delay before the next attempt
+
+        Raises:
+            The original error if it is not retryable, or UpstreamUnavailableError
+            once attempts are exhausted
+        """
+        if not is_retryable(error):
+            # Upstream is healthy enough to reject the request itself
+            self.breaker.record_success()
+            self._count("non_retryable_errors")
+            raise error
+
+        self.breaker.record_failure()
+        self._count("retryable_errors")
+
+        if attempt >= self.max_attempts:
+            raise UpstreamUnavailableError(
+                f"{self.name} unavailable after {attempt} attempts: {error}",
+                retry_after=_retry_after_seconds(error) or self.base_delay
+            ) from error
+
+        self._count("retries")
+        return self._backoff(attempt, error)
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call a blocking upstream function with rate limiting, retries and circuit breaking
+
+        Args:
+            fn: Client method to call
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Result of fn
+        """
+        self._count("calls")
+        try:
+            for attempt in range(1, self.max_attempts + 1):
+                delay, _ = self._admit()
+                if delay:
+                    time.sleep(delay)
+                try:
+                    result = fn(*args, **kwargs)
+                except Exception as e:
+                    time.sleep(self._on_error(attempt, e))
+                    continue
+                self.breaker.record_success()
+                self._count("successes")
+                return result
+        except Exception:
+            self._count("failures")
+            raise
+
+    async def call_async(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await an upstream coroutine with rate limiting, retries and circuit breaking
+
+        Args:
+            fn: Coroutine factory; called once per attempt
+
+        Returns:
+            Result of the coroutine
+        """
+        self._count("calls")
+        try:
+            for attempt in range(1, self.max_attempts + 1):
+                delay, probe = self._admit()
+                try:
+                    if delay:
+                        await asyncio.sleep(delay)
+                    result = await fn()
+                except Exception as e:
+                    await asyncio.sleep(self._on_error(attempt, e))
+                    continue
+                except BaseException:
+                    # Cancelled before an outcome; a half-open probe must not stay claimed
+                    self.breaker.release(probe)
+                    raise
+                self.breaker.record_success()
+                self._count("successes")
+                return result
+        except Exception:
+            self._count("failures")
+            raise
+
+    def stats(self) -> Dict:
+        """
+        Limiter, retry and breaker metrics
+
+        Returns:
+            Counters plus the current breaker state and available tokens
+        """
+        with self._metrics_lock:
+            stats = dict(self._metrics)
+        stats["rate_limit_wait_seconds"] = round(stats["rate_limit_wait_seconds"], 3)
+        stats["tokens_available"] = round(self.bucket.available(), 2)
+        stats["circuit_state"] = self.breaker.state
+        stats["circuit_opened"] = self.breaker.times_opened
+        return stats
+
+def _caller_from_settings(name: str, requests_per_minute: float, burst: int) -> ResilientCaller:
+    return ResilientCaller(
+        name=name,
+        requests_per_minute=requests_per_minute,
+        burst=burst,
+        max_attempts=settings.UPSTREAM_MAX_ATTEMPTS,
+        base_delay=settings.UPSTREAM_RETRY_BASE_SECONDS,
+        max_delay=settings.UPSTREAM_RETRY_MAX_SECONDS,
+        failure_threshold=settings.UPSTREAM_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout=settings.UPSTREAM_CIRCUIT_RESET_SECONDS,
+        max_rate_limit_wait=settings.UPSTREAM_RATE_LIMIT_MAX_WAIT_SECONDS
+    )
+
+# Shared callers, one per upstream API
+gemini_resilience = _caller_from_settings("Gemini", settings.GEMINI_REQUESTS_PER_MINUTE, settings.GEMINI_BURST)
+speech_resilience = _caller_from_settings("Speech-to-Text", settings.SPEECH_REQUESTS_PER_MINUTE, settings.SPEECH_BURST)
@@ -0,0 +1,236 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+from config.settings import settings
+from utils.helpers import Helpers
+
+class FactCheckCache:
+    """Two-tier fact-check result cache (in-memory LRU + on-disk) keyed by normalized claim text"""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        memory_entries: int,
+        ttl_seconds: float,
+        disk_entries: int = 100000,
+        prune_every: int = 500
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir: Directory for the on-disk tier
+            memory_entries: Maximum entries held in the in-memory tier
+            ttl_seconds: Age after which an entry is treated as a miss
+            disk_entries: Maximum entries kept in the on-disk tier
+            prune_every: Stores between two prunes of the on-disk tier
+        """
+        self.cache_dir = cache_dir
+        self.memory_entries = memory_entries
+        self.ttl_seconds = ttl_seconds
+        self.disk_entries = disk_entries
+        self.prune_every = prune_every
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._prune_lock = threading.Lock()
+        self._stores_since_prune = 0
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "expired": 0, "stores": 0, "pruned": 0}
+
+    @staticmethod
+    def make_key(text: str) -> str:
+        """Cache key for a claim: SHA-256 of its normalized text"""
+        return hashlib.sha256(Helpers.normalize_claim_text(text).encode("utf-8")).hexdigest()
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _is_fresh(self, entry: Dict) -> bool:
+        return time.time() - entry["created_at"] < self.ttl_seconds
+
+    def _remember(self, key: str, entry: Dict):
+        """Insert into the memory tier, evicting the least recently used entry (caller holds _lock)"""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, text: str) -> Optional[Dict]:
+        """
+        Look up a cached fact-check result
+
+        Args:
+            text: Claim text
+
+        Returns:
+            Cached result dictionary, or None on a miss
+        """
+        key = self.make_key(text)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if self._is_fresh(entry):
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return entry["result"]
+                del self._memory[key]
+
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+
+        with self._lock:
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            if not self._is_fresh(entry):
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                path.unlink(missing_ok=True)
+                return None
+
+            self._remember(key, entry)
+            self._stats["disk_hits"] += 1
+            return entry["result"]
+
+    def set(self, text: str, result: Dict):
+        """
+        Store a fact-check result in both tiers
+
+        Args:
+            text: Claim text
+            result: Result dictionary from GeminiService
+        """
+        key = self.make_key(text)
+        entry = {"created_at": time.time(), "result": result}
+
+        path = self._disk_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            self._remember(key, entry)
+            self._stats["stores"] += 1
+            self._stores_since_prune += 1
+            due = self._stores_since_prune >= self.prune_every
+            if due:
+                self._stores_since_prune = 0
+
+        if due:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        Drop expired on-disk entries, then the oldest ones beyond disk_entries
+
+        Entries are otherwise only dropped when read, so unread ones would
+        accumulate forever.
+
+        Returns:
+            Number of on-disk entries removed
+        """
+        # One prune at a time; a store that finds one running skips its own
+        if not self._prune_lock.acquire(blocking=False):
+            return 0
+
+        try:
+            oldest_allowed = time.time() - self.ttl_seconds
+            entries = []
+            removed = 0
+            for path in self.cache_dir.glob("*/*.json"):
+                try:
+                    modified = path.stat().st_mtime
+                except OSError:
+                    continue
+                # Files are written once per store, so their mtime is the entry's age
+                if modified < oldest_allowed:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+                else:
+                    entries.append((modified, path))
+
+            if len(entries) > self.disk_entries:
+                entries.sort()
+                for _, path in entries[:len(entries) - self.disk_entries]:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+        finally:
+            self._prune_lock.release()
+
+        with self._lock:
+            self._stats["pruned"] += removed
+        return removed
+
+    def invalidate(self, text: str) -> bool:
+        """
+        Remove the entry for a claim from both tiers
+
+        Args:
+            text: Claim text
+
+        Returns:
+            True if an entry was removed
+        """
+        key = self.make_key(text)
+        path = self._disk_path(key)
+
+        with self._lock:
+            removed = self._memory.pop(key, None) is not None
+
+        if path.exists():
+            path.unlink(missing_ok=True)
+            removed = True
+
+        return removed
+
+    def clear(self) -> int:
+        """
+        Remove every entry from both tiers
+
+        Returns:
+            Number of on-disk entries removed
+        """
+        with self._lock:
+            self._memory.clear()
+
+        removed = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def stats(self) -> Dict:
+        """
+        Hit-rate statistics
+
+        Returns:
+            Counters plus the overall hit rate
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0
+        stats["ttl_hours"] = self.ttl_seconds / 3600
+        return stats
+
+# Shared cache instance
+fact_check_cache = FactCheckCache(
+    cache_dir=settings.CACHE_FOLDER / "fact_checks",
+    memory_entries=settings.FACT_CHECK_CACHE_MEMORY_ENTRIES,
+    ttl_seconds=settings.FACT_CHECK_CACHE_TTL_HOURS * 3600,
+    disk_entries=settings.FACT_CHECK_CACHE_DISK_ENTRIES
+)
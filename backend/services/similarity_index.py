@@ -0,0 +1,274 @@
+import threading
+import time
+import zlib
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from config.settings import settings
+from utils.helpers import Helpers
+
+# Mersenne prime used by the universal hash family
+_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# A reworded claim that flips negation can still share most shingles, so
+# candidates must carry the same negation words to count as a match
+_NEGATIONS = {"not", "no", "never", "nor", "none", "nobody", "nothing", "neither", "without", "t"}
+
+class MinHashLSHIndex:
+    """
+    In-memory MinHash + LSH index over the texts of recent fact checks.
+
+    Texts are reduced to word shingles of their normalized form, each text
+    gets a MinHash signature, and signatures are split into bands whose
+    hashes act as LSH buckets. Lookups only compare against texts sharing
+    at least one bucket, so query cost does not grow with the index size.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 2,
+        max_entries: int = 50000,
+        max_age_seconds: float = 72 * 3600,
+        seed: int = 7
+    ):
+        """
+        Initialize the index
+
+        Args:
+            num_perm: Number of MinHash permutations (signature length)
+            bands: Number of LSH bands; num_perm must be divisible by it
+            shingle_size: Words per shingle
+            max_entries: Oldest entries are evicted beyond this size
+            max_age_seconds: Entries older than this are never matched
+            seed: Seed for the hash family
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 31, size=num_perm, dtype=np.uint64)
+
+        self._entries: "OrderedDict[int, Dict]" = OrderedDict()
+        self._buckets: List[Dict[bytes, set]] = [defaultdict(set) for _ in range(bands)]
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _negations(words: List[str]) -> Tuple[str, ...]:
+        """Sorted negation words of a normalized text"""
+        return tuple(sorted(word for word in words if word in _NEGATIONS))
+
+    def _shingles(self, words: List[str]) -> set:
+        """Word shingles of a normalized text"""
+        if len(words) <= self.shingle_size:
+            return {" ".join(words)} if words else set()
+        return {
+            " ".join(words[i:i + self.shingle_size])
+            for i in range(len(words) - self.shingle_size + 1)
+        }
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """
+        Compute the MinHash signature of a text
+
+        Args:
+            text: Text to sign
+
+        Returns:
+            Signature array, or None for empty text
+        """
+        shingles = self._shingles(Helpers.normalize_claim_text(text).split())
+        if not shingles:
+            return None
+
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _PRIME & _MAX_HASH
+        return permuted.min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def _remove_locked(self, key: int):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for band, band_key in enumerate(entry["band_keys"]):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def add(self, key: int, text: str, payload: Dict, created_at: Optional[float] = None):
+        """
+        Add or replace a text in the index
+
+        Args:
+            key: Fact check id
+            text: Text that was fact-checked
+            payload: Data returned on a match (e.g. response and citations)
+            created_at: Epoch seconds of the fact check (default: now)
+        """
+        signature = self.signature(text)
+        if signature is None:
+            return
+
+        band_keys = self._band_keys(signature)
+        negations = self._negations(Helpers.normalize_claim_text(text).split())
+
+        with self._lock:
+            self._remove_locked(key)
+            self._entries[key] = {
+                "signature": signature,
+                "band_keys": band_keys,
+                "negations": negations,
+                "payload": payload,
+                "created_at": created_at or time.time()
+            }
+            for band, band_key in enumerate(band_keys):
+                self._buckets[band][band_key].add(key)
+
+            while len(self._entries) > self.max_entries:
+                self._remove_locked(next(iter(self._entries)))
+
+    def remove(self, key: int):
+        """Remove a fact check from the index"""
+        with self._lock:
+            self._remove_locked(key)
+
+    def remove_text(self, text: str, threshold: float) -> int:
+        """
+        Remove every entry a query for `text` could match
+
+        Args:
+            text: Text whose prior results must no longer be reused
+            threshold: Similarity threshold used by queries
+
+        Returns:
+            Number of entries removed
+        """
+        signature = self.signature(text)
+        if signature is None:
+            return 0
+
+        negations = self._negations(Helpers.normalize_claim_text(text).split())
+
+        with self._lock:
+            candidates = set()
+            for band, band_key in enumerate(self._band_keys(signature)):
+                candidates.update(self._buckets[band].get(band_key, ()))
+
+            removed = 0
+            for key in candidates:
+                entry = self._entries[key]
+                if entry["negations"] != negations:
+                    continue
+                if float(np.count_nonzero(entry["signature"] == signature)) / self.num_perm >= threshold:
+                    self._remove_locked(key)
+                    removed += 1
+
+        return removed
+
+    def clear(self) -> int:
+        """
+        Remove every entry
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+            for bucket in self._buckets:
+                bucket.clear()
+        return removed
+
+    def query(self, text: str, threshold: float) -> Optional[Tuple[int, float, Dict]]:
+        """
+        Find the most similar recent text above a Jaccard similarity threshold
+
+        Args:
+            text: Text to look up
+            threshold: Minimum estimated Jaccard similarity
+
+        Returns:
+            Tuple of (key, similarity, payload), or None
+        """
+        signature = self.signature(text)
+        if signature is None:
+            return None
+
+        negations = self._negations(Helpers.normalize_claim_text(text).split())
+        oldest_allowed = time.time() - self.max_age_seconds
+        best = None
+
+        with self._lock:
+            candidates = set()
+            for band, band_key in enumerate(self._band_keys(signature)):
+                candidates.update(self._buckets[band].get(band_key, ()))
+
+            for key in candidates:
+                entry = self._entries[key]
+                if entry["created_at"] < oldest_allowed or entry["negations"] != negations:
+                    continue
+                similarity = float(np.count_nonzero(entry["signature"] == signature)) / self.num_perm
+                if similarity >= threshold and (best is None or similarity > best[1]):
+                    best = (key, similarity, entry["payload"])
+
+        return best
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load_fact_checks(self, fact_checks: List[Dict]):
+        """
+        Warm the index from stored fact-check records
+
+        Records whose transcript was condensed or whose text was trimmed
+        were looked up by a different text than the one stored, and are
+        left out.
+
+        Args:
+            fact_checks: Records as returned by Database.get_all_fact_checks
+        """
+        oldest_allowed = time.time() - self.max_age_seconds
+
+        for fact_check in reversed(fact_checks[:self.max_entries]):
+            text = fact_check.get("extracted_text")
+            if not text or fact_check.get("condensation") or (fact_check.get("preflight") or {}).get("action") == "trimmed":
+                continue
+            created_at = Helpers.parse_timestamp(str(fact_check.get("timestamp", ""))).timestamp()
+            if created_at < oldest_allowed:
+                continue
+            self.add(
+                int(fact_check["fact_check_id"]),
+                text,
+                {
+                    "response": fact_check["gemini_response"],
+                    "citations": fact_check["citations"]
+                },
+                created_at=created_at
+            )
+
+# Shared index instance; a reused verdict never outlives the result cache's TTL
+similarity_index = MinHashLSHIndex(
+    max_entries=settings.NEAR_DUPLICATE_MAX_ENTRIES,
+    max_age_seconds=min(settings.NEAR_DUPLICATE_MAX_AGE_HOURS, settings.FACT_CHECK_CACHE_TTL_HOURS) * 3600
+)
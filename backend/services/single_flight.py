@@ -0,0 +1,49 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+class SingleFlight:
+    """Coalesce concurrent identical async calls into one shared upstream call"""
+
+    def __init__(self):
+        """Initialize an empty in-flight table"""
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._stats = {"calls": 0, "upstream_calls": 0, "calls_avoided": 0}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `fn` once per key among concurrent callers
+
+        The upstream call runs as its own task, so a caller that disconnects
+        does not cancel the call for the others waiting on it.
+
+        Args:
+            key: Identity of the call (e.g. normalized text or content hash)
+            fn: Coroutine factory performing the upstream call
+
+        Returns:
+            The shared result; callers must not mutate it
+        """
+        self._stats["calls"] += 1
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._stats["calls_avoided"] += 1
+        else:
+            self._stats["upstream_calls"] += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict:
+        """
+        Coalescing counters
+
+        Returns:
+            Calls seen, upstream calls made, calls avoided and calls in flight
+        """
+        return {**self._stats, "in_flight": len(self._in_flight)}
+
+# Shared instance for Gemini fact-check calls
+gemini_single_flight = SingleFlight()
@@ -1,11 +1,21 @@
-import os
+import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+import grpc
+from google.api_core import exceptions as gcp_exceptions
 from google.cloud import speech_v1
+from google.cloud.speech_v1.services.speech.transports import SpeechGrpcTransport
 from google.oauth2 import service_account
 from config.settings import settings
+from services.resilience import UpstreamUnavailableError, speech_resilience
+from services.voice_activity import voice_activity_detector
 import wave
 import contextlib
 
+# Longest tail of a stream recognized again by the next one when it was cut mid-result
+_MAX_RESENT_SECONDS = 10
+
 class SpeechToTextService:
     """Google Cloud Speech-to-Text service"""
 
@@ -20,7 +30,11 @@ class SpeechToTextService:
             project_root = Path(__file__).parent.parent.parent
             credentials_path = project_root / credentials_path
         
-        if credentials_path.exists():
+        if settings.SPEECH_API_ENDPOINT:
+            # Local stand-in server: plaintext channel, no credentials
+            channel = grpc.insecure_channel(settings.SPEECH_API_ENDPOINT)
+            self.client = speech_v1.SpeechClient(transport=SpeechGrpcTransport(channel=channel))
+        elif credentials_path.exists():
             # Use service account credentials
             credentials = service_account.Credentials.from_service_account_file(
                 str(credentials_path)
@@ -55,13 +69,16 @@ class SpeechToTextService:
             # If we can't determine duration, assume it might be long
             return 61.0  # Return >60 to trigger chunking
 
-    def transcribe_audio(self, audio_file_path: str) -> str:
+    def transcribe_audio(self, audio_file_path: str, on_partial: Optional[Callable[[str], None]] = None) -> str:
         """
         Transcribe audio file to text
-        Automatically handles long audio files by chunking
+        Automatically handles long audio files by chunking, or by streaming
+        recognition when SPEECH_STREAMING_ENABLED is set
 
         Args:
             audio_file_path: Path to the audio file
+            on_partial: Called with the transcript so far as streaming results
+                arrive (streaming mode only; the text may still be revised)
 
         Returns:
             Transcribed text
@@ -72,13 +89,30 @@ class SpeechToTextService:
         # Check audio duration
         duration = self._get_audio_duration(audio_file_path)
         
-        # If audio is longer than 60 seconds, use chunked transcription
+        # If audio is longer than 60 seconds, stream it or use chunked transcription
         if duration > 60:
+            if settings.SPEECH_STREAMING_ENABLED:
+                return self._transcribe_streaming(audio_file_path, duration, on_partial)
             return self._transcribe_long_audio(audio_file_path, duration)
         
         # For short audio, use synchronous recognition
         return self._transcribe_short_audio(audio_file_path)
 
+    def _recognize(self, config, audio):
+        """
+        Run synchronous recognition through the shared resilience layer
+
+        The client's own retry is disabled so throttling is retried in one place.
+
+        Args:
+            config: RecognitionConfig
+            audio: RecognitionAudio
+
+        Returns:
+            RecognizeResponse
+        """
+        return speech_resilience.call(self.client.recognize, config=config, audio=audio, retry=None)
+
     def _transcribe_short_audio(self, audio_file_path: str) -> str:
         """
         Transcribe short audio file (< 1 minute) using synchronous recognition
@@ -93,25 +127,41 @@ class SpeechToTextService:
         with open(audio_file_path, "rb") as audio_file:
             content = audio_file.read()
 
+        return self._transcribe_content(content)
+
+    def _transcribe_content(self, content: bytes, sample_rate_hertz: int = 16000, channel_count: int = 1) -> str:
+        """
+        Transcribe audio bytes (a WAV file, or raw 16-bit PCM) using synchronous recognition
+
+        Args:
+            content: Audio bytes, at most a minute long
+            sample_rate_hertz: Sample rate of raw PCM (a WAV header takes precedence)
+            channel_count: Channels of raw PCM
+
+        Returns:
+            Transcribed text
+        """
         audio = speech_v1.RecognitionAudio(content=content)
 
         # Configure recognition
         config = speech_v1.RecognitionConfig(
             encoding=speech_v1.RecognitionConfig.AudioEncoding.LINEAR16,
-            sample_rate_hertz=16000,
+            sample_rate_hertz=sample_rate_hertz,
             language_code="en-US",
             enable_automatic_punctuation=True,
-            audio_channel_count=1,
+            audio_channel_count=channel_count,
             enable_word_time_offsets=False,
         )
 
         # Try with auto-detect encoding if LINEAR16 fails
         try:
-            response = self.client.recognize(config=config, audio=audio)
+            response = self._recognize(config, audio)
+        except UpstreamUnavailableError:
+            raise
         except Exception as e:
             # Retry with different encoding
             config.encoding = speech_v1.RecognitionConfig.AudioEncoding.ENCODING_UNSPECIFIED
-            response = self.client.recognize(config=config, audio=audio)
+            response = self._recognize(config, audio)
 
         # Combine all transcripts
         transcripts = []
@@ -124,47 +174,204 @@ class SpeechToTextService:
 
         return " ".join(transcripts)
 
+    @staticmethod
+    def _read_chunk(audio_file_path: str, ranges: List[Tuple[int, int]]) -> bytes:
+        """
+        Read one chunk of a WAV file as audio bytes, without loading the rest
+
+        Args:
+            audio_file_path: Path to the WAV file
+            ranges: (start, end) frame ranges of the chunk, joined in order
+
+        Returns:
+            Raw PCM frames for 16-bit audio; other sample widths keep a WAV
+            header so the encoding can be detected
+        """
+        with contextlib.closing(wave.open(audio_file_path, 'rb')) as wav:
+            parts = []
+            for start_frame, end_frame in ranges:
+                wav.setpos(start_frame)
+                parts.append(wav.readframes(end_frame - start_frame))
+            frames = b"".join(parts) if len(parts) > 1 else parts[0]
+            if wav.getsampwidth() == 2:
+                return frames
+
+            buffer = io.BytesIO()
+            with contextlib.closing(wave.open(buffer, 'wb')) as chunk:
+                chunk.setparams(wav.getparams())
+                chunk.writeframes(frames)
+            return buffer.getvalue()
+
     def _transcribe_long_audio(self, audio_file_path: str, duration: float) -> str:
         """
         Transcribe long audio file by splitting it into chunks
-        
+
+        With SPEECH_VAD_ENABLED, only the speech found by voice activity
+        detection is sent, packed into chunks cut at pauses; otherwise the
+        audio is cut every 50 seconds. Chunks are read straight from the WAV
+        file when their turn comes, so memory use depends on the chunk size
+        and concurrency, not the audio length. They are recognized
+        concurrently (up to SPEECH_CHUNK_CONCURRENCY at a time), each with its
+        own retries through the resilience layer, and the transcripts are
+        joined in audio order.
+
         Args:
             audio_file_path: Path to the audio file
             duration: Duration of the audio in seconds
-            
+
         Returns:
             Transcribed text
         """
-        import wave
-        from pydub import AudioSegment
-        import tempfile
-        
-        # Split audio into 50-second chunks (leaving margin for safety)
-        chunk_duration_ms = 50 * 1000  # 50 seconds in milliseconds
-        
-        # Load audio file
-        audio = AudioSegment.from_wav(audio_file_path)
-        
+        with contextlib.closing(wave.open(audio_file_path, 'rb')) as wav:
+            sample_rate = wav.getframerate()
+            channels = wav.getnchannels()
+            sample_width = wav.getsampwidth()
+            total_frames = wav.getnframes()
+
+        if settings.SPEECH_VAD_ENABLED and sample_width == 2:
+            chunks = voice_activity_detector.chunk_ranges(audio_file_path)
+            if not chunks:
+                raise Exception("No speech detected in the audio")
+        else:
+            # Split audio into 50-second chunks (leaving margin for safety)
+            chunk_frames = 50 * sample_rate
+            chunks = [
+                [(start_frame, min(start_frame + chunk_frames, total_frames))]
+                for start_frame in range(0, total_frames, chunk_frames)
+            ]
+
+        def transcribe_chunk(ranges: List[Tuple[int, int]]) -> str:
+            content = self._read_chunk(audio_file_path, ranges)
+            return self._transcribe_content(content, sample_rate_hertz=sample_rate, channel_count=channels)
+
+        workers = max(1, min(settings.SPEECH_CHUNK_CONCURRENCY, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="speech-chunk") as pool:
+            futures = [pool.submit(transcribe_chunk, ranges) for ranges in chunks]
+            try:
+                transcripts = [future.result() for future in futures]
+            except BaseException:
+                # One chunk failed for good; don't send the ones still queued
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return " ".join(transcripts)
+
+    def _transcribe_streaming(
+        self,
+        audio_file_path: str,
+        duration: float,
+        on_partial: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Transcribe long audio over streaming recognition
+
+        PCM frames are read from the WAV file as the stream consumes them.
+        Each stream carries at most SPEECH_STREAM_MAX_SECONDS of audio and
+        the next one resumes at the end offset of its last final result. The
+        result finalized by closing the stream may end mid-word, so when it
+        is short it is dropped and its audio recognized again in one piece
+        by the next stream; a long one is kept, so little audio is ever sent
+        twice. A stream ended early by the provider's duration limit resumes
+        the same way. Streams are retried through the resilience layer from
+        their starting point.
+
+        Args:
+            audio_file_path: Path to the audio file
+            duration: Duration of the audio in seconds
+            on_partial: Called with the transcript so far as results arrive
+
+        Returns:
+            Transcribed text
+        """
+        with contextlib.closing(wave.open(audio_file_path, 'rb')) as wav:
+            sample_rate = wav.getframerate()
+            channels = wav.getnchannels()
+            sample_width = wav.getsampwidth()
+            total_frames = wav.getnframes()
+
+        if sample_width != 2:
+            # Streaming takes raw LINEAR16 only; other sample widths go through the chunked path
+            return self._transcribe_long_audio(audio_file_path, duration)
+
+        frames_per_request = max(1, sample_rate * settings.SPEECH_STREAM_FRAME_MS // 1000)
+        frames_per_stream = int(sample_rate * settings.SPEECH_STREAM_MAX_SECONDS)
+        max_resent_frames = int(sample_rate * _MAX_RESENT_SECONDS)
+        streaming_config = speech_v1.StreamingRecognitionConfig(
+            config=speech_v1.RecognitionConfig(
+                encoding=speech_v1.RecognitionConfig.AudioEncoding.LINEAR16,
+                sample_rate_hertz=sample_rate,
+                language_code="en-US",
+                enable_automatic_punctuation=True,
+                audio_channel_count=channels,
+            ),
+            interim_results=on_partial is not None
+        )
+
         transcripts = []
-        
-        # Process audio in chunks
-        for i, start_ms in enumerate(range(0, len(audio), chunk_duration_ms)):
-            end_ms = min(start_ms + chunk_duration_ms, len(audio))
-            chunk = audio[start_ms:end_ms]
-            
-            # Save chunk to temporary file
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                chunk_path = temp_file.name
-                chunk.export(chunk_path, format='wav')
-            
+        position = {"frame": 0}
+
+        def audio_requests(start_frame: int, end_frame: int):
+            with contextlib.closing(wave.open(audio_file_path, 'rb')) as wav:
+                wav.setpos(start_frame)
+                frame = start_frame
+                while frame < end_frame:
+                    frames = wav.readframes(min(frames_per_request, end_frame - frame))
+                    if not frames:
+                        return
+                    frame += frames_per_request
+                    yield speech_v1.StreamingRecognizeRequest(audio_content=frames)
+
+        def run_stream():
+            start_frame = position["frame"]
+            end_frame = min(start_frame + frames_per_stream, total_frames)
+            # (transcript, frame where it ends) of this stream's final results
+            finals = []
+            limit_reached = False
+
+            responses = self.client.streaming_recognize(
+                config=streaming_config,
+                requests=audio_requests(start_frame, end_frame),
+                retry=None
+            )
             try:
-                # Transcribe chunk
-                chunk_transcript = self._transcribe_short_audio(chunk_path)
-                transcripts.append(chunk_transcript)
-            finally:
-                # Clean up temporary file
-                os.unlink(chunk_path)
-        
+                for response in responses:
+                    for result in response.results:
+                        if not result.alternatives:
+                            continue
+                        text = result.alternatives[0].transcript.strip()
+                        if result.is_final:
+                            end = start_frame + int(result.result_end_time.total_seconds() * sample_rate)
+                            finals.append((text, end))
+                        if on_partial:
+                            heard = transcripts + [final for final, _ in finals]
+                            on_partial(" ".join(heard if result.is_final else heard + [text]))
+            except gcp_exceptions.OutOfRange:
+                # Stream duration limit reached before our own cut
+                if not finals:
+                    raise
+                limit_reached = True
+            except BaseException:
+                # Stopped reading early (e.g. on_partial raised); stop sending audio too
+                responses.cancel()
+                raise
+
+            if (end_frame < total_frames and not limit_reached and len(finals) > 1
+                    and end_frame - finals[-2][1] <= max_resent_frames):
+                # The last result was finalized by closing the stream, possibly mid-word
+                finals.pop()
+            transcripts.extend(text for text, _ in finals if text)
+            if end_frame == total_frames and not limit_reached:
+                position["frame"] = total_frames
+            else:
+                position["frame"] = finals[-1][1] if finals and finals[-1][1] > start_frame else end_frame
+
+        while position["frame"] < total_frames:
+            speech_resilience.call(run_stream)
+
+        if not transcripts:
+            raise Exception("No transcription results found")
+
         return " ".join(transcripts)
 
     def transcribe_audio_long(self, audio_file_path: str) -> str:
@@ -0,0 +1,138 @@
+import re
+from typing import Dict, List
+from services.claim_extractor import ClaimExtractor
+from utils.helpers import Helpers
+
+# Hesitation sounds are dropped as standalone words, except after a number ("5 mm", "3 um")
+_HESITATION = r"(?:u+m+|u+h+|e+r+m*|a+h+|h+m+|m+h*m+)"
+_HESITATION_PATTERN = re.compile(rf"(?:^|(?<=\s))(?<!\d\s){_HESITATION}\b[,.]?\s*", re.IGNORECASE)
+# Discourse fillers are dropped only as interjections (sentence start or between commas),
+# so "I like it" and "it actually rose" keep their meaning
+_INTERJECTION = r"(?:you know|i mean|like|basically|actually|literally|honestly|so|okay|ok|right|well|anyway)"
+_LEADING_FILLER_PATTERN = re.compile(rf"^(?:{_INTERJECTION}\s*,\s*)+", re.IGNORECASE)
+# Fillers set off by commas go with both commas: "is, um, made" -> "is made"
+_FILLER = rf"(?:{_INTERJECTION}|{_HESITATION})\b"
+_INNER_FILLER_PATTERN = re.compile(rf",\s*{_FILLER}(?:[\s,]+{_FILLER})*\s*,\s*(?=(\w*))", re.IGNORECASE)
+# A clause continuing after the filler keeps its comma: "went home, you know, and slept"
+_CLAUSE_CONTINUATIONS = {"and", "but", "or", "so", "yet", "which", "who", "because", "while", "although", "though"}
+_STUTTER_PATTERN = re.compile(r"\b([^\W\d_]+)(?:[\s,]+\1\b)+", re.IGNORECASE)
+# Words that are repeated in grammatical speech ("that that", "had had", "is is", "so so")
+_GRAMMATICAL_REPEATS = {"that", "had", "is", "was", "do", "did", "very", "really", "so", "no", "yes", "bye", "ha"}
+_SPACE_BEFORE_PUNCTUATION_PATTERN = re.compile(r"\s+(?=[,.!?])")
+_DANGLING_COMMA_PATTERN = re.compile(r",+(?=[,.!?])")
+
+class TranscriptCondenser:
+    """Shrink long speech transcripts to their factual assertions before fact-checking"""
+
+    @staticmethod
+    def _collapse_stutter(match: re.Match) -> str:
+        """Keep one copy of a stuttered word, unless the repeat can be grammatical"""
+        if match.group(1).lower() in _GRAMMATICAL_REPEATS:
+            return match.group(0)
+        return match.group(1)
+
+    @staticmethod
+    def _drop_inner_filler(match: re.Match) -> str:
+        """Replace a comma-bracketed filler with a comma before a new clause, else a space"""
+        return ", " if match.group(1).lower() in _CLAUSE_CONTINUATIONS else " "
+
+    @staticmethod
+    def strip_filler(sentence: str) -> str:
+        """
+        Remove hesitations, filler interjections and stuttered repeats
+
+        Args:
+            sentence: A single transcript sentence
+
+        Returns:
+            Cleaned sentence (may be empty)
+        """
+        sentence = _LEADING_FILLER_PATTERN.sub("", sentence.strip())
+        sentence = _INNER_FILLER_PATTERN.sub(TranscriptCondenser._drop_inner_filler, sentence)
+        sentence = _HESITATION_PATTERN.sub("", sentence)
+        sentence = _STUTTER_PATTERN.sub(TranscriptCondenser._collapse_stutter, sentence)
+        sentence = _SPACE_BEFORE_PUNCTUATION_PATTERN.sub("", sentence)
+        sentence = _DANGLING_COMMA_PATTERN.sub("", sentence)
+        sentence = " ".join(sentence.split()).strip(" ,")
+        return sentence[:1].upper() + sentence[1:]
+
+    @staticmethod
+    def clean_sentences(text: str) -> List[str]:
+        """
+        Split a transcript into filler-free sentences, dropping repeats
+
+        Args:
+            text: Transcript
+
+        Returns:
+            Unique cleaned sentences in their original order
+        """
+        sentences = []
+        seen = set()
+
+        for sentence in ClaimExtractor.split_sentences(text):
+            sentence = TranscriptCondenser.strip_filler(sentence)
+            normalized = Helpers.normalize_claim_text(sentence)
+            if not normalized or normalized in seen:
+                continue
+            seen.add(normalized)
+            sentences.append(sentence)
+
+        return sentences
+
+    @staticmethod
+    def condense(sentences: List[str], max_tokens: int) -> List[str]:
+        """
+        Keep the most check-worthy sentences that fit a token budget
+
+        Sentences are ranked with ClaimExtractor.score_sentence; ones that
+        assert nothing checkable are dropped and the rest are kept in
+        transcript order.
+
+        Args:
+            sentences: Output of clean_sentences
+            max_tokens: Token budget for the condensed text
+
+        Returns:
+            Selected sentences in their original order (empty if none fit)
+        """
+        scored = []
+        for position, sentence in enumerate(sentences):
+            score = ClaimExtractor.score_sentence(sentence)
+            if score:
+                scored.append((score, position, sentence))
+
+        selected = []
+        used_tokens = 0
+        for _, position, sentence in sorted(scored, key=lambda item: (-item[0], item[1])):
+            tokens = Helpers.estimate_tokens(sentence)
+            if used_tokens + tokens > max_tokens:
+                continue
+            selected.append((position, sentence))
+            used_tokens += tokens
+
+        return [sentence for _, sentence in sorted(selected)]
+
+    @staticmethod
+    def report(original: str, condensed: str, method: str) -> Dict:
+        """
+        Describe the reduction achieved
+
+        Args:
+            original: Transcript as recognized
+            condensed: Text that was fact-checked
+            method: extractive, summary or filler_only
+
+        Returns:
+            Method, character and estimated token counts, and the token reduction in percent
+        """
+        original_tokens = Helpers.estimate_tokens(original)
+        condensed_tokens = Helpers.estimate_tokens(condensed)
+        return {
+            "method": method,
+            "original_chars": len(original),
+            "condensed_chars": len(condensed),
+            "original_tokens": original_tokens,
+            "condensed_tokens": condensed_tokens,
+            "token_reduction": round(100 * (1 - condensed_tokens / original_tokens), 1) if original_tokens else 0.0
+        }
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import pandas as pd
+from config.settings import settings
+from services.database import Database
+from services.gemini_service import USAGE_FIELDS
+
+KEY_COLUMNS = ["date", "user_id", "upload_type"]
+COUNT_COLUMNS = ["fact_checks", *USAGE_FIELDS]
+
+class UsageTracker:
+    """
+    Per-user, per-day Gemini token accounting.
+
+    Fact checks add to in-memory counters; a periodic flush merges them
+    into a daily CSV table, so request handling never rewrites the table.
+    """
+
+    def __init__(self, csv_path: Path):
+        """
+        Initialize the tracker
+
+        Args:
+            csv_path: Daily usage table
+        """
+        self.csv_path = csv_path
+        self._pending: Dict[Tuple[str, int, str], Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, user_id: int, upload_type: str, usage: Optional[Dict], day: Optional[str] = None):
+        """
+        Add one fact check's usage to the pending counters
+
+        Args:
+            user_id: User who requested the fact check
+            upload_type: text, image, audio or video
+            usage: Usage dictionary from GeminiService (empty for cached results)
+            day: YYYY-MM-DD (default: today)
+        """
+        key = (day or datetime.now().strftime("%Y-%m-%d"), int(user_id), upload_type)
+
+        with self._lock:
+            counters = self._pending.setdefault(key, dict.fromkeys(COUNT_COLUMNS, 0))
+            counters["fact_checks"] += 1
+            for field in USAGE_FIELDS:
+                counters[field] += (usage or {}).get(field, 0)
+
+    def _pending_frame(self, pending: Dict) -> pd.DataFrame:
+        rows = [
+            {"date": day, "user_id": user_id, "upload_type": upload_type, **counters}
+            for (day, user_id, upload_type), counters in pending.items()
+        ]
+        return pd.DataFrame(rows, columns=KEY_COLUMNS + COUNT_COLUMNS)
+
+    def _read_table(self) -> pd.DataFrame:
+        if not self.csv_path.exists():
+            return pd.DataFrame(columns=KEY_COLUMNS + COUNT_COLUMNS)
+        return Database._read_csv(self.csv_path)
+
+    @staticmethod
+    def _sum_by_key(df: pd.DataFrame) -> pd.DataFrame:
+        if df.empty:
+            return pd.DataFrame(columns=KEY_COLUMNS + COUNT_COLUMNS)
+        df = df.reindex(columns=KEY_COLUMNS + COUNT_COLUMNS)
+        # Rows written before a usage field existed have no value for it
+        df[COUNT_COLUMNS] = df[COUNT_COLUMNS].fillna(0).astype(int)
+        df = df.astype({"date": str, "user_id": int, "upload_type": str})
+        return df.groupby(KEY_COLUMNS, as_index=False)[COUNT_COLUMNS].sum()
+
+    def flush(self) -> int:
+        """
+        Merge pending counters into the daily table
+
+        Returns:
+            Number of (day, user, upload type) rows updated
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return 0
+
+        try:
+            with Database.write_fence():
+                merged = self._sum_by_key(pd.concat([self._read_table(), self._pending_frame(pending)], ignore_index=True))
+                Database._write_csv(merged, self.csv_path)
+        except Exception:
+            # Put the counters back so the next flush retries them
+            with self._lock:
+                for key, counters in pending.items():
+                    target = self._pending.setdefault(key, dict.fromkeys(COUNT_COLUMNS, 0))
+                    for column in COUNT_COLUMNS:
+                        target[column] += counters[column]
+            raise
+
+        return len(pending)
+
+    async def run_periodic_flush(self, interval_seconds: float):
+        """Flush on an interval until cancelled (started on application startup)"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                print(f"Warning: Could not flush usage counters: {e}")
+
+    def report(self, days: int = 7, user_id: Optional[int] = None) -> Dict:
+        """
+        Usage over the last `days` days, including counters not flushed yet
+
+        Args:
+            days: Number of days to include (today counts as one)
+            user_id: Restrict to one user
+
+        Returns:
+            Totals, breakdowns by upload type and by user (most expensive first),
+            and the per-user daily rows
+        """
+        with self._lock:
+            pending = dict(self._pending)
+
+        df = self._sum_by_key(pd.concat([self._read_table(), self._pending_frame(pending)], ignore_index=True))
+
+        since = (datetime.now() - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+        df = df[df["date"] >= since]
+        if user_id is not None:
+            df = df[df["user_id"] == user_id]
+
+        def grouped(column: str):
+            return (
+                df.groupby(column, as_index=False)[COUNT_COLUMNS].sum()
+                .sort_values("total_tokens", ascending=False)
+                .to_dict("records")
+            )
+
+        return {
+            "since": since,
+            "totals": {column: int(df[column].sum()) for column in COUNT_COLUMNS},
+            "by_upload_type": grouped("upload_type"),
+            "by_user": grouped("user_id"),
+            "daily": df.sort_values(["date", "total_tokens"], ascending=[False, False]).to_dict("records")
+        }
+
+# Shared tracker instance
+usage_tracker = UsageTracker(settings.USAGE_CSV)
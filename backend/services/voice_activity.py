@@ -0,0 +1,230 @@
+import contextlib
+import wave
+from typing import List, Tuple
+import numpy as np
+from config.settings import settings
+
+# Audio analysed per read; features are kept, samples are not
+_BLOCK_SECONDS = 30
+_INT16_FULL_SCALE = 32768.0
+
+class VoiceActivityDetector:
+    """
+    Energy and zero-crossing voice activity detection for 16-bit PCM audio.
+
+    Audio is cut into short frames. A frame counts as speech when it is
+    loud relative to the recording's noise floor, or a little less loud
+    but with the high zero-crossing rate of unvoiced consonants. Pauses
+    shorter than `min_silence_ms` stay inside a region, blips shorter than
+    `min_speech_ms` are dropped and regions are padded so word edges
+    survive. The speech regions are then packed, in order and without the
+    silence between them, into chunks of at most `max_chunk_seconds`;
+    a region longer than that is cut at its quietest point near the limit.
+    """
+
+    def __init__(
+        self,
+        threshold_db: float,
+        min_silence_ms: float,
+        padding_ms: float,
+        max_chunk_seconds: float,
+        frame_ms: float = 20,
+        min_speech_ms: float = 200,
+        zcr_threshold: float = 0.25,
+        min_level_db: float = -55.0
+    ):
+        """
+        Initialize the detector
+
+        Args:
+            threshold_db: Level above the noise floor at which a frame is speech
+            min_silence_ms: Shorter pauses do not split a speech region
+            padding_ms: Audio kept on each side of a speech region
+            max_chunk_seconds: Longest chunk of packed speech
+            frame_ms: Analysis frame length
+            min_speech_ms: Shorter bursts are treated as noise
+            zcr_threshold: Zero-crossing rate (crossings per sample) of unvoiced speech
+            min_level_db: Frames quieter than this (dBFS) are never speech
+        """
+        self.threshold_db = threshold_db
+        self.min_silence_ms = min_silence_ms
+        self.padding_ms = padding_ms
+        self.max_chunk_seconds = max_chunk_seconds
+        self.frame_ms = frame_ms
+        self.min_speech_ms = min_speech_ms
+        self.zcr_threshold = zcr_threshold
+        self.min_level_db = min_level_db
+
+    @staticmethod
+    def frame_features(samples: np.ndarray, frame_length: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Level and zero-crossing rate of consecutive frames
+
+        Args:
+            samples: Mono samples scaled to [-1, 1]; a trailing partial frame is ignored
+            frame_length: Samples per frame
+
+        Returns:
+            Tuple of (level in dBFS, zero crossings per sample) per frame
+        """
+        frames = samples[:len(samples) // frame_length * frame_length].reshape(-1, frame_length)
+        rms = np.sqrt(np.mean(np.square(frames), axis=1))
+        level_db = 20 * np.log10(rms + 1e-10)
+        zcr = np.count_nonzero(np.diff(np.signbit(frames), axis=1), axis=1) / (frame_length - 1)
+        return level_db, zcr
+
+    def speech_mask(self, level_db: np.ndarray, zcr: np.ndarray) -> np.ndarray:
+        """
+        Classify frames as speech or not, before smoothing
+
+        Args:
+            level_db: Frame levels from frame_features
+            zcr: Frame zero-crossing rates from frame_features
+
+        Returns:
+            Boolean array, True for speech frames
+        """
+        noise_floor = np.percentile(level_db, 10)
+        loud = np.percentile(level_db, 95)
+        # Relative to the floor, but never above what the loud parts reach (audio that is all speech)
+        high = max(min(noise_floor + self.threshold_db, loud - self.threshold_db), self.min_level_db)
+        low = high - self.threshold_db / 2
+        return (level_db > high) | ((level_db > low) & (zcr > self.zcr_threshold))
+
+    @staticmethod
+    def _runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Start and end (exclusive) indices of the True runs of a boolean array"""
+        edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+        return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+    @staticmethod
+    def _close_gaps(starts: np.ndarray, ends: np.ndarray, min_gap: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Merge runs separated by fewer than `min_gap` frames"""
+        if len(starts) < 2:
+            return starts, ends
+        keep = (starts[1:] - ends[:-1]) >= min_gap
+        return np.concatenate((starts[:1], starts[1:][keep])), np.concatenate((ends[:-1][keep], ends[-1:]))
+
+    def speech_regions(self, level_db: np.ndarray, zcr: np.ndarray) -> List[Tuple[int, int]]:
+        """
+        Padded speech regions in frames
+
+        Args:
+            level_db: Frame levels from frame_features
+            zcr: Frame zero-crossing rates from frame_features
+
+        Returns:
+            (start, end) frame index pairs, end exclusive, in order and not overlapping
+        """
+        if not len(level_db):
+            return []
+
+        starts, ends = self._runs(self.speech_mask(level_db, zcr))
+        starts, ends = self._close_gaps(starts, ends, max(1, round(self.min_silence_ms / self.frame_ms)))
+        long_enough = (ends - starts) >= round(self.min_speech_ms / self.frame_ms)
+        starts, ends = starts[long_enough], ends[long_enough]
+
+        padding = round(self.padding_ms / self.frame_ms)
+        starts = np.maximum(starts - padding, 0)
+        ends = np.minimum(ends + padding, len(level_db))
+        starts, ends = self._close_gaps(starts, ends, 1)
+        return list(zip(starts.tolist(), ends.tolist()))
+
+    def _split_long(self, regions: List[Tuple[int, int]], level_db: np.ndarray, max_frames: int) -> List[Tuple[int, int]]:
+        """Cut regions over `max_frames` at the quietest stretch of their last 40% before the limit"""
+        smoothing = np.ones(5) / 5
+        pieces = []
+        for start, end in regions:
+            while end - start > max_frames:
+                earliest = start + int(max_frames * 0.6)
+                window = np.convolve(level_db[earliest:start + max_frames], smoothing, mode="same")
+                cut = earliest + int(np.argmin(window))
+                pieces.append((start, cut))
+                start = cut
+            pieces.append((start, end))
+        return pieces
+
+    def pack(self, regions: List[Tuple[int, int]], level_db: np.ndarray) -> List[List[Tuple[int, int]]]:
+        """
+        Group speech regions into chunks of at most max_chunk_seconds of audio
+
+        Args:
+            regions: Output of speech_regions
+            level_db: Frame levels, used to find where to cut long regions
+
+        Returns:
+            Chunks, each a list of (start, end) frame ranges sent together
+        """
+        max_frames = int(self.max_chunk_seconds * 1000 / self.frame_ms)
+        chunks = []
+        current, current_frames = [], 0
+        for start, end in self._split_long(regions, level_db, max_frames):
+            if current and current_frames + (end - start) > max_frames:
+                chunks.append(current)
+                current, current_frames = [], 0
+            current.append((start, end))
+            current_frames += end - start
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def analyze(self, audio_file_path: str) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Frame features of a 16-bit WAV file, read a block at a time
+
+        Args:
+            audio_file_path: Path to the WAV file
+
+        Returns:
+            Tuple of (level in dBFS, zero-crossing rate, samples per frame)
+        """
+        with contextlib.closing(wave.open(audio_file_path, 'rb')) as wav:
+            if wav.getsampwidth() != 2:
+                raise ValueError("Voice activity detection needs 16-bit PCM audio")
+            channels = wav.getnchannels()
+            frame_length = max(2, int(wav.getframerate() * self.frame_ms / 1000))
+            block_frames = frame_length * max(1, int(_BLOCK_SECONDS * 1000 / self.frame_ms))
+
+            levels, rates = [], []
+            while True:
+                block = wav.readframes(block_frames)
+                if not block:
+                    break
+                samples = np.frombuffer(block, dtype="<i2").reshape(-1, channels).mean(axis=1) / _INT16_FULL_SCALE
+                level_db, zcr = self.frame_features(samples, frame_length)
+                levels.append(level_db)
+                rates.append(zcr)
+
+        if not levels:
+            return np.empty(0), np.empty(0), frame_length
+        return np.concatenate(levels), np.concatenate(rates), frame_length
+
+    def chunk_ranges(self, audio_file_path: str) -> List[List[Tuple[int, int]]]:
+        """
+        Speech of a WAV file as chunks to transcribe
+
+        Args:
+            audio_file_path: Path to a 16-bit PCM WAV file
+
+        Returns:
+            Chunks, each a list of (start, end) audio frame ranges (end exclusive) whose
+            audio is joined and sent as one request; empty when no speech was found
+        """
+        level_db, zcr, frame_length = self.analyze(audio_file_path)
+        with contextlib.closing(wave.open(audio_file_path, 'rb')) as wav:
+            total_frames = wav.getnframes()
+
+        # A region reaching the last analysed frame also takes the trailing partial frame
+        analysed = len(level_db)
+        return [
+            [(start * frame_length, total_frames if end == analysed else end * frame_length) for start, end in chunk]
+            for chunk in self.pack(self.speech_regions(level_db, zcr), level_db)
+        ]
+
+# Shared detector for long audio transcription
+voice_activity_detector = VoiceActivityDetector(
+    threshold_db=settings.SPEECH_VAD_THRESHOLD_DB,
+    min_silence_ms=settings.SPEECH_VAD_MIN_SILENCE_MS,
+    padding_ms=settings.SPEECH_VAD_PADDING_MS,
+    max_chunk_seconds=settings.SPEECH_VAD_MAX_CHUNK_SECONDS
+)
@@ -0,0 +1,18 @@
+from utils.helpers import Helpers
+
+def test_trivial_differences_normalize_equal():
+    assert Helpers.normalize_claim_text("Hello,   World!!") == Helpers.normalize_claim_text("hello world")
+    assert Helpers.normalize_claim_text("In 2020, the GDP rose.") == Helpers.normalize_claim_text("in 2020 the gdp rose")
+
+def test_numeric_symbols_do_not_collide():
+    pairs = [
+        ("It is -40 degrees", "It is 40 degrees"),
+        ("It is −40 degrees", "It is 40 degrees"),
+        ("2+2=5", "2 2 5"),
+        ("Inflation was 3.5 percent", "Inflation was 35 percent"),
+        ("Unemployment fell to 5%", "Unemployment fell to 5"),
+        ("It costs $5", "It costs 5"),
+        ("x > 3", "x 3"),
+    ]
+    for first, second in pairs:
+        assert Helpers.normalize_claim_text(first) != Helpers.normalize_claim_text(second), (first, second)
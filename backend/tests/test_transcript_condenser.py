@@ -0,0 +1,26 @@
+from services.transcript_condenser import TranscriptCondenser
+
+def test_hesitations_are_dropped():
+    assert TranscriptCondenser.strip_filler("Um, the vaccine uh was approved in 2021.") == "The vaccine was approved in 2021."
+    assert TranscriptCondenser.strip_filler("Mm the river is long. Hmm.") == "The river is long."
+
+def test_units_after_numbers_are_kept():
+    assert TranscriptCondenser.strip_filler("The tumour grew 5 mm in a year.") == "The tumour grew 5 mm in a year."
+    assert TranscriptCondenser.strip_filler("The particles are 3 um wide.") == "The particles are 3 um wide."
+
+def test_stutters_are_collapsed():
+    assert TranscriptCondenser.strip_filler("The the study found a a link.") == "The study found a link."
+    assert TranscriptCondenser.strip_filler("I, I, I think prices rose.") == "I think prices rose."
+
+def test_grammatical_repeats_are_kept():
+    assert TranscriptCondenser.strip_filler("He said that that report was wrong.") == "He said that that report was wrong."
+    assert TranscriptCondenser.strip_filler("She had had two doses already.") == "She had had two doses already."
+
+def test_repeated_numbers_are_kept():
+    assert TranscriptCondenser.strip_filler("The score was 1 1 at half time.") == "The score was 1 1 at half time."
+
+def test_fillers_between_commas_take_both_commas():
+    assert TranscriptCondenser.strip_filler("The moon is, um, made of cheese.") == "The moon is made of cheese."
+    assert TranscriptCondenser.strip_filler("The moon is, like, you know, made of cheese.") == "The moon is made of cheese."
+    assert TranscriptCondenser.strip_filler("I went home, you know, and then slept.") == "I went home, and then slept."
+    assert TranscriptCondenser.strip_filler("Okay, so, the vaccine, uh, was approved in 2021.") == "The vaccine was approved in 2021."
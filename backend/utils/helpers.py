@@ -1,6 +1,14 @@
 from datetime import datetime
 from typing import Any, Dict
 import json
+import math
+import re
+import unicodedata
+
+# Symbols that change a number's meaning ("-40", "2+2=5", "3.5", "1,000") are kept next to digits
+_NUMERIC_OPERATORS = set("+-±=<>×÷*/^")
+_NUMERIC_SEPARATORS = set(".,")
+_MINUS_SIGNS = str.maketrans({"\u2212": "-", "\u2013": "-", "\u2012": "-"})
 
 class Helpers:
     """General helper functions"""
@@ -104,6 +112,59 @@ class Helpers:
             return text
         return text[:max_length - len(suffix)] + suffix
 
+    @staticmethod
+    def normalize_claim_text(text: str) -> str:
+        """
+        Normalize claim text so trivially different submissions compare equal
+        (Unicode NFKC, case folding, punctuation removal, collapsed whitespace)
+
+        Currency symbols, percent signs, and signs, operators and decimal or
+        thousands separators next to digits are kept, so "-40" and "40" or
+        "2+2=5" and "2 2 5" stay different.
+
+        Args:
+            text: Claim text
+
+        Returns:
+            Normalized text
+        """
+        text = unicodedata.normalize("NFKC", text).casefold().translate(_MINUS_SIGNS)
+        kept = []
+        for index, char in enumerate(text):
+            category = unicodedata.category(char)
+            if category[0] not in ("P", "S") or category == "Sc" or char == "%":
+                kept.append(char)
+                continue
+            if char in _NUMERIC_OPERATORS:
+                # Operators may be spaced out ("x > 3")
+                previous, following = index - 1, index + 1
+                while previous >= 0 and text[previous].isspace():
+                    previous -= 1
+                while following < len(text) and text[following].isspace():
+                    following += 1
+            else:
+                previous, following = index - 1, index + 1
+            before = previous >= 0 and text[previous].isdigit()
+            after = following < len(text) and text[following].isdigit()
+            if (char in _NUMERIC_OPERATORS and (before or after)) or (char in _NUMERIC_SEPARATORS and before and after):
+                kept.append(char)
+            else:
+                kept.append(" ")
+        return re.sub(r"\s+", " ", "".join(kept)).strip()
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """
+        Rough Gemini token count for text (about four characters per token)
+
+        Args:
+            text: Text to measure
+
+        Returns:
+            Estimated token count
+        """
+        return math.ceil(len(text) / 4)
+
     @staticmethod
     def remove_duplicates(items: list) -> list:
         """
@@ -16,12 +16,25 @@ export interface FactCheck {
   admin_comments?: Comment[];
 }
 
+export interface ClaimResult {
+  claim: string;
+  verdict: string;
+  response?: string;
+  citations: Citation[];
+  cached?: boolean;
+  error?: string;
+}
+
 export interface FactCheckResult {
   fact_check_id: number;
   extracted_text?: string;
   gemini_response: string;
   citations: Citation[];
   timestamp: string;
+  cached?: boolean;
+  similar_to?: number | null;
+  similarity?: number | null;
+  claims?: ClaimResult[] | null;
 }
 
 export interface Comment {